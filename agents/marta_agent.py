@@ -567,7 +567,8 @@ class SmartAgent:
             self.last_scan_time = time.time()
 
             if response.status_code == 429:
-                wait_time = float(response.headers.get('Retry-After', 0.6))
+                # The body has the exact wait; the Retry-After header is rounded up to whole seconds.
+                wait_time = float(response.json().get('retry_after', response.headers.get('Retry-After', 0.6)))
                 time.sleep(wait_time)
                 return self.get_scan()
             elif response.status_code == 200:
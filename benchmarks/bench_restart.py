@@ -0,0 +1,96 @@
+"""
+Benchmark: latency of GameWorld.restart_game() as the number of players grows.
+
+Each repetition starts a match, lets every player fire a few projectiles and then
+times the restart. For comparison, the "rebuild" column times the way matches were
+reset before the in-place reset: every player and obstacle removed and created again.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_restart [--players 1 10 25 50 100] [--repeat 5]
+"""
+import argparse
+import contextlib
+import os
+import statistics
+import time
+
+from src.core.clock import SimulationClock
+from src.core.event_log import event_log
+from src.core.game_world import GameWorld
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
+
+
+def start_match(world, clock, shots_per_player=3):
+    """
+    Readies all players, runs the countdown and fires some projectiles.
+    """
+    for player_id in list(world.players):
+        world.player_ready(player_id)
+    while not world.game_started:
+        clock.advance(PHYSICS_DT)
+        world.update(PHYSICS_DT)
+    # Lift the spawn protection, so the players can shoot right away.
+    for player in world.players.values():
+        player.spawn_protection_until = -1
+    for _ in range(shots_per_player):
+        for player_id in list(world.players):
+            world.shoot(player_id)
+        clock.advance(PHYSICS_DT)
+        world.update(PHYSICS_DT)
+
+
+def rebuild_reset(world):
+    """
+    The reset before the in-place path: remove and re-create every player and obstacle.
+    """
+    for obj in list(world.objects):
+        if hasattr(obj, "remove_from_world"):
+            obj.remove_from_world()
+        else:
+            world.despawn(obj)
+    old_players = list(world.players.items())
+    world.players.clear()
+    world.game_started = False
+    world.waiting_for_players = True
+    world.countdown_active = False
+    world.countdown_seconds_remaining = 0.0
+    for player_id, old_player in old_players:
+        old_player.remove_from_world()
+        world.add_player(given_player_id=player_id, agent_name=getattr(old_player, "agent_name", None))
+        world.players[player_id].color = old_player.color
+    world.initialize_world_objects()
+
+
+def measure(player_count, repeat, reset):
+    """
+    Returns the restart latencies (in ms) for one player count.
+    """
+    clock = SimulationClock()
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, clock=clock, write_stats=False, seed=1)
+    world.add_players([f"bench{i}" for i in range(player_count)])
+    latencies = []
+    for _ in range(repeat):
+        start_match(world, clock)
+        start = time.perf_counter()
+        reset(world)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure restart_game() latency against the player count.")
+    parser.add_argument("--players", type=int, nargs="+", default=[1, 10, 25, 50, 100])
+    parser.add_argument("--repeat", type=int, default=5, help="Restarts per player count")
+    args = parser.parse_args()
+
+    print(f"{'players':>8} {'in-place ms':>12} {'per player':>11} {'rebuild ms':>11}")
+    for player_count in args.players:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), event_log.muted():
+            in_place = measure(player_count, args.repeat, lambda world: world.restart_game())
+            rebuild = measure(player_count, args.repeat, rebuild_reset)
+        median = statistics.median(in_place)
+        print(f"{player_count:>8} {median:>12.3f} {median / player_count:>11.4f} {statistics.median(rebuild):>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
+import sys
 import threading
 import time
 import uvicorn
-from src.settings import API_HOST, API_PORT
+from src.settings import API_HOST, API_PORT, HEADLESS
 
 # --- Function to run the API server ---
 def run_api_server():
@@ -19,6 +20,13 @@ def run_api_server():
 
 # --- Main execution block ---
 if __name__ == "__main__":
+    # Headless mode: run only the API server in the main thread. The game world
+    # creates no surfaces and pygame is never imported.
+    if HEADLESS or "--headless" in sys.argv:
+        print("Starting API server (headless)...")
+        run_api_server()
+        sys.exit(0)
+
     # 1. Start the API server in a separate background thread.
     #    Setting 'daemon=True' ensures the thread exits when the main program exits.
     print("Starting API server thread...")
@@ -1,11 +1,14 @@
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Body, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, APIRouter, WebSocket, WebSocketDisconnect, Body, HTTPException, Depends
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
-import time
-from src.core.game_world import game_world_instance
+import contextlib
+import json
+import math
+from src.core.arena import arena_registry, Arena, DEFAULT_ARENA_ID, is_valid_arena_id
+from .tick_notifier import TickNotifier, current_tick
 from fastapi import Request
-from ..settings import PHYSICS_DT
+from ..settings import PHYSICS_DT, COMMAND_TIMEOUT, WS_PUSH_RATE, MAX_BATCH_ACTIONS, LONG_POLL_MAX_TIMEOUT
 
 app = FastAPI()
 
@@ -18,46 +21,78 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# --- Cooldown Management ---
-# Simple in-memory storage for cooldowns.  Consider Redis for production.
-# Structure: { "player_id": { "endpoint_name": last_call_timestamp }}
-player_cooldowns = {}
+# --- Rate Limiting ---
+# Every arena has its own token-bucket limiter (Arena.rate_limiter, see
+# src/core/rate_limiter.py), configured by RATE_LIMITS in src/settings.py.
 
-# Cooldown durations (in seconds)
-COOLDOWN_SCAN_ENVIRONMENT = 0.5
-COOLDOWN_PLAYER_STATE = 0.5
-COOLDOWN_GAME_STATE = 0.5
-COOLDOWN_SHOOT = 0.1
-
-def check_cooldown(player_id: str, endpoint_name: str, cooldown_duration: float):
+def rate_limited(arena: Arena, player_id: str, endpoint: str):
     """
-    Checks and updates the cooldown for a player and endpoint.
+    Takes a rate-limit token for a player's request.
 
     Args:
+        arena: The arena of the player.
         player_id: The ID of the player.
-        endpoint_name: The name of the endpoint being accessed.
-        cooldown_duration: The cooldown duration in seconds.
+        endpoint: The endpoint class (a key of settings.RATE_LIMITS).
 
     Returns:
-        True if the cooldown has passed.
+        None if the request may proceed, otherwise a 429 (Too Many Requests) response.
+        Its Retry-After header holds the wait rounded up to whole seconds (RFC 9110
+        delay-seconds); the exact wait is the "retry_after" field of the body.
+    """
+    retry_after = arena.rate_limiter.acquire(player_id, endpoint)
+    if not retry_after:
+        return None
+    retry_after = math.ceil(retry_after * 1000) / 1000
+    return JSONResponse(
+        status_code=429,
+        content={"detail": f"Rate limit: {endpoint}. Retry in {retry_after:.3f} seconds.", "retry_after": retry_after},
+        headers={"Retry-After": str(math.ceil(retry_after))},
+    )
+
+def get_arena(arena_id: str = DEFAULT_ARENA_ID) -> Arena:
+    """
+    Resolves the arena addressed by a request.
+
+    Routes under /arena/{arena_id}/... take the ID from the path; the unprefixed
+    routes fall back to the default arena.
 
     Raises:
-        HTTPException: (429 Too Many Requests) if the cooldown is still active.
+        HTTPException: (404) if the arena does not exist.
+    """
+    arena = arena_registry.get(arena_id)
+    if arena is None:
+        raise HTTPException(status_code=404, detail=f"Arena {arena_id} not found")
+    return arena
+
+async def run_in_world(world, func, *args):
     """
-    now = time.time()
-    if player_id not in player_cooldowns:
-        player_cooldowns[player_id] = {}
+    Runs a call on the world's physics thread and waits for its result.
 
-    last_call = player_cooldowns[player_id].get(endpoint_name, 0)
+    The physics thread owns all pymunk state; handlers that change the world
+    submit commands, which are applied at the next tick boundary.
 
-    if now - last_call < cooldown_duration:
-        remaining_cooldown = cooldown_duration - (now - last_call)
-        raise HTTPException(
-            status_code=429,  # Too Many Requests
-            detail=f"Cooldown active: {endpoint_name}. Wait {remaining_cooldown:.2f} seconds.",
-        )
-    player_cooldowns[player_id][endpoint_name] = now
-    return True  # Cooldown passed
+    Args:
+        world: The GameWorld to act on.
+        func: The world method to call.
+        *args: Arguments for func.
+
+    Returns:
+        The return value of func.
+
+    Raises:
+        HTTPException: (503) if the physics thread does not run the command within
+        COMMAND_TIMEOUT seconds.
+    """
+    future = asyncio.wrap_future(world.submit(func, *args))
+    try:
+        # Shielded: a command that timed out may still run, it must not be cancelled under the physics thread.
+        return await asyncio.wait_for(asyncio.shield(future), COMMAND_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=503, detail="Physics loop not responding")
+
+# Routes that act on a single arena. The router is mounted twice (see bottom of file):
+# without prefix for the default arena and under /arena/{arena_id}.
+router = APIRouter()
 
 @app.on_event("startup")
 async def startup_event():
@@ -65,10 +100,10 @@ async def startup_event():
     Startup event handler that starts the physics engine.
 
     This event runs when the FastAPI application starts. It initializes and starts the
-    physics loop (using PHYSICS_DT as the delta time) in the game world.
+    physics loop (using PHYSICS_DT as the delta time) of every registered arena.
     """
     print("Startup event: Starting physics engine")
-    game_world_instance.start_physics_engine(dt=PHYSICS_DT)
+    arena_registry.start_all(dt=PHYSICS_DT)
     print("Startup event: Physics engine successfully started")
 
 @app.get("/")
@@ -80,8 +115,58 @@ def read_root():
     """
     return {"message": "Welcome to the UPC Game API with WebSockets!"}
 
-@app.get("/player/{player_id}/scan")
-async def get_scan_environment(player_id: str):
+@app.get("/arenas")
+async def list_arenas():
+    """
+    Lists all arenas hosted by this server.
+
+    Returns:
+        A list of arena summaries.
+    """
+    return {"arenas": [arena.to_dict() for arena in arena_registry.arenas.values()]}
+
+@app.post("/arenas")
+async def create_arena(request: Request):
+    """
+    Creates a new arena with its own game world and physics loop.
+
+    The request body may contain {"arena_id": "..."}; otherwise an ID is generated.
+
+    Returns:
+        The new arena's ID.
+
+    Raises:
+        HTTPException: (400) if the requested ID is not a non-empty string, (409) if
+        the ID is taken or the arena limit is reached.
+    """
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    requested_id = data.get("arena_id") if isinstance(data, dict) else None
+    if requested_id is not None and not is_valid_arena_id(requested_id):
+        raise HTTPException(status_code=400, detail="arena_id must be a non-empty string")
+    arena = arena_registry.create(arena_id=requested_id)
+    if arena is None:
+        raise HTTPException(status_code=409, detail="Arena ID already taken or arena limit reached")
+    return {"arena_id": arena.arena_id}
+
+@app.delete("/arenas/{arena_id}")
+async def delete_arena(arena_id: str):
+    """
+    Stops and removes an arena. The default arena cannot be removed.
+
+    Raises:
+        HTTPException: (400) for the default arena, (404) if the arena does not exist.
+    """
+    if arena_id == DEFAULT_ARENA_ID:
+        raise HTTPException(status_code=400, detail="The default arena cannot be removed")
+    if not arena_registry.remove(arena_id):
+        raise HTTPException(status_code=404, detail=f"Arena {arena_id} not found")
+    return {"message": f"Arena {arena_id} removed"}
+
+@router.get("/player/{player_id}/scan")
+async def get_scan_environment(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Retrieves the game state relative to a specific player.
 
@@ -89,19 +174,18 @@ async def get_scan_environment(player_id: str):
         player_id: The ID of the player.
 
     Returns:
-        The scan data.
-
-    Raises:
-        HTTPException: (429) if the cooldown is active.
+        The scan data, or a 429 response (with Retry-After) if the rate limit is exceeded.
     """
-    check_cooldown(player_id, "scan_environment", COOLDOWN_SCAN_ENVIRONMENT)
-    scan_data = game_world_instance.scan_environment(player_id)
+    limited = rate_limited(arena, player_id, "scan_environment")
+    if limited is not None:
+        return limited
+    scan_data = arena.world.scan_environment(player_id)
     if scan_data is None:
         pass
     return scan_data
 
-@app.get("/player/{player_id}/state")
-async def get_player_own_state(player_id: str):
+@router.get("/player/{player_id}/state")
+async def get_player_own_state(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Retrieves the state of a specific player.
 
@@ -109,13 +193,15 @@ async def get_player_own_state(player_id: str):
         player_id: The ID of the player.
 
     Returns:
-        The player's state data.
+        The player's state data, or a 429 response (with Retry-After) if the rate limit is exceeded.
 
     Raises:
-        HTTPException: (429) if the cooldown is active, (404) if player not found.
+        HTTPException: (404) if player not found.
     """
-    check_cooldown(player_id, "state", COOLDOWN_PLAYER_STATE)
-    state_data = game_world_instance.player_state(player_id)
+    limited = rate_limited(arena, player_id, "state")
+    if limited is not None:
+        return limited
+    state_data = arena.world.player_state(player_id)
     if state_data is None:
         raise HTTPException(
             status_code=404,
@@ -123,8 +209,8 @@ async def get_player_own_state(player_id: str):
         )
     return state_data
 
-@app.get("/player/{player_id}/game-state")
-async def get_overall_game_state(player_id: str):
+@router.get("/player/{player_id}/game-state")
+async def get_overall_game_state(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Retrieves the overall game state.
 
@@ -132,13 +218,15 @@ async def get_overall_game_state(player_id: str):
         player_id: The ID of the player.  (Currently not used, but kept for consistency).
 
     Returns:
-        The overall game state.
+        The overall game state, or a 429 response (with Retry-After) if the rate limit is exceeded.
 
     Raises:
-        HTTPException: (429) if the cooldown is active, (404) if game state cannot be retrieved.
+        HTTPException: (404) if game state cannot be retrieved.
     """
-    check_cooldown(player_id, "game_state", COOLDOWN_GAME_STATE)
-    state_data = game_world_instance.game_state(player_id)
+    limited = rate_limited(arena, player_id, "game_state")
+    if limited is not None:
+        return limited
+    state_data = arena.world.game_state(player_id)
     if state_data is None:
         raise HTTPException(
             status_code=404,
@@ -146,17 +234,108 @@ async def get_overall_game_state(player_id: str):
         )
     return state_data
 
-@app.get("/game_status")
-async def game_status():
+@router.get("/player/{player_id}/observation")
+async def get_observation(player_id: str, request: Request, arena: Arena = Depends(get_arena)):
+    """
+    Retrieves scan, own state and game state of a player in one response.
+
+    All parts belong to the same simulation tick, which is returned as "tick" and
+    as the ETag. A request whose If-None-Match matches the current tick gets an
+    empty 304 response without building the observation. The data is taken from
+    the per-tick snapshot, so this endpoint has no cooldown.
+
+    Args:
+        player_id: The ID of the player.
+
+    Returns:
+        {"tick", "scan", "state", "game_state"}, or 304 Not Modified.
+
+    Raises:
+        HTTPException: (404) if the player is not found.
+    """
+    world = arena.world
+    tags = {tag.strip() for tag in request.headers.get("if-none-match", "").split(",")}
+    etag = f'"{current_tick(world)}"'
+    if etag in tags or f"W/{etag}" in tags or "*" in tags:
+        if player_id in world.players:
+            return Response(status_code=304, headers={"ETag": etag})
+    observation = world.observation(player_id)
+    if observation is None:
+        raise HTTPException(status_code=404, detail=f"Player {player_id} not found.")
+    return JSONResponse(observation, headers={"ETag": f'"{observation["tick"]}"'})
+
+@router.get("/tick/wait")
+async def wait_for_tick(after: int = None, timeout: float = 1.0, arena: Arena = Depends(get_arena)):
+    """
+    Long-poll: returns as soon as the simulation has advanced past a tick.
+
+    Agents can call this instead of sleeping for a guessed interval, e.g. pass the
+    tick of their last observation to wake up exactly when the next one exists.
+
+    Args:
+        after: The tick to wait past (query parameter). Defaults to the current tick,
+            i.e. the call returns at the next tick.
+        timeout: Maximum wait in seconds (query parameter), capped at LONG_POLL_MAX_TIMEOUT.
+
+    Returns:
+        {"tick": the current tick, "timed_out": true if the tick was not passed in time}.
+
+    Raises:
+        HTTPException: (400) if `after` is further ahead than the longest wait can reach.
+    """
+    if arena.tick_notifier is None:
+        arena.tick_notifier = TickNotifier(arena.world, asyncio.get_running_loop())
+    current = current_tick(arena.world)
+    if after is None:
+        after = current
+    elif after > current + LONG_POLL_MAX_TIMEOUT / PHYSICS_DT:
+        raise HTTPException(status_code=400, detail=f"Tick {after} cannot be reached within {LONG_POLL_MAX_TIMEOUT} seconds (current tick: {current})")
+    timeout = min(max(timeout, 0.0), LONG_POLL_MAX_TIMEOUT)
+    tick = await arena.tick_notifier.wait_past(after, timeout)
+    if tick is None:
+        return {"tick": current_tick(arena.world), "timed_out": True}
+    return {"tick": tick, "timed_out": False}
+
+@router.get("/game_status")
+async def game_status(arena: Arena = Depends(get_arena)):
     """
     Returns the current game state for agent startup checks.
     """
     # Passe ggf. die Status-Logik an deine GameWorld an!
-    state = "running" if game_world_instance.game_started else "waiting"
+    state = "running" if arena.world.game_started else "waiting"
     return {"state": state}
 
-@app.post("/player/ready/{player_id}")
-async def ready_to_play(player_id: str):
+@router.get("/physics/stats")
+async def physics_stats(arena: Arena = Depends(get_arena)):
+    """
+    Returns tick timing statistics of the arena's physics loop.
+
+    Returns:
+        Target and achieved tick rate, overrun/dropped tick counters,
+        per-tick duration and lateness (in milliseconds) and the projectile
+        pool metrics (hits, misses, idle projectiles).
+
+    Raises:
+        HTTPException: (404) if the physics loop has not been started.
+    """
+    stats = arena.world.physics_stats()
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Physics loop not running")
+    return stats
+
+@router.get("/rate-limits")
+async def rate_limit_stats(arena: Arena = Depends(get_arena)):
+    """
+    Returns the rate limiter metrics of the arena.
+
+    Returns:
+        The configured limits, the number of tracked buckets and the allowed and
+        rejected requests per endpoint class.
+    """
+    return arena.rate_limiter.stats()
+
+@router.post("/player/ready/{player_id}")
+async def ready_to_play(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Sets a player's readiness status.
 
@@ -169,13 +348,13 @@ async def ready_to_play(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.player_ready(player_id)
+    await run_in_world(arena.world, arena.world.player_ready, player_id)
     return {"message": f"Player {player_id} is ready to play"}
 
-@app.post("/connect")
-async def connect_player(request: Request):
+@router.post("/connect")
+async def connect_player(request: Request, arena: Arena = Depends(get_arena)):
     """
     Connects a new player to the game.
     Returns:
@@ -183,11 +362,11 @@ async def connect_player(request: Request):
     """
     data = await request.json()
     agent_name = data.get("agent_name") if isinstance(data, dict) else None
-    player_id = game_world_instance.add_player(agent_name=agent_name)  # <-- agent_name übergeben!
+    player_id = await run_in_world(arena.world, arena.world.add_player, None, agent_name)  # <-- agent_name übergeben!
     return {"player_id": player_id}
 
-@app.post("/disconnect/{player_id}")
-async def disconnect_player(player_id: str):
+@router.post("/disconnect/{player_id}")
+async def disconnect_player(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Disconnects a player from the game.
 
@@ -200,13 +379,14 @@ async def disconnect_player(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.remove_player(player_id)
+    await run_in_world(arena.world, arena.world.remove_player, player_id)
+    arena.rate_limiter.forget(player_id)
     return {"message": f"Player {player_id} disconnected"}
 
-@app.post("/player/{player_id}/thrust_forward")
-async def thrust_forward(player_id: str):
+@router.post("/player/{player_id}/thrust_forward")
+async def thrust_forward(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Applies forward thrust to a player.
 
@@ -219,13 +399,13 @@ async def thrust_forward(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.positive_player_thrust(player_id)
+    arena.world.positive_player_thrust(player_id)  # Buffered, applied once at the next tick
     return {"message": f"Player {player_id} thrust forward"}
 
-@app.post("/player/{player_id}/rotate_right")
-async def rotate_right(player_id: str):
+@router.post("/player/{player_id}/rotate_right")
+async def rotate_right(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Rotates a player to the right.
 
@@ -238,13 +418,13 @@ async def rotate_right(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.right_player_rotation(player_id)
+    arena.world.right_player_rotation(player_id)  # Buffered, applied once at the next tick
     return {"message": f"Player {player_id} rotated right"}
 
-@app.post("/player/{player_id}/shoot")
-async def shoot(player_id: str):
+@router.post("/player/{player_id}/shoot")
+async def shoot(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Initiates a shooting action for a player.
 
@@ -252,19 +432,21 @@ async def shoot(player_id: str):
         player_id: The ID of the player.
 
     Returns:
-        A confirmation message.
+        A confirmation message, or a 429 response (with Retry-After) if the rate limit is exceeded.
 
     Raises:
-        HTTPException: (404) if the player is not found, (429) if cooldown active.
+        HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    check_cooldown(player_id, "shoot", COOLDOWN_SHOOT)
-    game_world_instance.shoot(player_id)
+    limited = rate_limited(arena, player_id, "shoot")
+    if limited is not None:
+        return limited
+    arena.world.submit(arena.world.shoot, player_id)  # Applied at the next tick
     return {"message": f"Player {player_id} shot"}
 
-@app.post("/player/{player_id}/thrust_backward")
-async def thrust_backward(player_id: str):
+@router.post("/player/{player_id}/thrust_backward")
+async def thrust_backward(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Applies backward thrust to a player.
 
@@ -277,13 +459,13 @@ async def thrust_backward(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.negative_player_thrust(player_id)
+    arena.world.negative_player_thrust(player_id)  # Buffered, applied once at the next tick
     return {"message": f"Player {player_id} thrust backward"}
 
-@app.post("/player/{player_id}/rotate_left")
-async def rotate_left(player_id: str):
+@router.post("/player/{player_id}/rotate_left")
+async def rotate_left(player_id: str, arena: Arena = Depends(get_arena)):
     """
     Rotates a player to the left.
 
@@ -296,18 +478,239 @@ async def rotate_left(player_id: str):
     Raises:
         HTTPException: (404) if the player is not found.
     """
-    if player_id not in game_world_instance.players:
+    if player_id not in arena.world.players:
         raise HTTPException(status_code=404, detail="Player not found")
-    game_world_instance.left_player_rotation(player_id)
+    arena.world.left_player_rotation(player_id)  # Buffered, applied once at the next tick
     return {"message": f"Player {player_id} rotated left"}
 
-@app.post("/game/restart")
-async def restart_game_endpoint():
+# Actions accepted by POST /player/{player_id}/actions.
+BATCH_ACTIONS = ("thrust_forward", "thrust_backward", "rotate_left", "rotate_right", "shoot")
+
+@router.post("/player/{player_id}/actions")
+async def batch_actions(player_id: str, request: Request, arena: Arena = Depends(get_arena)):
+    """
+    Applies several actions of a player in one request, at the same tick.
+
+    The body lists the actions in order, each optionally repeated:
+    {"actions": [{"action": "rotate_left", "repeat": 2}, "thrust_forward", "shoot"]}.
+    Movement follows the per-tick caps of the input buffer (repetitions beyond a cap
+    are dropped); every repetition of "shoot" is subject to the shoot cooldown.
+
+    Args:
+        player_id: The ID of the player.
+
+    Returns:
+        {"results": [...]} with one entry per listed action: the action, its repeat
+        count, how many repetitions were applied and (for "shoot") how many hit the
+        cooldown.
+
+    Raises:
+        HTTPException: (404) if the player is not found, (400) if the body is invalid
+        or has more than MAX_BATCH_ACTIONS actions. Nothing is applied in these cases.
+    """
+    if player_id not in arena.world.players:
+        raise HTTPException(status_code=404, detail="Player not found")
+    try:
+        data = await request.json()
+    except ValueError:
+        data = None
+    items = data.get("actions") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail='Expected {"actions": [...]}')
+    batch = []
+    for item in items:
+        if isinstance(item, str):
+            item = {"action": item}
+        action = item.get("action") if isinstance(item, dict) else None
+        repeat = item.get("repeat", 1) if isinstance(item, dict) else None
+        if action not in BATCH_ACTIONS or type(repeat) is not int or repeat < 1:
+            raise HTTPException(status_code=400, detail=f"Invalid action: {item}")
+        batch.append((action, repeat))
+    if sum(repeat for _, repeat in batch) > MAX_BATCH_ACTIONS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_ACTIONS} actions per request")
+
+    cooldowns = []
+    for action, repeat in batch:
+        blocked = 0
+        if action == "shoot":
+            for _ in range(repeat):
+                if arena.rate_limiter.acquire(player_id, "shoot"):
+                    blocked += 1
+        cooldowns.append(blocked)
+    accepted = [(action, repeat - blocked) for (action, repeat), blocked in zip(batch, cooldowns)]
+    shots = sum(count for action, count in accepted if action == "shoot")
+    try:
+        applied = await run_in_world(arena.world, arena.world.apply_actions, player_id, accepted)
+    except Exception:
+        arena.rate_limiter.refund(player_id, "shoot", shots)
+        raise
+    # Shots the world did not fire (player died, match ended) do not use up the cooldown.
+    fired = sum(count for (action, _), count in zip(accepted, applied) if action == "shoot")
+    arena.rate_limiter.refund(player_id, "shoot", shots - fired)
+
+    results = []
+    for (action, repeat), blocked, count in zip(batch, cooldowns, applied):
+        result = {"action": action, "repeat": repeat, "applied": count}
+        if action == "shoot":
+            result["cooldown"] = blocked
+        results.append(result)
+    return {"results": results}
+
+@router.post("/game/restart")
+async def restart_game_endpoint(arena: Arena = Depends(get_arena)):
     """
     Resets the game to its initial state.
     All players will be disconnected, and the game world will be reset.
     """
-    game_world_instance.restart_game()
-    # Optionally, clear cooldowns if they should reset with the game
-    # player_cooldowns.clear()
-    return {"message": "Game restart initiated. World has been reset."}
\ No newline at end of file
+    await run_in_world(arena.world, arena.world.restart_game)
+    # Rate limits are not reset with the game; idle buckets expire on their own.
+    return {"message": "Game restart initiated. World has been reset."}
+
+# --- WebSocket Observation Stream ---
+
+def lifecycle_events(previous, game_state, player_state):
+    """
+    Derives the lifecycle events of a player from two consecutive observations.
+
+    Args:
+        previous: The (game_state, player_state) pair sent last, or None.
+        game_state: The current game state of the player.
+        player_state: The current state of the player.
+
+    Returns:
+        A list of event dictionaries, e.g. {"event": "damage", "amount": 1, "health": 4}.
+    """
+    if previous is None:
+        return []
+    old_game, old_player = previous
+    events = []
+    if game_state["countdown_active"] and not old_game["countdown_active"]:
+        events.append({"event": "countdown_started"})
+    if game_state["game_started"] and not old_game["game_started"]:
+        events.append({"event": "game_started"})
+    if old_game["game_started"] and not game_state["game_started"]:
+        events.append({"event": "game_ended"})
+    health, old_health = player_state["health"], old_player["health"]
+    if health < old_health:
+        events.append({"event": "damage", "amount": old_health - health, "health": health})
+        if health <= 0:
+            events.append({"event": "destroyed"})
+    elif health > old_health:
+        events.append({"event": "respawned", "health": health})
+    return events
+
+def apply_action(arena: Arena, player_id: str, action: str):
+    """
+    Applies an action received on the WebSocket, like the corresponding HTTP route.
+
+    Args:
+        arena: The arena of the player.
+        player_id: The ID of the player.
+        action: One of "thrust_forward", "thrust_backward", "rotate_left",
+            "rotate_right", "shoot" or "ready".
+
+    Raises:
+        HTTPException: (400) for an unknown action, (429) if the shoot cooldown is active.
+    """
+    world = arena.world
+    movements = {
+        "thrust_forward": world.positive_player_thrust,
+        "thrust_backward": world.negative_player_thrust,
+        "rotate_left": world.left_player_rotation,
+        "rotate_right": world.right_player_rotation,
+    }
+    if action in movements:
+        movements[action](player_id)  # Buffered, applied once at the next tick
+    elif action == "shoot":
+        retry_after = arena.rate_limiter.acquire(player_id, "shoot")
+        if retry_after:
+            raise HTTPException(status_code=429, detail=f"Rate limit: shoot. Retry in {retry_after:.3f} seconds.")
+        world.submit(world.shoot, player_id)
+    elif action == "ready":
+        world.submit(world.player_ready, player_id)
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+
+async def receive_actions(websocket: WebSocket, arena: Arena, player_id: str, outbox: asyncio.Queue):
+    """
+    Applies the action messages of a client until it disconnects.
+
+    Messages are JSON objects like {"action": "shoot"}. Rejected actions are answered
+    with {"type": "error", "action": ..., "status": ..., "detail": ...} via the outbox.
+    """
+    while True:
+        text = await websocket.receive_text()
+        try:
+            message = json.loads(text)
+            action = message["action"]
+        except (ValueError, TypeError, KeyError):
+            action = None
+        if not isinstance(action, str):
+            outbox.put_nowait({"type": "error", "action": None, "status": 400,
+                               "detail": 'Expected a JSON object like {"action": "shoot"}'})
+            continue
+        try:
+            apply_action(arena, player_id, action)
+        except HTTPException as e:
+            outbox.put_nowait({"type": "error", "action": action, "status": e.status_code, "detail": e.detail})
+
+@router.websocket("/ws/player/{player_id}")
+async def player_stream(websocket: WebSocket, player_id: str, arena_id: str = DEFAULT_ARENA_ID, rate: float = WS_PUSH_RATE):
+    """
+    Streams a player's observations and accepts its actions over one connection.
+
+    At `rate` pushes per second (at most once per physics tick) the server sends
+    {"type": "observation", "tick", "scan", "state", "game_state", "events"}, where
+    events are the player's lifecycle events since the last push (see
+    lifecycle_events). The client sends {"action": ...} messages (see apply_action).
+    The stream is not subject to the scan/state cooldowns. The connection is closed
+    when the player leaves the arena.
+
+    Args:
+        player_id: The ID of the player.
+        rate: Observations per second (query parameter), capped at the tick rate.
+    """
+    try:
+        arena = get_arena(arena_id)
+    except HTTPException:
+        arena = None
+    if arena is None or player_id not in arena.world.players:
+        await websocket.close(code=1008, reason="Arena or player not found")
+        return
+    await websocket.accept()
+    world = arena.world
+    interval = max(1 / max(rate, 1e-3), PHYSICS_DT)
+    outbox = asyncio.Queue()
+    receiver = asyncio.create_task(receive_actions(websocket, arena, player_id, outbox))
+    previous = None
+    last_tick = None
+    try:
+        while not receiver.done():
+            while not outbox.empty():
+                await websocket.send_json(outbox.get_nowait())
+            if current_tick(world) != last_tick:
+                observation = world.observation(player_id)
+                if observation is None:
+                    await websocket.send_json({"type": "event", "tick": world.tick, "events": [{"event": "removed"}]})
+                    await websocket.close(code=1000, reason="Player left the arena")
+                    break
+                game_state, state = observation["game_state"], observation["state"]
+                await websocket.send_json({
+                    "type": "observation",
+                    **observation,
+                    "events": lifecycle_events(previous, game_state, state),
+                })
+                previous = (game_state, state)
+                last_tick = observation["tick"]
+            await asyncio.sleep(interval)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        # Retrieves the receiver's outcome: a closed connection is expected, other errors propagate.
+        with contextlib.suppress(asyncio.CancelledError, WebSocketDisconnect):
+            await receiver
+
+# Default arena (legacy routes) and explicitly addressed arenas.
+app.include_router(router)
+app.include_router(router, prefix="/arena/{arena_id}")
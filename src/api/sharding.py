@@ -0,0 +1,249 @@
+"""
+Process-per-arena sharding.
+
+One server process simulates all of its arenas under a single GIL. This module
+starts several worker processes, each running the normal API app
+(src.api.api_endpoints:app) with its own ArenaRegistry, and a thin front-end
+app that forwards every request to the worker owning the addressed arena.
+
+Arenas are assigned to workers by a stable hash of the arena ID, so the front-end
+needs no shared state: /arena/{arena_id}/... goes to worker_for(arena_id), the
+unprefixed routes go to the owner of the default arena. Only that worker keeps
+the default arena; the others would simulate it without ever receiving traffic.
+
+Usage (from the project root):
+    python -m src.api.sharding --workers 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+import zlib
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import Response
+from ..core.arena import DEFAULT_ARENA_ID, arena_registry, is_valid_arena_id
+from ..settings import API_HOST, API_PORT, SHARD_WORKERS, SHARD_BASE_PORT
+
+# Headers that describe a single connection and must not be forwarded.
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailers", "transfer-encoding", "upgrade", "host", "content-length",
+}
+
+def worker_for(arena_id, worker_count):
+    """
+    Returns the index of the worker that owns an arena.
+    
+    Args:
+        arena_id (str): Identifier of the arena.
+        worker_count (int): Number of worker processes.
+    
+    Returns:
+        int: Worker index in range(worker_count).
+    """
+    return zlib.crc32(arena_id.encode("utf-8")) % worker_count
+
+def arena_id_for_path(path, query_params):
+    """
+    Extracts the arena addressed by a request.
+    
+    Args:
+        path (str): Request path without the leading slash.
+        query_params: The request's query parameters.
+    
+    Returns:
+        str: The arena ID (the default arena for unprefixed routes).
+    """
+    parts = path.split("/")
+    if len(parts) >= 2 and parts[0] == "arena":
+        return parts[1]
+    if len(parts) >= 2 and parts[0] == "arenas":
+        return parts[1]
+    return query_params.get("arena_id", DEFAULT_ARENA_ID)
+
+
+# ---------------- Worker processes ----------------
+
+def _run_worker(host, port, owns_default_arena):
+    """
+    Entry point of a worker process: serves the normal API app on its own port.
+    
+    Args:
+        host (str): Host to listen on.
+        port (int): Port to listen on.
+        owns_default_arena (bool): If False, the default arena is dropped before the
+            app starts, so its physics loop never runs in this worker.
+    """
+    if not owns_default_arena:
+        arena_registry.remove(DEFAULT_ARENA_ID)
+    uvicorn.run("src.api.api_endpoints:app", host=host, port=port, log_level="warning")
+
+class Supervisor:
+    """
+    Starts the worker processes and restarts them if they die.
+    """
+    def __init__(self, worker_count=None, host=API_HOST, base_port=SHARD_BASE_PORT):
+        """
+        Initializes the supervisor.
+        
+        Args:
+            worker_count (int, optional): Number of workers. Defaults to SHARD_WORKERS,
+                or one per CPU core if that is 0.
+            host (str): Host the workers listen on.
+            base_port (int): Port of worker 0; worker i uses base_port + i.
+        """
+        self.worker_count = worker_count or SHARD_WORKERS or os.cpu_count() or 1
+        self.host = host
+        self.base_port = base_port
+        self.processes = [None] * self.worker_count
+        self._context = multiprocessing.get_context("spawn")  # Fresh interpreter per worker
+        self._stopping = False
+
+    @property
+    def worker_urls(self):
+        """
+        Returns the base URL of every worker, indexed like worker_for().
+        """
+        return [f"http://{self.host}:{self.base_port + i}" for i in range(self.worker_count)]
+
+    def _start_worker(self, index):
+        owns_default_arena = index == worker_for(DEFAULT_ARENA_ID, self.worker_count)
+        process = self._context.Process(
+            target=_run_worker, args=(self.host, self.base_port + index, owns_default_arena), daemon=True
+        )
+        process.start()
+        self.processes[index] = process
+        print(f"Worker {index} started (pid {process.pid}) on port {self.base_port + index}.")
+
+    def start(self):
+        """
+        Starts all workers and a background thread that restarts crashed ones.
+        """
+        for index in range(self.worker_count):
+            self._start_worker(index)
+        threading.Thread(target=self._monitor, daemon=True).start()
+
+    def _monitor(self):
+        while not self._stopping:
+            time.sleep(1.0)
+            for index, process in enumerate(self.processes):
+                if not self._stopping and process is not None and not process.is_alive():
+                    print(f"Worker {index} exited with code {process.exitcode}. Restarting...")
+                    self._start_worker(index)
+
+    def stop(self):
+        """
+        Terminates all workers.
+        """
+        self._stopping = True
+        for process in self.processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            if process is not None:
+                process.join(timeout=5)
+
+
+# ---------------- Front-end ----------------
+
+def create_frontend_app(worker_urls):
+    """
+    Creates the front-end app that forwards requests to the owning workers.
+    
+    Args:
+        worker_urls (list): Base URL of every worker, indexed like worker_for().
+    
+    Returns:
+        FastAPI: The front-end application.
+    """
+    frontend = FastAPI()
+    state = {"client": None}
+
+    @frontend.on_event("startup")
+    async def open_client():
+        state["client"] = httpx.AsyncClient(timeout=10.0)
+
+    @frontend.on_event("shutdown")
+    async def close_client():
+        await state["client"].aclose()
+
+    async def forward(worker_index, request, path, content):
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        try:
+            upstream = await state["client"].request(
+                request.method, f"{worker_urls[worker_index]}/{path}",
+                params=request.query_params, content=content, headers=headers,
+            )
+        except httpx.HTTPError as e:
+            raise HTTPException(status_code=502, detail=f"Worker {worker_index} unavailable: {e}")
+        response_headers = {k: v for k, v in upstream.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+        return Response(content=upstream.content, status_code=upstream.status_code, headers=response_headers)
+
+    @frontend.get("/arenas")
+    async def list_arenas():
+        """
+        Collects the arenas of all workers.
+        """
+        arenas = []
+        for index, url in enumerate(worker_urls):
+            try:
+                response = await state["client"].get(f"{url}/arenas")
+            except httpx.HTTPError:
+                continue
+            for arena in response.json().get("arenas", []):
+                arenas.append(dict(arena, worker=index))
+        return {"arenas": arenas}
+
+    @frontend.post("/arenas")
+    async def create_arena(request: Request):
+        """
+        Picks the arena ID here (if the client did not) so the owning worker is known
+        before the arena exists.
+
+        Raises:
+            HTTPException: (400) if the requested ID is not a non-empty string.
+        """
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+        arena_id = data.get("arena_id") if isinstance(data, dict) else None
+        if arena_id is None:
+            arena_id = str(uuid.uuid4())
+        elif not is_valid_arena_id(arena_id):
+            raise HTTPException(status_code=400, detail="arena_id must be a non-empty string")
+        content = json.dumps({"arena_id": arena_id}).encode("utf-8")
+        return await forward(worker_for(arena_id, len(worker_urls)), request, "arenas", content)
+
+    @frontend.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+    async def proxy(path: str, request: Request):
+        arena_id = arena_id_for_path(path, request.query_params)
+        return await forward(worker_for(arena_id, len(worker_urls)), request, path, await request.body())
+
+    return frontend
+
+def main(argv=None):
+    """
+    Command line entry point: starts the workers and serves the front-end on API_PORT.
+    """
+    parser = argparse.ArgumentParser(description="Run the game server sharded across worker processes.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--host", default=API_HOST, help="Host for the front-end and the workers")
+    parser.add_argument("--port", type=int, default=API_PORT, help="Port of the front-end")
+    parser.add_argument("--base-port", type=int, default=SHARD_BASE_PORT, help="Port of worker 0")
+    args = parser.parse_args(argv)
+
+    supervisor = Supervisor(args.workers, host=args.host, base_port=args.base_port)
+    supervisor.start()
+    try:
+        uvicorn.run(create_frontend_app(supervisor.worker_urls), host=args.host, port=args.port, log_level="info")
+    finally:
+        supervisor.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import asyncio
+import heapq
+import itertools
+
+
+def current_tick(world):
+    """
+    Returns the tick of the world's latest snapshot (the tick observations belong to).
+    """
+    snapshot = world.snapshot
+    return snapshot.tick if snapshot is not None else world.tick
+
+
+class TickNotifier:
+    """
+    Lets coroutines wait until a world's simulation has passed a given tick.
+
+    The notifier registers itself as a tick listener of the world. Waiters are kept
+    in a heap ordered by the tick they wait for; the physics thread only compares
+    the new tick against the smallest one and, if a waiter is due, schedules the
+    wake-up on the event loop with call_soon_threadsafe. Ticks nobody waits for
+    cost a single comparison.
+    """
+    def __init__(self, world, loop):
+        """
+        Initializes the notifier and attaches it to the world.
+
+        Args:
+            world (GameWorld): The world whose ticks are watched.
+            loop (asyncio.AbstractEventLoop): The event loop the waiters run on.
+        """
+        self.world = world
+        self.loop = loop
+        self._waiters = []                  # Heap of (tick, sequence, future)
+        self._sequence = itertools.count()  # Tie-breaker, futures are not comparable
+        self._next_tick = float("inf")      # Smallest tick in the heap, read by the physics thread
+        self._timed_out = 0                 # Heap entries whose waiter gave up
+        world.tick_listeners.append(self._on_tick)
+
+    def _on_tick(self, tick):
+        """
+        Tick listener (physics thread): schedules a wake-up if a waiter is due.
+        """
+        if tick > self._next_tick:
+            self.loop.call_soon_threadsafe(self._wake, tick)
+
+    def _wake(self, tick):
+        """
+        Resolves all waiters whose tick has been passed (event loop).
+        """
+        while self._waiters and self._waiters[0][0] < tick:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                self._timed_out -= 1
+            else:
+                future.set_result(tick)
+        self._next_tick = self._waiters[0][0] if self._waiters else float("inf")
+
+    def _prune(self):
+        """
+        Drops the entries of waiters that timed out (event loop).
+        """
+        self._waiters = [entry for entry in self._waiters if not entry[2].done()]
+        heapq.heapify(self._waiters)
+        self._timed_out = 0
+        self._next_tick = self._waiters[0][0] if self._waiters else float("inf")
+
+    async def wait_past(self, tick, timeout):
+        """
+        Waits until the simulation has advanced past a tick.
+
+        Args:
+            tick (int): The tick to pass.
+            timeout (float): Maximum wait in seconds.
+
+        Returns:
+            int or None: The first tick greater than `tick`, or None on timeout.
+        """
+        current = current_tick(self.world)
+        if current > tick:
+            return current
+        future = self.loop.create_future()
+        heapq.heappush(self._waiters, (tick, next(self._sequence), future))
+        self._next_tick = self._waiters[0][0]
+        # The tick may have passed while the waiter was registered.
+        current = current_tick(self.world)
+        if current > tick:
+            self._wake(current)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # Rebuilding once half of the heap is stale keeps it bounded by the live waiters.
+            self._timed_out += 1
+            if 2 * self._timed_out > len(self._waiters):
+                self._prune()
+            return None
+
+    def close(self):
+        """
+        Detaches the notifier from the world.
+        """
+        if self._on_tick in self.world.tick_listeners:
+            self.world.tick_listeners.remove(self._on_tick)
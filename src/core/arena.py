@@ -0,0 +1,154 @@
+import uuid
+from .game_world import GameWorld, game_world_instance
+from .rate_limiter import RateLimiter
+from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT, MAX_ARENAS, RATE_LIMITS
+
+# ID of the arena that wraps the global game_world_instance (used by the
+# visualizer and by the API routes without an /arena/{arena_id} prefix).
+DEFAULT_ARENA_ID = "default"
+
+def is_valid_arena_id(arena_id):
+    """
+    Checks whether a client-supplied arena ID can be used.
+    
+    Args:
+        arena_id: The requested ID (any JSON value).
+    
+    Returns:
+        bool: True for a non-empty string.
+    """
+    return isinstance(arena_id, str) and arena_id != ""
+
+class Arena:
+    """
+    One independent match: a GameWorld plus the per-arena API state.
+    
+    Every arena has its own physics task, score system (inside its GameWorld)
+    and rate limiter, so arenas never influence each other.
+    """
+    def __init__(self, arena_id, world):
+        """
+        Initializes an Arena.
+        
+        Args:
+            arena_id (str): Unique identifier of the arena.
+            world (GameWorld): The game world simulated in this arena.
+        """
+        self.arena_id = arena_id
+        self.world = world
+        self.rate_limiter = RateLimiter(RATE_LIMITS)  # Token buckets per player and endpoint class
+        self.tick_notifier = None  # TickNotifier, created by the first long-poll request
+
+    def to_dict(self):
+        """
+        Serializes a short summary of the arena.
+        
+        Returns:
+            dict: Arena ID, number of players and whether the match is running.
+        """
+        return {
+            "arena_id": self.arena_id,
+            "players": len(self.world.players),
+            "game_started": self.world.game_started,
+        }
+
+class ArenaRegistry:
+    """
+    Keeps track of all arenas hosted by this server process.
+    """
+    def __init__(self, max_arenas=MAX_ARENAS):
+        """
+        Initializes an empty registry.
+        
+        Args:
+            max_arenas (int): Maximum number of arenas that can exist at the same time.
+        """
+        self.max_arenas = max_arenas
+        self.arenas = {}  # Dictionary mapping arena IDs to Arena objects
+
+    def add(self, arena_id, world):
+        """
+        Registers an existing GameWorld as an arena.
+        
+        Args:
+            arena_id (str): Unique identifier of the arena.
+            world (GameWorld): The game world to register.
+        
+        Returns:
+            Arena: The registered arena.
+        """
+        arena = Arena(arena_id, world)
+        self.arenas[arena_id] = arena
+        return arena
+
+    def create(self, arena_id=None, start_physics=True):
+        """
+        Creates a new arena with a fresh GameWorld.
+        
+        Args:
+            arena_id (str, optional): Requested ID; a new UUID is generated if omitted.
+            start_physics (bool): If True, the arena's physics loop is started right away.
+        
+        Returns:
+            Arena or None: The new arena, or None if the ID is taken or the limit is reached.
+        """
+        arena_id = arena_id if arena_id is not None else str(uuid.uuid4())
+        if arena_id in self.arenas:
+            print(f"Arena {arena_id} already exists.")
+            return None
+        if len(self.arenas) >= self.max_arenas:
+            print(f"Arena limit of {self.max_arenas} reached.")
+            return None
+        # Only the default arena writes the shared statistics files in game_stats/.
+        world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, write_stats=False)
+        arena = self.add(arena_id, world)
+        if start_physics:
+            world.start_physics_engine(dt=PHYSICS_DT)
+        print(f"Arena {arena_id} created.")
+        return arena
+
+    def get(self, arena_id):
+        """
+        Looks up an arena.
+        
+        Args:
+            arena_id (str): Identifier of the arena.
+        
+        Returns:
+            Arena or None: The arena, or None if it does not exist.
+        """
+        return self.arenas.get(arena_id)
+
+    def remove(self, arena_id):
+        """
+        Stops an arena's physics loop and removes it from the registry.
+        
+        Args:
+            arena_id (str): Identifier of the arena.
+        
+        Returns:
+            bool: True if the arena existed.
+        """
+        arena = self.arenas.pop(arena_id, None)
+        if arena is None:
+            return False
+        arena.world.stop_physics_engine()
+        if arena.tick_notifier is not None:
+            arena.tick_notifier.close()
+        print(f"Arena {arena_id} removed.")
+        return True
+
+    def start_all(self, dt=PHYSICS_DT):
+        """
+        Starts the physics loop of every arena that is not running yet.
+        
+        Args:
+            dt (float): Delta time between physics updates.
+        """
+        for arena in self.arenas.values():
+            if not arena.world.is_running:
+                arena.world.start_physics_engine(dt=dt)
+
+# Global registry; the default arena wraps the global game world instance.
+arena_registry = ArenaRegistry()
+arena_registry.add(DEFAULT_ARENA_ID, game_world_instance)
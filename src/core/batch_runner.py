@@ -0,0 +1,251 @@
+"""
+Batch match runner: steps a GameWorld as fast as the CPU allows.
+
+The realtime server sleeps between physics updates. This runner instead drives the
+world with a SimulationClock, so a full match (lobby, countdown and MAX_GAME_DURATION)
+finishes in a fraction of the wall-clock time and returns the final scores.
+
+Agents are plain Python callables ("policies") with the signature
+``policy(game_world, player_id)``. They are called between physics updates and
+control their player through the same GameWorld methods the API endpoints use.
+Those methods are rate limited like the endpoints (settings.RATE_LIMITS, timed by
+the simulation clock), so batch results are comparable to live matches.
+
+Usage (from the project root):
+    python -m src.core.batch_runner random spinner idle --matches 10
+    python -m src.core.batch_runner my_agents.bot:policy random --quiet
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import random
+import time
+from .clock import SimulationClock
+from .event_log import event_log
+from .game_world import GameWorld
+from .rate_limiter import RateLimiter
+from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT, MAX_GAME_DURATION, COUNTDOWN_DURATION, RATE_LIMITS
+
+
+# ---------------- Built-in policies ----------------
+
+def idle_policy(game_world, player_id):
+    """Does nothing. Useful as a baseline opponent."""
+    pass
+
+def spinner_policy(game_world, player_id):
+    """Turns on the spot and fires whenever the shoot cooldown allows."""
+    game_world.left_player_rotation(player_id)
+    game_world.shoot(player_id)
+
+def random_policy(game_world, player_id):
+    """Picks a random action every decision."""
+    action = random.choice([
+        game_world.positive_player_thrust,
+        game_world.negative_player_thrust,
+        game_world.left_player_rotation,
+        game_world.right_player_rotation,
+        game_world.shoot,
+    ])
+    action(player_id)
+
+BUILTIN_POLICIES = {
+    "idle": idle_policy,
+    "spinner": spinner_policy,
+    "random": random_policy,
+}
+
+def load_policy(spec):
+    """
+    Resolves a policy from a built-in name or a "module:function" path.
+    
+    Args:
+        spec (str): e.g. "random" or "my_package.my_agent:policy".
+    
+    Returns:
+        callable: The policy function.
+    
+    Raises:
+        ValueError: If the spec is neither a built-in name nor a module path.
+    """
+    if spec in BUILTIN_POLICIES:
+        return BUILTIN_POLICIES[spec]
+    if ":" not in spec:
+        raise ValueError(f"Unknown policy '{spec}'. Use one of {sorted(BUILTIN_POLICIES)} or 'module:function'.")
+    module_name, func_name = spec.split(":", 1)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+# ---------------- Runner ----------------
+
+# GameWorld methods that are rate limited, mapped to their endpoint class in RATE_LIMITS.
+RATE_LIMITED_METHODS = {
+    "shoot": "shoot",
+    "scan_environment": "scan_environment",
+    "player_state": "state",
+    "game_state": "game_state",
+}
+
+class RateLimitedWorld:
+    """
+    The view of a GameWorld that policies get.
+    
+    Forwards everything to the world, but calls of the rate-limited methods take a
+    token from the same buckets the API uses. A call without a token is dropped and
+    returns None, like a request answered with 429.
+    """
+    def __init__(self, world, limiter):
+        """
+        Initializes the view.
+        
+        Args:
+            world (GameWorld): The simulated world.
+            limiter (RateLimiter): Token buckets, timed by the world's simulation clock.
+        """
+        self._world = world
+        self._limiter = limiter
+
+    def __getattr__(self, name):
+        attribute = getattr(self._world, name)
+        endpoint = RATE_LIMITED_METHODS.get(name)
+        if endpoint is None:
+            return attribute
+        limiter = self._limiter
+
+        def limited(player_id, *args):
+            if limiter.acquire(player_id, endpoint):
+                return None
+            return attribute(player_id, *args)
+        return limited
+
+def run_match(policies, dt=PHYSICS_DT, decision_interval=1, max_ticks=None, seed=None):
+    """
+    Runs one complete match without any sleeping and returns the final scores.
+    
+    All players are connected and marked ready right away, so the match goes
+    through the countdown and then runs until MAX_GAME_DURATION (in simulated time).
+    Policies get a RateLimitedWorld, so they are held to the API's rate limits.
+    
+    Args:
+        policies (dict): Maps agent names to policy callables.
+        dt (float): Physics time step. Defaults to PHYSICS_DT.
+        decision_interval (int): Number of physics updates between two policy calls.
+        max_ticks (int, optional): Safety limit for the number of updates. Defaults to
+            enough ticks for the countdown plus the full match duration.
+        seed (int, optional): Seed for the game world (spawn positions, sensor noise).
+    
+    Returns:
+        dict: {"scores": {agent_name: score}, "ticks": int, "simulated_seconds": float,
+               "wall_seconds": float}
+    
+    Raises:
+        RuntimeError: If a player cannot be spawned.
+    """
+    if max_ticks is None:
+        max_ticks = int((COUNTDOWN_DURATION + MAX_GAME_DURATION) / dt) + 600
+
+    clock = SimulationClock()
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, clock=clock, write_stats=False, seed=seed)
+
+    policy_world = RateLimitedWorld(world, RateLimiter(RATE_LIMITS, clock=clock))
+
+    players = {}  # {player_id: (agent_name, policy)}
+    player_ids = world.add_players(list(policies))
+    for player_id, (agent_name, policy) in zip(player_ids, policies.items()):
+        if player_id is None:
+            raise RuntimeError(f"Could not spawn player for agent '{agent_name}'.")
+        players[player_id] = (agent_name, policy)
+    for player_id in players:
+        world.player_ready(player_id)
+
+    wall_start = time.perf_counter()
+    ticks = 0
+    while world.matches_played == 0 and ticks < max_ticks:
+        if world.game_started and ticks % decision_interval == 0:
+            for player_id, (agent_name, policy) in players.items():
+                if player_id in world.players and world.players[player_id].health > 0:
+                    policy(policy_world, player_id)
+        clock.advance(dt)
+        world.update(dt)
+        ticks += 1
+
+    if world.matches_played == 0:
+        # Safety limit reached before the match ended on its own.
+        world.restart_game()
+
+    return {
+        "scores": {name: world.last_match_scores.get(pid, 0) for pid, (name, _) in players.items()},
+        "ticks": ticks,
+        "simulated_seconds": round(clock(), 3),
+        "wall_seconds": round(time.perf_counter() - wall_start, 3),
+    }
+
+def run_matches(policies, matches=1, **kwargs):
+    """
+    Runs several matches one after another.
+    
+    Args:
+        policies (dict): Maps agent names to policy callables.
+        matches (int): Number of matches to run.
+        **kwargs: Passed on to run_match().
+    
+    Returns:
+        list: One result dict (see run_match) per match.
+    """
+    return [run_match(policies, **kwargs) for _ in range(matches)]
+
+
+def _unique_names(specs):
+    """Builds agent names from policy specs, numbering duplicates (random, random#2, ...)."""
+    names = []
+    for spec in specs:
+        base = spec.split(":")[-1]
+        name = base
+        count = 2
+        while name in names:
+            name = f"{base}#{count}"
+            count += 1
+        names.append(name)
+    return names
+
+def main(argv=None):
+    """
+    Command line entry point. Prints the scores of every match and the averages.
+    """
+    parser = argparse.ArgumentParser(description="Run UPC_PyGame matches faster than real time.")
+    parser.add_argument("policies", nargs="+",
+                        help=f"Policies, one per player: {', '.join(sorted(BUILTIN_POLICIES))} or module:function")
+    parser.add_argument("--matches", type=int, default=1, help="Number of matches to run")
+    parser.add_argument("--decision-interval", type=int, default=1,
+                        help="Physics updates between two policy decisions")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed for the random module and the game worlds (match i uses seed + i)")
+    parser.add_argument("--quiet", action="store_true", help="Suppress the game's console output")
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        random.seed(args.seed)
+    policies = dict(zip(_unique_names(args.policies), (load_policy(spec) for spec in args.policies)))
+
+    totals = {name: 0 for name in policies}
+    for match_index in range(args.matches):
+        seed = None if args.seed is None else args.seed + match_index
+        if args.quiet:
+            # The event log prints from its own thread, outside of redirect_stdout.
+            with event_log.muted(), contextlib.redirect_stdout(io.StringIO()):
+                result = run_match(policies, decision_interval=args.decision_interval, seed=seed)
+        else:
+            result = run_match(policies, decision_interval=args.decision_interval, seed=seed)
+            event_log.flush()
+        print(f"Match {match_index + 1}: {result['scores']} "
+              f"({result['simulated_seconds']}s simulated in {result['wall_seconds']}s)")
+        for name, score in result["scores"].items():
+            totals[name] += score
+
+    print("Average scores:")
+    for name, total in totals.items():
+        print(f"  {name}: {total / args.matches:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+import math
+from collections import namedtuple
+import numpy as np
+import pymunk
+from .game_objects import apply_projectile_hit
+from ..settings import *
+
+# Contact restitution of a projectile (elasticity 0.6) and an obstacle (0.9), as Pymunk computes it.
+PROJECTILE_ELASTICITY = 0.6
+
+# Read-only view of one bullet, shaped like a Projectile for the per-request scan (see nearby_bullets).
+BulletBody = namedtuple("BulletBody", ["position", "velocity"])
+BulletView = namedtuple("BulletView", ["body", "radius", "color"])
+
+
+class BulletEngine:
+    """
+    Simulates projectiles as NumPy arrays instead of Pymunk bodies (enabled by BULLET_ENGINE).
+
+    All bullets are integrated in one vectorized step per tick. They bounce off the
+    static obstacles, are removed at the borders or when their lifetime runs out,
+    and hit players (approximated as circles of player.radius) through the same
+    damage and scoring path as the Pymunk collision handler.
+
+    Unlike Pymunk projectiles, bullets do not collide with each other and do not push
+    the players they hit. Bullets are assumed to move less than one player radius per
+    tick, so no swept collision test is done.
+    """
+    def __init__(self, width, height, capacity=BULLET_ENGINE_CAPACITY, radius=PROJECTILE_RADIUS,
+                 speed=PROJECTILE_SPEED):
+        """
+        Initializes the engine with empty bullet arrays.
+
+        Args:
+            width (int): Width of the world (borders are removed on contact).
+            height (int): Height of the world.
+            capacity (int): Initial size of the arrays; they grow when full.
+            radius (float): Radius of every bullet.
+            speed (float): Muzzle speed of every bullet.
+        """
+        self.width = width
+        self.height = height
+        self.radius = radius
+        self.speed = speed
+        self.count = 0              # Bullets in flight; they occupy the first `count` rows
+        self._next_id = 0           # Bullet IDs are never reused
+        self._allocate(capacity)
+        self._owner_slots = {}      # Player -> owner slot (index into _owner_players)
+        self._owner_players = []
+        self.set_obstacles([])
+
+    def _allocate(self, capacity):
+        """
+        (Re)allocates the bullet arrays, keeping the bullets in flight.
+        """
+        old = None if not hasattr(self, "positions") else (
+            self.positions, self.velocities, self.angles, self.lifetimes, self.owners, self.ids)
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.angles = np.zeros(capacity)
+        self.lifetimes = np.zeros(capacity)
+        self.owners = np.zeros(capacity, dtype=np.int32)
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        if old is not None:
+            for new_array, old_array in zip(self._arrays(), old):
+                new_array[:self.count] = old_array[:self.count]
+
+    def _arrays(self):
+        return self.positions, self.velocities, self.angles, self.lifetimes, self.owners, self.ids
+
+    def set_obstacles(self, obstacles):
+        """
+        Sets the static circles bullets bounce off. Call when the arena layout changes.
+
+        Args:
+            obstacles (list): CircleObstacle instances.
+        """
+        self._obstacle_centers = np.array([tuple(o.body.position) for o in obstacles]).reshape(-1, 2)
+        self._obstacle_reach = np.array([o.radius + self.radius for o in obstacles])
+        self._obstacle_restitution = np.array([PROJECTILE_ELASTICITY * o.shape.elasticity for o in obstacles])
+
+    def _owner_slot(self, player):
+        slot = self._owner_slots.get(player)
+        if slot is None:
+            slot = len(self._owner_players)
+            self._owner_slots[player] = slot
+            self._owner_players.append(player)
+        return slot
+
+    def spawn(self, position, angle_rad, owner):
+        """
+        Fires a bullet.
+
+        Args:
+            position (tuple): Starting (x, y) position.
+            angle_rad (float): Firing angle in radians.
+            owner (Triangle): The player who fired the bullet.
+        """
+        if self.count == len(self.positions):
+            self._allocate(2 * len(self.positions))
+        i = self.count
+        self.positions[i] = tuple(position)
+        self.velocities[i] = (math.cos(angle_rad) * self.speed, math.sin(angle_rad) * self.speed)
+        self.angles[i] = angle_rad
+        self.lifetimes[i] = PROJECTILE_LIFETIME_SECONDS
+        self.owners[i] = self._owner_slot(owner)
+        self.ids[i] = self._next_id
+        self._next_id += 1
+        self.count += 1
+
+    def clear(self):
+        """
+        Removes all bullets (e.g. on restart).
+        """
+        self.count = 0
+        self._owner_slots = {}
+        self._owner_players = []
+
+    def step(self, game_world, dt):
+        """
+        Advances all bullets by one tick and applies their hits.
+
+        Args:
+            game_world (GameWorld): The world (players and score system).
+            dt (float): Delta time of the tick.
+        """
+        n = self.count
+        if n == 0:
+            return
+        pos = self.positions[:n]
+        vel = self.velocities[:n]
+        self.lifetimes[:n] -= dt
+        pos += vel * dt
+        remove = self.lifetimes[:n] <= 0
+
+        # Bounce off obstacles: reflect the normal velocity and move back onto the surface.
+        if len(self._obstacle_reach):
+            delta = pos[:, None, :] - self._obstacle_centers[None]
+            dist = np.hypot(delta[..., 0], delta[..., 1])
+            overlap = dist < self._obstacle_reach[None]
+            rows = np.nonzero(overlap.any(axis=1))[0]
+            if rows.size:
+                j = np.argmin(np.where(overlap[rows], dist[rows], np.inf), axis=1)
+                normal = delta[rows, j] / np.maximum(dist[rows, j], 1e-9)[:, None]
+                vn = np.minimum(np.einsum("ij,ij->i", vel[rows], normal), 0)  # Only if approaching
+                vel[rows] -= ((1 + self._obstacle_restitution[j]) * vn)[:, None] * normal
+                pos[rows] = self._obstacle_centers[j] + normal * self._obstacle_reach[j][:, None]
+
+        # Borders remove bullets (the segments have a radius of 1).
+        r = self.radius + 1
+        remove |= (pos[:, 0] <= r) | (pos[:, 0] >= self.width - r) | (pos[:, 1] <= r) | (pos[:, 1] >= self.height - r)
+
+        # Player hits: nearest overlapping player per bullet, in bullet order.
+        targets = [p for p in game_world.players.values() if p.health > 0 and p.in_space]
+        if targets:
+            centers = np.array([tuple(p.body.position) for p in targets])
+            reach = np.array([p.radius for p in targets]) + self.radius
+            delta = pos[:, None, :] - centers[None]
+            dist2 = delta[..., 0] ** 2 + delta[..., 1] ** 2
+            overlap = (dist2 < reach[None] ** 2) & ~remove[:, None]
+            if not ALLOW_FRIENDLY_FIRE:
+                # Own bullets pass through, like in the Pymunk handler.
+                target_slots = np.array([self._owner_slots.get(p, -1) for p in targets])
+                overlap &= self.owners[:n, None] != target_slots[None]
+            rows = np.nonzero(overlap.any(axis=1))[0]
+            if rows.size:
+                j = np.argmin(np.where(overlap[rows], dist2[rows], np.inf), axis=1)
+                for bullet, target in zip(rows.tolist(), j.tolist()):
+                    player = targets[target]
+                    if player.health <= 0:
+                        continue  # Destroyed earlier in this tick; the bullet flies on
+                    apply_projectile_hit(game_world, self._owner_players[self.owners[bullet]], player)
+                    remove[bullet] = True
+
+        if remove.any():
+            keep = ~remove
+            for array in self._arrays():
+                kept = array[:n][keep]
+                array[:len(kept)] = kept
+            self.count = int(keep.sum())
+
+    def colors(self):
+        """
+        Returns the color of every bullet in flight (the color of its owner).
+
+        Returns:
+            list: RGB tuples in array order.
+        """
+        owner_colors = [player.color for player in self._owner_players]
+        return [owner_colors[slot] for slot in self.owners[:self.count].tolist()]
+
+    def states(self):
+        """
+        Copies the bullets in flight for readers outside the physics thread.
+
+        Returns:
+            tuple: (ids, positions, velocities, angles, colors); arrays are copies.
+        """
+        n = self.count
+        return (self.ids[:n].copy(), self.positions[:n].copy(), self.velocities[:n].copy(),
+                self.angles[:n].copy(), self.colors())
+
+
+def nearby_bullets(states, radius, position, reach):
+    """
+    Returns the bullets whose surface is within reach of a point.
+
+    Works on the copies made by BulletEngine.states() (e.g. WorldSnapshot.bullets), so
+    request threads never read the engine's arrays while the physics thread compacts them.
+
+    Args:
+        states (tuple): (ids, positions, velocities, angles, colors) from BulletEngine.states().
+        radius (float): Radius of every bullet.
+        position (Vec2d): The query point.
+        reach (float): Maximum surface distance.
+
+    Returns:
+        list: BulletView instances.
+    """
+    _, positions, velocities, _, colors = states
+    delta = positions - (position.x, position.y)
+    indices = np.nonzero(np.hypot(delta[:, 0], delta[:, 1]) - radius <= reach)[0]
+    return [
+        BulletView(BulletBody(pymunk.Vec2d(*positions[i]), pymunk.Vec2d(*velocities[i])), radius, colors[i])
+        for i in indices.tolist()
+    ]
@@ -0,0 +1,32 @@
+class SimulationClock:
+    """
+    A clock that is advanced by the simulation instead of following the wall clock.
+    
+    GameWorld reads the current time through a plain callable (time.time by default).
+    Passing an instance of this class instead lets a caller step the world faster
+    (or slower) than real time while spawn protection, countdown and the match
+    duration still behave as in a realtime match.
+    """
+    def __init__(self, start=0.0):
+        """
+        Initializes the clock.
+        
+        Args:
+            start (float): Initial time in seconds. Defaults to 0.0.
+        """
+        self.now = start
+
+    def advance(self, dt):
+        """
+        Moves the clock forward.
+        
+        Args:
+            dt (float): Seconds to advance.
+        """
+        self.now += dt
+
+    def __call__(self):
+        """
+        Returns the current simulation time in seconds.
+        """
+        return self.now
@@ -0,0 +1,128 @@
+import math
+import numpy as np
+from ..settings import DISTANCE_FIELD_CELL_SIZE
+
+BORDER_RADIUS = 1  # Radius of the border segments created in GameWorld.add_borders
+
+
+class StaticDistanceField:
+    """
+    Signed distance to the static arena geometry (obstacles and borders), sampled on a grid.
+
+    The grid is computed once when the arena is built; every lookup is a single array
+    access. Distances are measured to the surface and are negative inside an obstacle.
+    A lookup returns the value at the center of the cell containing the point, so it
+    may be off by up to `max_error` pixels (half a cell diagonal).
+    """
+    def __init__(self, width, height, cell_size=DISTANCE_FIELD_CELL_SIZE):
+        """
+        Initializes an empty field (no obstacles, borders only) for an arena.
+
+        Args:
+            width (int): Width of the arena.
+            height (int): Height of the arena.
+            cell_size (float): Edge length of a grid cell in pixels.
+        """
+        self.width = width
+        self.height = height
+        self.cell_size = cell_size
+        self.max_error = cell_size * math.sqrt(2) / 2
+        self.columns = math.ceil(width / cell_size)
+        self.rows = math.ceil(height / cell_size)
+        self.layout = None  # Obstacles the field was built for
+        self.build([])
+
+    def build(self, obstacles):
+        """
+        Computes the field for a set of obstacles, unless it was built for the same layout.
+
+        Args:
+            obstacles (list): CircleObstacle instances.
+
+        Returns:
+            bool: True if the field was recomputed.
+        """
+        layout = tuple(sorted((o.body.position.x, o.body.position.y, o.radius) for o in obstacles))
+        if layout == self.layout:
+            return False
+
+        x = (np.arange(self.columns) + 0.5) * self.cell_size
+        y = (np.arange(self.rows) + 0.5) * self.cell_size
+        grid_x, grid_y = np.meshgrid(x, y)  # Shape (rows, columns)
+        obstacle_distance = np.full(grid_x.shape, np.inf)
+        for cx, cy, radius in layout:
+            np.minimum(obstacle_distance, np.hypot(grid_x - cx, grid_y - cy) - radius, out=obstacle_distance)
+        border_distance = np.minimum(np.minimum(grid_x, self.width - grid_x),
+                                     np.minimum(grid_y, self.height - grid_y)) - BORDER_RADIUS
+
+        # Nested lists: a single lookup is faster than indexing a NumPy array.
+        self._obstacle_distance = obstacle_distance.tolist()
+        self._border_distance = border_distance.tolist()
+        self._distance = np.minimum(obstacle_distance, border_distance).tolist()
+        self.layout = layout
+        return True
+
+    def _cell(self, position):
+        """
+        Returns the (row, column) of the cell containing a point (clamped to the grid).
+        """
+        column = min(max(int(position[0] / self.cell_size), 0), self.columns - 1)
+        row = min(max(int(position[1] / self.cell_size), 0), self.rows - 1)
+        return row, column
+
+    def distance(self, position):
+        """
+        Returns the distance from a point to the nearest static surface (obstacle or border).
+
+        Args:
+            position (tuple or Vec2d): The point (x, y).
+
+        Returns:
+            float: Signed distance in pixels (negative inside an obstacle).
+        """
+        row, column = self._cell(position)
+        return self._distance[row][column]
+
+    def obstacle_distance(self, position):
+        """
+        Returns the distance from a point to the nearest obstacle surface.
+
+        Args:
+            position (tuple or Vec2d): The point (x, y).
+
+        Returns:
+            float: Signed distance in pixels; infinite if there are no obstacles.
+        """
+        row, column = self._cell(position)
+        return self._obstacle_distance[row][column]
+
+    def border_distance(self, position):
+        """
+        Returns the distance from a point to the nearest border surface.
+
+        Args:
+            position (tuple or Vec2d): The point (x, y).
+
+        Returns:
+            float: Distance in pixels.
+        """
+        row, column = self._cell(position)
+        return self._border_distance[row][column]
+
+    def is_free(self, position, radius):
+        """
+        Checks whether a circle is clear of all static geometry.
+
+        The check is conservative: the lookup error is added to the radius.
+
+        Args:
+            position (tuple or Vec2d): Center of the circle.
+            radius (float): Radius of the circle.
+
+        Returns:
+            bool: True if the circle lies inside the arena and touches no obstacle or border.
+        """
+        x, y = position[0], position[1]
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return self.distance(position) - self.max_error >= radius
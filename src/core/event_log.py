@@ -0,0 +1,175 @@
+"""
+Asynchronous, level-gated event log for messages raised on the physics thread.
+
+Collision handlers, shots and damage report events through `event_log.log()` instead
+of print(). A call only appends the unformatted message and its arguments to an
+in-memory ring buffer; a background thread formats the messages and writes them to
+stdout (or EVENT_LOG_PATH). Each category has its own minimum level, so a
+disabled category costs a single dictionary lookup.
+
+Usage:
+    from .event_log import event_log, DEBUG, INFO
+    event_log.log("combat", INFO, "Player {} took {} damage.", player_id, amount)
+    event_log.set_level("collision", "off")
+    with event_log.muted():  # e.g. quiet batch runs and benchmarks
+        ...
+"""
+import atexit
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections import deque
+from ..settings import EVENT_LOG_LEVELS, EVENT_LOG_BUFFER_SIZE, EVENT_LOG_PATH, EVENT_LOG_FLUSH_INTERVAL
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+OFF = 100
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+
+
+class EventLog:
+    """
+    Ring buffer of events, drained by a writer thread.
+    """
+    def __init__(self, levels=EVENT_LOG_LEVELS, capacity=EVENT_LOG_BUFFER_SIZE, path=EVENT_LOG_PATH,
+                 flush_interval=EVENT_LOG_FLUSH_INTERVAL):
+        """
+        Initializes the log. The writer thread starts with the first accepted event.
+
+        Args:
+            levels (dict): Category -> minimum level name ("debug", "info", "warning", "off").
+                The "default" entry applies to categories that are not listed.
+            capacity (int): Events kept in the buffer. If the writer falls behind, the
+                oldest events are dropped instead of blocking the tick.
+            path (str, optional): File the events are appended to; None writes to stdout.
+            flush_interval (float): Seconds the writer waits between two drains.
+        """
+        self._levels = {category: LEVELS[name] for category, name in levels.items()}
+        self._default_level = self._levels.pop("default", INFO)
+        self._buffer = deque(maxlen=capacity)
+        self.path = path
+        self.flush_interval = flush_interval
+        self.written = 0    # Events written by the writer thread
+        self.dropped = 0    # Events overwritten before the writer got to them
+        self._lock = threading.Lock()  # Serializes drains (writer thread and flush())
+        self._thread = None
+
+    def set_level(self, category, level):
+        """
+        Changes the minimum level of a category at runtime.
+
+        Args:
+            category (str): Category name, or "default" for all unlisted categories.
+            level (str or int): Level name or number.
+        """
+        level = LEVELS[level] if isinstance(level, str) else level
+        if category == "default":
+            self._default_level = level
+        else:
+            self._levels[category] = level
+
+    @contextlib.contextmanager
+    def muted(self):
+        """
+        Drops every event logged inside the block.
+
+        Events buffered before the block are written first, so nothing the writer
+        thread prints later ends up in the muted section's output. The levels are
+        restored when the block ends.
+        """
+        self.flush()
+        levels, default_level = self._levels, self._default_level
+        self._levels, self._default_level = {}, OFF
+        try:
+            yield
+        finally:
+            self._levels, self._default_level = levels, default_level
+
+    def enabled(self, category, level):
+        """
+        Checks whether events of a category and level are recorded.
+
+        Args:
+            category (str): Category name.
+            level (int): Level of the event.
+
+        Returns:
+            bool: True if the event would be logged.
+        """
+        return level >= self._levels.get(category, self._default_level)
+
+    def log(self, category, level, message, *args):
+        """
+        Records an event. Called on the physics thread, so it does no formatting or I/O.
+
+        Args:
+            category (str): Category name (e.g. "collision", "combat", "shot").
+            level (int): DEBUG, INFO or WARNING.
+            message (str): str.format() template, formatted by the writer thread.
+            *args: Template arguments; they must not change after the call.
+        """
+        if level < self._levels.get(category, self._default_level):
+            return
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append((category, message, args))
+        if self._thread is None:
+            self._start()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="event-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _write_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self._drain()
+
+    def _drain(self):
+        with self._lock:
+            lines = []
+            while self._buffer:
+                try:
+                    category, message, args = self._buffer.popleft()
+                except IndexError:
+                    break
+                lines.append(message.format(*args) if args else message)
+            if not lines:
+                return
+            text = "\n".join(lines) + "\n"
+            if self.path is None:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            else:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(text)
+            self.written += len(lines)
+
+    def flush(self):
+        """
+        Writes all buffered events now (blocking). Called automatically at exit.
+        """
+        self._drain()
+
+    def stats(self):
+        """
+        Returns the log metrics.
+
+        Returns:
+            dict: Buffered, written and dropped events.
+        """
+        return {"buffered": len(self._buffer), "written": self.written, "dropped": self.dropped}
+
+
+# Process-wide log shared by all arenas.
+event_log = EventLog()
@@ -1,16 +1,16 @@
-import pygame
 import math
 import pymunk
 import time
 from ..settings import *
+from .event_log import event_log, DEBUG, INFO, WARNING
 
-class Triangle(pygame.sprite.Sprite):
+class Triangle:
     """
     Represents a player character as a triangle.
     
-    Handles both the physical representation (using pymunk) and the visual
-    representation (using pygame). Also manages spawn protection, health,
-    and removal from the game world.
+    Handles the physical representation (using pymunk), spawn protection, health,
+    and removal from the game world. The entity holds no pygame surfaces; drawing
+    is done by the visualizer (src/render/visualizer.py), which reads this state.
     """
     def __init__(self, position, angle=0, color=(0, 128, 255), game_world=None):
         """
@@ -22,7 +22,6 @@ class Triangle(pygame.sprite.Sprite):
             color (tuple): RGB color for the triangle.
             game_world (GameWorld): Reference to the main game world.
         """
-        super().__init__()
         self.color = color
         self.radius = 15
         self.game_world = game_world
@@ -32,7 +31,7 @@ class Triangle(pygame.sprite.Sprite):
         self.spawn_protection_duration = 3.0  # Seconds of protection
         self.spawn_protection_until = -1
         self.collisions = 0
-        self.lifetime = time.time()
+        self.lifetime = self._now()
 
         mass = 1
         moment = pymunk.moment_for_poly(mass, [
@@ -52,47 +51,52 @@ class Triangle(pygame.sprite.Sprite):
         self.shape.collision_type = 1   # Collision type for players
         self.shape.sprite_ref = self    # Link back to this sprite
         self.ready = False  # Indicates if the player is ready to play
+        self.in_space = False   # True while body and shape are in the physics space
 
         if game_world:
             game_world.space.add(self.body, self.shape)
+            self.in_space = True
 
-        # Create the base image for rendering, preserving an original version for rotations.
-        self.original_image = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        self._create_base_image()
-        self.image = self.original_image.copy()
-        self.rect = self.image.get_rect(center=position)
-
-    def _create_base_image(self):
+    def reset(self, position):
         """
-        Creates the original (non-rotated) image for the triangle sprite.
+        Puts the player back into its initial state for a new match, keeping body and shape.
+        
+        Restores health, timers and counters, moves the body to the given position
+        with zero velocity and adds it back to the physics space if it was destroyed.
         
-        The image is created on a transparent surface taking into account rotation.
-        Also draws a small white circle at the tip as an indicator.
+        Args:
+            position (tuple): New (x, y) position.
         """
-        size = int(self.radius * 2 * 1.5)  # Safety factor for rotations
-        self.original_image = pygame.Surface((size, size), pygame.SRCALPHA)
-        self.original_image.fill((0, 0, 0, 0))  # Transparent background
-
-        # Calculate triangle points relative to the center of the surface.
-        center_x, center_y = size // 2, size // 2
-        points = [
-            (center_x + self.radius * math.cos(math.radians(deg)),
-             center_y - self.radius * math.sin(math.radians(deg)))
-            for deg in [0, 120, 240]
-        ]
-        pygame.draw.polygon(self.original_image, self.color, points)
-
-        # Draw an indicator at the tip (at 0°)
-        tip_x = center_x + self.radius * math.cos(math.radians(0))
-        tip_y = center_y - self.radius * math.sin(math.radians(0))
-        indicator_color = (255, 255, 255)  # White indicator
-        indicator_radius = 3
-        pygame.draw.circle(self.original_image, indicator_color, (int(tip_x), int(tip_y)), indicator_radius)
+        self.health = PLAYER_START_HEALTH
+        self.spawn_protection_until = -1
+        self.collisions = 0
+        self.lifetime = self._now()
+        self.ready = False
+        if hasattr(self, "shots_fired"):
+            del self.shots_fired
+
+        self.body.position = position
+        self.body.angle = 0
+        self.body.velocity = (0, 0)
+        self.body.angular_velocity = 0
+        self.body.force = (0, 0)
+        self.body.torque = 0
+        if self.game_world:
+            if self.in_space:
+                self.game_world.space.reindex_shapes_for_body(self.body)
+            else:
+                self.game_world.space.add(self.body, self.shape)
+                self.in_space = True
+
+    def _now(self):
+        """
+        Returns the current time from the game world's clock (wall clock without a world).
+        """
+        return self.game_world.clock() if self.game_world else time.time()
 
     def update(self, dt):
         """
-        Updates the Triangle sprite's position, rotation, and visual effects.
-        Also ensures the player's speed does not exceed PLAYER_MAX_SPEED.
+        Ensures the player's speed does not exceed PLAYER_MAX_SPEED.
         
         Args:
             dt (float): Delta time since the last update.
@@ -103,25 +107,19 @@ class Triangle(pygame.sprite.Sprite):
             scale = PLAYER_MAX_SPEED / speed
             self.body.velocity = self.body.velocity * scale
 
-        # Update position and rotation
-        pos = self.body.position
-        self.rect.center = (int(pos.x), int(pos.y))
-        self.angle = math.degrees(self.body.angle)
-        rotated_image = pygame.transform.rotate(self.original_image, -self.angle)
-        self.rect = rotated_image.get_rect(center=self.rect.center)
-        self.image = rotated_image
-
-        # Change transparency if still under spawn protection
-        if not self.ready:
-            self.image.set_alpha(80)
-        elif time.time() < self.spawn_protection_until:
-            # Make alpha pulsate between 64 and 192
-            alpha = 128 + 64 * math.sin(time.time() * 5)  # Pulsate with a frequency of 5 Hz
-            self.image.set_alpha(int(alpha))
-        elif self.ready:
-            self.image.set_alpha(255)
-        else:
-            self.image.set_alpha(255)  # Fully opaque
+    def is_spawn_protected(self, now=None):
+        """
+        Checks whether the player's spawn protection is still active.
+        
+        Args:
+            now (float, optional): Timestamp to compare against. Defaults to the game world's clock.
+        
+        Returns:
+            bool: True while the player cannot take damage.
+        """
+        if now is None:
+            now = self._now()
+        return now < self.spawn_protection_until
 
     def take_damage(self, amount):
         """
@@ -133,53 +131,35 @@ class Triangle(pygame.sprite.Sprite):
         Args:
             amount (int or float): The damage to apply.
         """
-        if time.time() < self.spawn_protection_until:
-            print(f"Player {self.player_id} is spawn protected. Damage ignored.")
+        if self.is_spawn_protected():
+            event_log.log("combat", DEBUG, "Player {} is spawn protected. Damage ignored.", self.player_id)
             return
 
         self.health -= amount
-        print(f"Player {self.player_id} took {amount} damage. Current health: {self.health}")
+        event_log.log("combat", INFO, "Player {} took {} damage. Current health: {}", self.player_id, amount, self.health)
         if self.health <= 0:
-            self.lifetime = time.time() - self.lifetime
-            print(f"Player {self.player_id} destroyed after {self.lifetime:.2f} seconds.")
+            self.lifetime = self._now() - self.lifetime
+            event_log.log("combat", INFO, "Player {} destroyed after {:.2f} seconds.", self.player_id, self.lifetime)
             if self.game_world:
-                if self.body in self.game_world.space.bodies:
-                    self.game_world.space.remove(self.body)
-                if self.shape in self.game_world.space.shapes:
-                    self.game_world.space.remove(self.shape)
-                if self in self.game_world.objects:
-                    self.game_world.objects.remove(self)
+                self.game_world.despawn(self)
 
     def remove_from_world(self):
         """
-        Removes the player from the physics space, game world's object lists,
-        and any sprite groups.
+        Removes the player from the physics space and the game world's object lists.
         """
         if self.game_world:
-            if self.body in self.game_world.space.bodies:
-                self.game_world.space.remove(self.body)
-            if self.shape in self.game_world.space.shapes:
-                self.game_world.space.remove(self.shape)
-            if self in self.game_world.objects:
-                self.game_world.objects.remove(self)
+            self.game_world.despawn(self)
             # Remove from players dictionary.
-            player_id_to_remove = None
-            for pid, player_obj in self.game_world.players.items():
-                if player_obj is self:
-                    player_id_to_remove = pid
-                    break
-            if player_id_to_remove in self.game_world.players:
-                del self.game_world.players[player_id_to_remove]
-                print(f"Player {player_id_to_remove} removed from players dictionary.")
-        self.kill()  # Remove from all pygame sprite groups
-        print("Player sprite killed.")
-
-class CircleObstacle(pygame.sprite.Sprite):
+            if self.game_world.players.get(self.player_id) is self:
+                del self.game_world.players[self.player_id]
+                print(f"Player {self.player_id} removed from players dictionary.")
+
+class CircleObstacle:
     """
     Represents a static circular obstacle that is part of the game arena.
     
-    It is added to the physics space as a static body. It also has a visual representation
-    drawn using pygame.
+    It is added to the physics space as a static body. Its visual representation
+    is drawn by the visualizer.
     """
     def __init__(self, position, radius, color=(128, 128, 128), game_world=None):
         """
@@ -191,7 +171,6 @@ class CircleObstacle(pygame.sprite.Sprite):
             color (tuple): RGB color.
             game_world (GameWorld): Reference to the game world.
         """
-        super().__init__()
         self.color = color
         self.radius = radius
         self.game_world = game_world
@@ -204,22 +183,20 @@ class CircleObstacle(pygame.sprite.Sprite):
         self.shape.sprite_ref = self
         self.shape.elasticity = 0.9     # Makes obstacle bouncy
         self.shape.friction = 0.5
+        self.in_space = False   # True while body and shape are in the physics space
 
         if game_world:
             game_world.space.add(self.body, self.shape)
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, color, (radius, radius), radius)
-        self.rect = self.image.get_rect(center=position)
+            self.in_space = True
 
     def update(self, dt):
         """
-        Updates the obstacle's position in case of external movement.
+        Static obstacles need no per-tick work.
         
         Args:
             dt (float): Delta time since last update.
         """
-        pos = self.body.position
-        self.rect.center = (int(pos.x), int(pos.y))
+        pass
 
     def to_dict(self):
         """
@@ -234,12 +211,13 @@ class CircleObstacle(pygame.sprite.Sprite):
             "radius": self.radius
         }
 
-class Projectile(pygame.sprite.Sprite):
+class Projectile:
     """
     Represents a projectile fired by a player.
     
     The projectile is subject to physics simulation and has a limited lifetime. It is removed
-    from the game world when its lifetime expires or upon collisions.
+    from the game world when its lifetime expires or upon collisions. Projectiles are
+    recycled by the world's ProjectilePool: spawn() puts a removed projectile back into play.
     """
     def __init__(self, position, angle_rad, owner, color, radius=PROJECTILE_RADIUS, speed=PROJECTILE_SPEED, game_world=None):
         """
@@ -254,24 +232,19 @@ class Projectile(pygame.sprite.Sprite):
             speed (int): Speed at which the projectile is fired.
             game_world (GameWorld): Reference to the game world.
         """
-        super().__init__()
         self.color = color
         self.radius = radius
+        self.speed = speed
         self.game_world = game_world
         self.lifetime = PROJECTILE_LIFETIME_SECONDS  # Time before expiration
         self.owner = owner  # The firing player
+        self.active = False     # True while in play; cleared as soon as removal is requested
+        self.in_space = False   # True while body and shape are in the physics space
+        self.generation = 0     # Number of times this projectile has been spawned
 
         mass = 0.1  # Light weight for projectiles
         moment = pymunk.moment_for_circle(mass, 0, radius)
         self.body = pymunk.Body(mass, moment)
-        self.body.position = position
-        self.body.angle = angle_rad
-        
-        # Calculate initial velocity based on the firing angle and speed
-        velocity_x = math.cos(angle_rad) * speed
-        velocity_y = math.sin(angle_rad) * speed
-        self.body.velocity = (velocity_x, velocity_y)
-
         self.shape = pymunk.Circle(self.body, radius)
         self.shape.collision_type = 4  # Collision type for projectiles
         self.shape.sensor = False      # Projectile affects collisions
@@ -281,24 +254,48 @@ class Projectile(pygame.sprite.Sprite):
         # Note: Owner-check in collision handler prevents damage to the firing player.
 
         if game_world:
-            game_world.space.add(self.body, self.shape)
-            game_world.add_object(self)
+            self.spawn(position, angle_rad, owner, color)
+        else:
+            self.body.position = position
+            self.body.angle = angle_rad
 
-        # Create the visual representation
-        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(self.image, self.color, (radius, radius), radius)
-        self.rect = self.image.get_rect(center=position)
+    def spawn(self, position, angle_rad, owner, color):
+        """
+        Puts the projectile into play: resets its state and adds it to the space and the world.
+        
+        Args:
+            position (tuple): Starting (x, y) position.
+            angle_rad (float): Firing angle in radians.
+            owner (Triangle): The player who fired the projectile.
+            color (tuple): Color for the projectile.
+        """
+        self.color = color
+        self.owner = owner
+        self.lifetime = PROJECTILE_LIFETIME_SECONDS
+        self.generation += 1
+
+        self.body.position = position
+        self.body.angle = angle_rad
+        # Calculate initial velocity based on the firing angle and speed
+        velocity_x = math.cos(angle_rad) * self.speed
+        velocity_y = math.sin(angle_rad) * self.speed
+        self.body.velocity = (velocity_x, velocity_y)
+        self.body.angular_velocity = 0
+        self.body.force = (0, 0)
+        self.body.torque = 0
+
+        self.active = True
+        self.game_world.space.add(self.body, self.shape)
+        self.in_space = True
+        self.game_world.add_object(self)
 
     def update(self, dt):
         """
-        Updates the projectile's position and decreases its lifetime.
+        Decreases the projectile's lifetime.
         
         Args:
             dt (float): Delta time since last update.
         """
-        pos = self.body.position
-        self.rect.center = (int(pos.x), int(pos.y))
-        
         # Decrease lifetime and remove if expired.
         self.lifetime -= dt
         if self.lifetime <= 0:
@@ -306,18 +303,14 @@ class Projectile(pygame.sprite.Sprite):
 
     def remove_from_world(self):
         """
-        Removes the projectile from the physics space, game objects list,
-        and all sprite groups.
+        Removes the projectile from the physics space and the game objects list and
+        hands it back to the world's projectile pool (see GameWorld.despawn). Does
+        nothing if it is not in play.
         """
-        if self.game_world:
-            if self.body in self.game_world.space.bodies:
-                self.game_world.space.remove(self.body)
-            if self.shape in self.game_world.space.shapes:
-                self.game_world.space.remove(self.shape)
-            if self in self.game_world.objects:
-                self.game_world.objects.remove(self)
-            self.kill()  # Remove sprite from all groups
-    
+        if self.game_world and self.active:
+            self.active = False
+            self.game_world.despawn(self)
+
 
     def to_dict(self):
         """
@@ -380,9 +373,9 @@ def player_hit_obstacle(arbiter, space, data):
                 player_sprite.take_damage(OBSTACLE_DAMAGE)
                 game_world.player_collisions += 1
                 game_world.score_sys.on_collision(player_sprite.player_id)
-                print(f"Player collided with obstacle at high speed. Health: {player_sprite.health}")
+                event_log.log("collision", INFO, "Player collided with obstacle at high speed. Health: {}", player_sprite.health)
             else:
-                print(f"Player collided with obstacle at low speed. No damage taken.")
+                event_log.log("collision", DEBUG, "Player collided with obstacle at low speed. No damage taken.")
             break  # Nur einmal pro Kollision zählen
     return True
 
@@ -412,32 +405,47 @@ def projectile_hit_player(arbiter, space, data):
         projectile = getattr(projectile_shape, 'sprite_ref', None)
         player = getattr(player_shape, 'sprite_ref', None)
         if not isinstance(projectile, Projectile) or not isinstance(player, Triangle):
-            print("Collision 4-1: Invalid shapes found.")
+            event_log.log("collision", WARNING, "Collision 4-1: Invalid shapes found.")
             return False
 
+    # A projectile removed earlier in this step (e.g. it already hit a player) does no more damage.
+    if not projectile.active:
+        return False
+
     # Prevent self-hit if friendly fire is disabled.
     if not ALLOW_FRIENDLY_FIRE and projectile.owner is player:
-        print("Friendly fire disabled, ignoring hit.")
+        event_log.log("combat", DEBUG, "Friendly fire disabled, ignoring hit.")
         return False
 
-    print(f"Player hit by projectile! Applying {PROJECTILE_DAMAGE} damage.")
+    apply_projectile_hit(game_world, projectile.owner, player)
+    projectile.remove_from_world()
+    return True
+
+def apply_projectile_hit(game_world, shooter, player):
+    """
+    Applies the damage and score events of a projectile hitting a player.
+    
+    Shared by the Pymunk collision handler and the bullet engine.
+    
+    Args:
+        game_world (GameWorld): The world whose score system is updated (may be None).
+        shooter (Triangle): The player who fired the projectile.
+        player (Triangle): The player who was hit.
+    """
+    event_log.log("combat", INFO, "Player hit by projectile! Applying {} damage.", PROJECTILE_DAMAGE)
     player.take_damage(PROJECTILE_DAMAGE)
     # Points for hitting a player
-    if game_world and projectile.owner and hasattr(projectile.owner, "player_id"):
-        shooter_id = projectile.owner.player_id
-        game_world.score_sys.on_hit(shooter_id)
+    if game_world and shooter and hasattr(shooter, "player_id"):
+        game_world.score_sys.on_hit(shooter.player_id)
     # Points for killing a player
-    if player.health <= 0 and game_world and projectile.owner and hasattr(projectile.owner, "player_id"):
-        killer_id = projectile.owner.player_id
-        game_world.score_sys.on_kill(killer_id)
-    projectile.remove_from_world()
-    return True
+    if player.health <= 0 and game_world and shooter and hasattr(shooter, "player_id"):
+        game_world.score_sys.on_kill(shooter.player_id)
 
 def projectile_hit_obstacle(arbiter, space, data):
     """
     Handles collision between a projectile and an obstacle.
     
-    Prints a debug message and allows pymunk to resolve the collision by bouncing.
+    Logs a debug event and allows pymunk to resolve the collision by bouncing.
     
     Args:
         arbiter (pymunk.Arbiter): Contains collision shapes.
@@ -448,7 +456,7 @@ def projectile_hit_obstacle(arbiter, space, data):
         bool: True to allow normal collision resolution.
     """
     projectile_shape, obstacle_shape = arbiter.shapes
-    print("Projectile hit obstacle - bouncing off.")
+    event_log.log("collision", DEBUG, "Projectile hit obstacle - bouncing off.")
     return True
 
 def projectile_hit_border(arbiter, space, data):
@@ -1,17 +1,31 @@
 import pymunk
-import pygame
+import pymunk.batch
 import threading
-import asyncio
 import uuid
 import math
 import random
 import time
 import os
 import csv
-import matplotlib.pyplot as plt
+import hashlib
+import traceback
+from collections import deque
+from concurrent.futures import Future
 from .game_objects import *
 from ..settings import *
 from .score_system import ScoreSystem
+from .scheduler import FixedTimestepScheduler
+from .input_buffer import InputBuffer
+from .input_log import InputLog
+from .recording import MatchRecorder
+from .spatial_index import UniformGrid
+from .scan_stage import ScanStage
+from .snapshot import WorldSnapshot, StaticLayout, read_bodies
+from .projectile_pool import ProjectilePool
+from .bullet_engine import BulletEngine, BulletView, nearby_bullets
+from .distance_field import StaticDistanceField
+from .spawn_planner import SpawnPlanner
+from .event_log import event_log, DEBUG, INFO
 from ..settings      import SCORE_CONFIG, MAX_GAME_DURATION
 
 
@@ -33,28 +47,64 @@ class GameWorld:
     """
     The GameWorld class encapsulates the entire state of the game.
     
-    It manages the physics simulation (using pymunk), rendering (using pygame), 
-    players, obstacles, projectiles, and power-ups. It also provides methods to 
-    add/remove players/objects, update the simulation, and run the visualizer.
+    It manages the physics simulation (using pymunk), players, obstacles, projectiles,
+    and power-ups. It also provides methods to add/remove players/objects, update the
+    simulation, and run the visualizer. The world itself is headless: it creates no
+    pygame surfaces, rendering is a separate layer that reads the world's state.
     """
-    def __init__(self, width, height):
+    def __init__(self, width, height, clock=None, write_stats=True, seed=None):
         """
         Initializes the GameWorld instance.
         
         Args:
             width (int): Width of the game world (and visualization screen).
             height (int): Height of the game world.
+            clock (callable, optional): Returns the current time in seconds. Defaults to
+                time.time, or to the tick clock (simulation_time) if a seed is given;
+                pass a SimulationClock to run faster than real time.
+            write_stats (bool): If True, statistics (CSV/plots) are written on restart.
+            seed (int, optional): Makes the world deterministic: its random generators are
+                seeded, time is counted in ticks and all inputs are recorded in an InputLog.
         """
         self.width = width
         self.height = height
+        self.seed = seed
+        self.tick = 0               # Number of completed physics updates
+        self.sim_time = 0.0         # Simulated seconds (sum of all update dt values)
+        if clock is None:
+            clock = self.simulation_time if seed is not None else time.time
+        self.clock = clock
+        # Separate generators: sensor noise depends on when agents scan, which must not
+        # change the simulation itself (e.g. spawn positions).
+        self.rng = random.Random(seed)
+        self.sensor_rng = random.Random(None if seed is None else seed + 1)
+        self.input_log = InputLog(seed) if seed is not None else None
+        self.write_stats = write_stats
+        self.matches_played = 0     # Number of matches that ended via restart_game()
+        self.last_match_scores = {} # Final scores {player_id: score} of the last ended match
         self.space = pymunk.Space()
         self.space.gravity = (0, 0)
-        self.objects = []    # List of non-player objects (obstacles, projectiles, power-ups, etc.)
+        self.objects = {}    # Non-player objects (obstacles, projectiles, power-ups, etc.); dict used as ordered set
         self.players = {}    # Dictionary mapping player IDs to player objects
+        # Typed registries over self.objects, so per-tick work only visits entities that need it.
+        # Like self.objects they map entity -> None, so membership and removal are O(1).
+        self.static_objects = {}    # Obstacles; never updated per tick
+        self.live_projectiles = {}  # Projectiles in flight
+        self.dynamic_objects = {}   # Other non-player objects with per-tick work (e.g. power-ups)
+        self._stepping = False      # True during space.step(); removals are deferred meanwhile
+        self._pending_removals = {} # Entities despawned during space.step(), flushed right after it
+        # NumPy bullets replacing Pymunk projectiles (None: projectiles are Pymunk bodies)
+        self.bullet_engine = BulletEngine(width, height) if BULLET_ENGINE else None
+        self.projectile_pool = ProjectilePool(self, 0 if BULLET_ENGINE else PROJECTILE_POOL_SIZE)
         self.shot_count = 0  # Total number of shots fired
         self.player_collisions = 0  # Counter for collisions involving players
-        self._physics_task = None   # Holds the asyncio task for the physics loop
+        self._physics_thread = None # Thread running the physics loop
+        self._commands = deque()    # Commands from other threads, applied at the start of each tick
+        self.input_buffer = InputBuffer()  # Movement commands, merged and applied once per tick
+        self.recorder = None        # MatchRecorder while the current match is being recorded
+        self.scheduler = None       # FixedTimestepScheduler driving update() while the physics loop runs
         self.is_running = False     # Flag indicating whether the physics loop is active
+        self.physics_error = None   # Exception that stopped the physics loop, if any
         self.next_color_index = 0   # Index to select the next player color from PLAYER_COLORS
         self.game_started = False # Flag indicating whether the game has started
         self.waiting_for_players = True # Flag indicating whether the game is waiting for players to join
@@ -63,16 +113,38 @@ class GameWorld:
         self.countdown_active = False
         self.countdown_seconds_remaining = 0.0
 
+        self.borders = []           # Border segments (kept so scans do not walk all shapes)
+        self.static_index = UniformGrid(SPATIAL_CELL_SIZE)   # Obstacles, rebuilt when the layout changes
+        self.dynamic_index = UniformGrid(SPATIAL_CELL_SIZE)  # Players and projectiles, see current_dynamic_index()
+        self._dynamic_index_tick = -1  # Tick the dynamic index was built for
+        self.distance_field = StaticDistanceField(width, height)  # Distance to obstacles and borders
+        # Spawn candidates; the clearance is the circle around a player's triangle
+        # (tip at 15 px, back corners at 15*sqrt(2) px).
+        self.spawn_planner = SpawnPlanner(self.distance_field, 15 * math.sqrt(2), None if seed is None else seed + 3)
+        # Vectorized scans of all players, computed once per tick (None: per-request scans)
+        self.scan_stage = ScanStage(None if seed is None else seed + 2) if VECTORIZED_SCAN else None
+        self.snapshot = None        # WorldSnapshot of the last completed tick, read by the API and the visualizer
+        self.static_layout = StaticLayout([])  # Obstacle data shared by all snapshots, rebuilt with the static index
+        self._body_buffer = pymunk.batch.Buffer()  # Reused by read_bodies()
+        self.tick_listeners = []    # Callables invoked with the new tick after every update (on the physics thread)
+
         self.add_borders()  # Create and add border segments to the physics space
         self.initialize_world_objects() # *** HINDERNISSE SOFORT INITIALISIEREN ***
         self.initialize_collision_handlers() # Kollisionshandler auch früh initialisieren
 
-    def add_player(self, given_player_id=None, agent_name=None):
+    def add_player(self, given_player_id=None, agent_name=None, spawn_position=None):
         """
         Creates and adds a new player to the game.
         
-        Attempts to find a safe spawn position (without collisions).
-        If given_player_id is provided, it is used; otherwise, a new UUID is generated.
+        Spawns at the arena center if it is free, otherwise at a free candidate of the
+        spawn planner. If given_player_id is provided, it is used; otherwise, a new
+        UUID is generated.
+        
+        Args:
+            given_player_id (str, optional): ID to use for the player.
+            agent_name (str, optional): Display name of the agent.
+            spawn_position (tuple, optional): Position already allocated by the spawn
+                planner (see add_players()); skips the search.
         
         Returns:
             str or None: The player's unique ID if spawn is successful; otherwise, None.
@@ -81,41 +153,22 @@ class GameWorld:
             print("Game has already started. No new players can join.")
             return None
 
-        player_id = given_player_id if given_player_id is not None else str(uuid.uuid4())
-        max_attempts = 10
-        safe_spawn_pos = None
-        player_radius = 15
-
-        for attempt in range(max_attempts):
-            if attempt == 0:
-                potential_pos = pymunk.Vec2d(self.width / 2, self.height / 2)
+        if given_player_id is not None:
+            player_id = given_player_id
+        elif self.seed is not None:
+            player_id = str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        else:
+            player_id = str(uuid.uuid4())
+        if spawn_position is not None:
+            safe_spawn_pos = pymunk.Vec2d(*spawn_position)
+        else:
+            occupied = [p.body.position for p in self.players.values() if p.in_space]
+            center = pymunk.Vec2d(self.width / 2, self.height / 2)
+            if self.spawn_planner.is_free(center, occupied):
+                safe_spawn_pos = center
             else:
-                pad = player_radius + 10
-                potential_pos = pymunk.Vec2d(
-                    random.uniform(pad, self.width - pad),
-                    random.uniform(pad, self.height - pad)
-                )
-
-            temp_body = pymunk.Body(body_type=pymunk.Body.KINEMATIC)
-            temp_body.position = potential_pos
-            temp_shape = pymunk.Poly(temp_body, [
-                (player_radius, 0),
-                (-player_radius, player_radius),
-                (-player_radius, -player_radius)
-            ])
-            temp_shape.collision_type = 1
-
-            collision_found = False
-            for info in self.space.shape_query(temp_shape):
-                if info.shape and info.shape.collision_type in [1, 2]:
-                    collision_found = True
-                    print(f"Spawn attempt {attempt+1} at {potential_pos} failed due to collision.")
-                    break
-
-            if not collision_found:
-                safe_spawn_pos = potential_pos
-                print(f"Spawn attempt {attempt+1}: Safe position at {safe_spawn_pos} found.")
-                break
+                positions = self.spawn_planner.allocate(1, occupied)
+                safe_spawn_pos = pymunk.Vec2d(*positions[0]) if positions else None
 
         if safe_spawn_pos:
             player_color = PLAYER_COLORS[self.next_color_index % len(PLAYER_COLORS)]
@@ -129,8 +182,32 @@ class GameWorld:
             print(f"Player added with ID: {player_id} (Name: {getattr(new_player, 'agent_name', player_id[:6])}) at {safe_spawn_pos} with color {player_color}.")
             return player_id
         else:
-            print(f"Error: No safe spawn position found after {max_attempts} attempts.")
+            print("Error: No safe spawn position found (arena full).")
             return None
+
+    def add_players(self, agent_names):
+        """
+        Adds several players, allocating all spawn positions in one planner call.
+        
+        Args:
+            agent_names (list): Display name (or None) for each new player.
+        
+        Returns:
+            list: The new player IDs, None for players that could not be spawned.
+        """
+        if self.game_started:
+            print("Game has already started. No new players can join.")
+            return [None] * len(agent_names)
+        occupied = [p.body.position for p in self.players.values() if p.in_space]
+        positions = self.spawn_planner.allocate(len(agent_names), occupied)
+        player_ids = []
+        for index, agent_name in enumerate(agent_names):
+            if index < len(positions):
+                player_ids.append(self.add_player(agent_name=agent_name, spawn_position=positions[index]))
+            else:
+                print("Error: No safe spawn position found (arena full).")
+                player_ids.append(None)
+        return player_ids
         
         
 
@@ -155,11 +232,74 @@ class GameWorld:
         """
         Adds a game object (obstacle, projectile, power-up, etc.) to the world.
         
+        The object is also added to the typed registry of its kind.
+        
         Args:
             obj: The game object to add.
         """
         if obj not in self.objects:
-            self.objects.append(obj)
+            self.objects[obj] = None
+            self._registry_for(obj)[obj] = None
+
+    def remove_object(self, obj):
+        """
+        Removes a game object from the world's object list and its typed registry.
+        
+        Does not touch the physics space; see despawn().
+        
+        Args:
+            obj: The game object to remove.
+        """
+        if obj in self.objects:
+            del self.objects[obj]
+            del self._registry_for(obj)[obj]
+
+    def despawn(self, entity):
+        """
+        Removes an entity from the physics space and the world's object registries.
+        
+        During space.step() (i.e. from collision handlers) the removal is queued and
+        done by flush_removals() right after the step. Removed projectiles are handed
+        back to the projectile pool. Players stay in self.players; see
+        Triangle.remove_from_world().
+        
+        Args:
+            entity: A player, obstacle or projectile.
+        """
+        if self._stepping:
+            self._pending_removals[entity] = None
+            return
+        if entity.in_space:
+            self.space.remove(entity.body, entity.shape)
+            entity.in_space = False
+        self.remove_object(entity)
+        if isinstance(entity, Projectile) and self.projectile_pool is not None:
+            self.projectile_pool.release(entity)
+
+    def flush_removals(self):
+        """
+        Despawns the entities queued during the last space.step().
+        """
+        pending = self._pending_removals
+        self._pending_removals = {}
+        for entity in pending:
+            self.despawn(entity)
+
+    def _registry_for(self, obj):
+        """
+        Returns the typed registry an object belongs to.
+        
+        Args:
+            obj: A non-player game object.
+        
+        Returns:
+            dict: static_objects, live_projectiles or dynamic_objects.
+        """
+        if isinstance(obj, CircleObstacle):
+            return self.static_objects
+        if isinstance(obj, Projectile):
+            return self.live_projectiles
+        return self.dynamic_objects
 
     def add_borders(self):
         """
@@ -179,6 +319,7 @@ class GameWorld:
             border.friction = 0.0
             border.collision_type = 3  # Collision type for borders
             self.space.add(border)
+            self.borders.append(border)
 
     def initialize_world_objects(self):
         """Initializes obstacles. Called early.""" # Geändert: Wird jetzt früh aufgerufen
@@ -186,7 +327,7 @@ class GameWorld:
         # aus irgendeinem Grund mehrmals aufgerufen werden könnte.
         # Da es jetzt im __init__ ist, ist die "if not self.objects" Bedingung
         # für Hindernisse nicht mehr so kritisch, aber schadet nicht.
-        existing_obstacle_count = sum(1 for obj in self.objects if isinstance(obj, CircleObstacle))
+        existing_obstacle_count = len(self.static_objects)
         if existing_obstacle_count == 0:
             arena_obstacles = [
                 CircleObstacle([150, 150], 40, game_world=self),
@@ -200,10 +341,70 @@ class GameWorld:
             ]
             for obstacle in arena_obstacles:
                 self.add_object(obstacle)
+            self.rebuild_static_index()
             print("Game world objects (obstacles) initialized.")
         else:
             print("Obstacles already initialized.")
 
+    def rebuild_static_index(self):
+        """
+        Rebuilds the spatial grid of the static obstacles and, if the layout changed,
+        the static distance field. Call after changing the layout.
+        """
+        index = UniformGrid(SPATIAL_CELL_SIZE)
+        for obstacle in self.obstacles():
+            index.insert(obstacle, obstacle.body.position, obstacle.radius)
+        self.static_index = index
+        self.static_layout = StaticLayout(self.obstacles())
+        if self.distance_field.build(self.obstacles()):
+            self.spawn_planner.rebuild()
+            print(f"Static distance field computed ({len(self.spawn_planner.candidates)} spawn candidates).")
+        if self.bullet_engine is not None:
+            self.bullet_engine.set_obstacles(self.obstacles())
+
+    def rebuild_dynamic_index(self):
+        """
+        Rebuilds the spatial grid of players and projectiles from their current positions.
+        
+        The new grid replaces the old one in a single assignment, so scans never see a
+        half-built grid.
+        
+        Returns:
+            UniformGrid: The new grid.
+        """
+        tick = self.tick
+        index = UniformGrid(SPATIAL_CELL_SIZE)
+        for player in list(self.players.values()):
+            index.insert(player, player.body.position, player.radius)
+        for projectile in self.projectiles():
+            index.insert(projectile, projectile.body.position, projectile.radius)
+        self.dynamic_index = index
+        self._dynamic_index_tick = tick
+        return index
+
+    def read_bodies(self):
+        """
+        Copies the state of all bodies in the space with one pymunk.batch call.
+        
+        Returns:
+            tuple: (ids, values): Body IDs and an (n, 5) array of x, y, angle, vx, vy.
+        """
+        return read_bodies(self.space, self._body_buffer)
+
+    def current_dynamic_index(self):
+        """
+        Returns the spatial grid of players and projectiles for the current tick.
+        
+        Only the per-request scan fallback queries this grid, so it is rebuilt by the
+        first query of a tick instead of after every tick.
+        
+        Returns:
+            UniformGrid: The grid of the current tick.
+        """
+        if self._dynamic_index_tick != self.tick:
+            return self.rebuild_dynamic_index()
+        return self.dynamic_index
+
     def initialize_collision_handlers(self):
         """Initializes collision handlers. Can be called early."""
         from .game_objects import setup_collision_handlers
@@ -231,7 +432,7 @@ class GameWorld:
             self.countdown_seconds_remaining = COUNTDOWN_DURATION
             self.waiting_for_players = False # Wechsel in den Countdown-Modus
             for player in self.players.values():
-                player.spawn_protection_until = time.time() + player.spawn_protection_duration + COUNTDOWN_DURATION
+                player.spawn_protection_until = self.clock() + player.spawn_protection_duration + COUNTDOWN_DURATION
         elif not all_currently_ready and self.countdown_active:
             # Jemand wurde während des Countdowns unready (z.B. Disconnect)
             print("Not all players ready during countdown. Resetting to waiting state.")
@@ -265,15 +466,14 @@ class GameWorld:
         """
         Applies a forward thrust to the specified player.
         
+        The command is buffered and applied at the next tick (see apply_player_inputs).
+        It is safe to call from any thread.
+        
         Args:
             player_id (str): The identifier of the player.
         """
         if not self.game_started: return # Spiel noch nicht gestartet
-        player = self.players.get(player_id)
-        if player:
-            radians = player.body.angle
-            thrust_vector = pygame.math.Vector2(1, 0).rotate_rad(radians) * PLAYER_THRUST
-            player.body.velocity += thrust_vector
+        self.input_buffer.add(player_id, thrust=1)
 
     def negative_player_thrust(self, player_id):
         """
@@ -283,11 +483,7 @@ class GameWorld:
             player_id (str): The identifier of the player.
         """
         if not self.game_started: return
-        player = self.players.get(player_id)
-        if player:
-            radians = player.body.angle
-            thrust_vector = pygame.math.Vector2(1, 0).rotate_rad(radians) * (-PLAYER_THRUST)
-            player.body.velocity += thrust_vector
+        self.input_buffer.add(player_id, thrust=-1)
 
     def right_player_rotation(self, player_id):
         """
@@ -297,9 +493,7 @@ class GameWorld:
             player_id (str): The identifier of the player.
         """
         if not self.game_started: return
-        player = self.players.get(player_id)
-        if player:
-            player.body.angular_velocity += PLAYER_ROTATION
+        self.input_buffer.add(player_id, rotation=1)
 
     def left_player_rotation(self, player_id):
         """
@@ -309,9 +503,23 @@ class GameWorld:
             player_id (str): The identifier of the player.
         """
         if not self.game_started: return
-        player = self.players.get(player_id)
-        if player:
-            player.body.angular_velocity -= PLAYER_ROTATION
+        self.input_buffer.add(player_id, rotation=-1)
+
+    def apply_player_inputs(self):
+        """
+        Applies the merged movement commands of this tick: one velocity and one
+        angular velocity change per player, however many commands were sent.
+        """
+        for player_id, (thrust_steps, rotation_steps) in self.input_buffer.collect().items():
+            player = self.players.get(player_id)
+            if player is None:
+                continue
+            if self.input_log is not None:
+                self.input_log.record(self.tick, "move", (player_id, thrust_steps, rotation_steps))
+            if thrust_steps:
+                player.body.velocity += pymunk.Vec2d(PLAYER_THRUST * thrust_steps, 0).rotated(player.body.angle)
+            if rotation_steps:
+                player.body.angular_velocity += PLAYER_ROTATION * rotation_steps
 
     def shoot(self, player_id):
         """
@@ -321,16 +529,19 @@ class GameWorld:
         
         Args:
             player_id (str): The identifier of the player who is firing.
+        
+        Returns:
+            bool: True if a projectile was fired.
         """
         if not self.game_started:
-            print(f"Player {player_id} tried to shoot, but game has not started.")
-            return
+            event_log.log("shot", INFO, "Player {} tried to shoot, but game has not started.", player_id)
+            return False
         player = self.players.get(player_id)
         if player:
             # Prevent shooting when spawn protection is active.
-            if time.time() < player.spawn_protection_until:
-                print(f"Player {player_id} cannot shoot during spawn protection.")
-                return
+            if player.is_spawn_protected():
+                event_log.log("shot", INFO, "Player {} cannot shoot during spawn protection.", player_id)
+                return False
             
             # --- Count shots per player ---
             if hasattr(player, "shots_fired"):
@@ -344,17 +555,62 @@ class GameWorld:
             start_offset_y = math.sin(player_angle_rad) * offset_distance
             start_pos = player.body.position + pymunk.Vec2d(start_offset_x, start_offset_y)
 
-            # Use the player's color for the projectile.
-            projectile = Projectile(
-                position=start_pos,
-                angle_rad=player.body.angle,
-                owner=player,
-                color=player.color,
-                game_world=self
-            )
+            if self.bullet_engine is not None:
+                self.bullet_engine.spawn(start_pos, player.body.angle, player)
+            else:
+                # Use the player's color for the projectile (recycled from the pool if possible).
+                self.projectile_pool.acquire(start_pos, player.body.angle, player, player.color)
             self.increment_shot_count()
-            print(f"Shot fired by {player_id}! Total shots: {self.shot_count}")
+            event_log.log("shot", DEBUG, "Shot fired by {}! Total shots: {}", player_id, self.shot_count)
             self.score_sys.on_shot(player_id) # Register shot in the score system
+            return True
+        return False
+
+    def apply_actions(self, player_id, actions):
+        """
+        Applies a batch of actions of one player at the same tick boundary.
+        
+        Meant to be submitted as a single command, so the whole batch runs on the
+        physics thread between two ticks. Movement goes through the input buffer like
+        single commands; repetitions beyond its per-tick caps (counting the movement
+        already pending for this tick) are dropped and not counted as applied. Shots
+        are submitted one by one, so the input log records them for replays.
+        
+        Args:
+            player_id (str): The identifier of the player.
+            actions (list): (action, count) pairs in order; action is "thrust_forward",
+                "thrust_backward", "rotate_left", "rotate_right" or "shoot".
+        
+        Returns:
+            list: Number of applied repetitions for each pair.
+        """
+        movements = {
+            "thrust_forward": (1, 0),
+            "thrust_backward": (-1, 0),
+            "rotate_right": (0, 1),
+            "rotate_left": (0, -1),
+        }
+        buffer = self.input_buffer
+        thrust_steps, rotation_steps = buffer.pending_steps(player_id)
+        applied = []
+        for action, count in actions:
+            if action == "shoot":
+                applied.append(sum(1 for _ in range(count) if self.submit(self.shoot, player_id).result()))
+            elif self.game_started and player_id in self.players:
+                thrust, rotation = movements[action]
+                # Only the steps up to the cap in this direction take effect this tick.
+                if thrust:
+                    count = max(0, min(count, buffer.max_thrust_steps - thrust * thrust_steps))
+                    thrust_steps += thrust * count
+                else:
+                    count = max(0, min(count, buffer.max_rotation_steps - rotation * rotation_steps))
+                    rotation_steps += rotation * count
+                for _ in range(count):
+                    buffer.add(player_id, thrust, rotation)
+                applied.append(count)
+            else:
+                applied.append(0)
+        return applied
 
     def increment_shot_count(self):
         """
@@ -366,28 +622,70 @@ class GameWorld:
         """
         Updates the physics simulation and game objects.
         
-        Steps the physics engine, updates angular velocities, and calls each object's update method.
+        Applies queued commands, steps the physics engine, updates angular velocities,
+        calls each object's update method, advances the tick counter, publishes
+        the snapshot of the new tick and notifies the tick listeners.
         
         Args:
             dt (float): Delta time since the last update.
         """
+        self._drain_commands()
+        self._advance(dt)
+        self.tick += 1
+        self.sim_time += dt
+        if self.input_log is not None:
+            self.input_log.end_tick = self.tick
+        self.snapshot = WorldSnapshot(self)
+        if self.recorder is not None:
+            self.recorder.capture(self, dt)
+        for listener in self.tick_listeners:
+            listener(self.tick)
+
+    def simulation_time(self):
+        """
+        Tick clock: simulated seconds since the world was created.
+        
+        Returns:
+            float: Sum of the dt of all completed updates.
+        """
+        return self.sim_time
 
+    def _advance(self, dt):
+        """
+        Runs one tick of game logic and physics (see update()).
+        
+        Args:
+            dt (float): Delta time since the last update.
+        """
         if self.game_started:
             if not hasattr(self, "start_time"):
-                self.start_time = time.time()
-            elif time.time() - self.start_time > MAX_GAME_DURATION:
+                self.start_time = self.clock()
+            elif self.clock() - self.start_time > MAX_GAME_DURATION:
                 # Maximale Spielzeit erreicht: Restleben bestrafen und Spiel neu starten
                 remaining = {pid: p.health for pid, p in self.players.items()}
                 self.score_sys.on_game_end(remaining)
                 self.restart_game()
                 return  # Early-exit, damit nicht mehr weiter upgedatet wird
+            self.apply_player_inputs()  # Merged movement commands of this tick
     
-        self.space.step(dt)
+        self._stepping = True
+        try:
+            self.space.step(dt)
+        finally:
+            self._stepping = False
+        self.flush_removals()
+        if self.bullet_engine is not None:
+            self.bullet_engine.step(self, dt)
         for player in self.players.values():
             player.body.angular_velocity *= 1 - 0.1 * PHYSICS_DT
-        for shape in self.space.shapes:
-            if hasattr(shape, "sprite_ref"):
-                shape.sprite_ref.update(dt)
+            if player.health > 0:  # Destroyed players are no longer simulated
+                player.update(dt)
+        # Static obstacles and borders need no per-tick work. Copies, since
+        # expiring projectiles remove themselves.
+        for projectile in list(self.live_projectiles):
+            projectile.update(dt)
+        for obj in list(self.dynamic_objects):
+            obj.update(dt)
 
         # Countdown-Logik
         if self.countdown_active:
@@ -400,9 +698,11 @@ class GameWorld:
                     self.waiting_for_players = False
                     self.game_started = True
                     self.countdown_active = False
-                    self.start_time = time.time()
+                    self.start_time = self.clock()
                     for player in self.players.values():
                         player.lifetime = self.start_time
+                    if RECORD_MATCHES:
+                        self.start_recording()
                 else:
                     print("Not all players ready after countdown (or no players left). Resetting to waiting state.")
                     self.countdown_active = False
@@ -419,65 +719,189 @@ class GameWorld:
             self.player_collisions = 0
             self.next_color_index = 0
 
-    async def _run_physics_loop(self, dt):
+    def submit(self, func, *args):
+        """
+        Queues a call to be executed by the physics thread at the next tick boundary.
+        
+        Request handlers must not touch pymunk bodies directly while the physics thread
+        is stepping the space. They submit commands instead; update() drains the queue
+        once per tick before stepping. deque.append/popleft are atomic, so no lock is
+        needed. If the physics loop is not running, the call is executed right away.
+        
+        Args:
+            func (callable): Usually a GameWorld method, e.g. self.shoot.
+            *args: Arguments for func.
+        
+        Returns:
+            concurrent.futures.Future: Resolves to func's return value (or exception). Fails
+            right away if the physics loop was stopped by an error.
+        """
+        future = Future()
+        if self.physics_error is not None:
+            future.set_exception(RuntimeError(f"Physics loop stopped by an error: {self.physics_error!r}"))
+        elif not self.is_running or threading.current_thread() is self._physics_thread:
+            self._execute_command(func, args, future)
+        else:
+            self._commands.append((func, args, future))
+        return future
+
+    def _execute_command(self, func, args, future):
+        if self.input_log is not None:
+            self.input_log.record(self.tick, func.__name__, args)
+        try:
+            future.set_result(func(*args))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _drain_commands(self):
+        """
+        Executes the commands queued by submit() (only those present when the tick starts).
+        """
+        for _ in range(len(self._commands)):
+            func, args, future = self._commands.popleft()
+            self._execute_command(func, args, future)
+
+    def _run_physics_loop(self, dt):
         """
-        Runs the continuous physics simulation loop asynchronously.
+        Runs the continuous physics simulation loop in the physics thread.
         
-        This method is intended to be run as an asyncio task. It repeatedly calls update()
-        and then sleeps for the given delta time.
+        A FixedTimestepScheduler calls update() on fixed deadlines (not "update, then
+        sleep dt"), so the cost of an update does not slow the simulation down, and
+        records per-tick statistics. Running in its own thread keeps the tick timing
+        independent of the HTTP load on the server's event loop.
         
         Args:
             dt (float): Delta time between physics updates.
         """
-        while self.is_running:
-            self.update(dt)
-            await asyncio.sleep(dt)
+        self.scheduler = FixedTimestepScheduler(self.update, dt)
+        try:
+            self.scheduler.run(lambda: self.is_running)
+        except Exception as e:
+            # The world may be half-updated, so the loop is not resumed. Queued and new
+            # commands fail instead of waiting for a tick that never comes.
+            print(f"Physics loop stopped by an error: {e!r}")
+            traceback.print_exc()
+            self.physics_error = e
+            self.is_running = False
+            error = RuntimeError(f"Physics loop stopped by an error: {e!r}")
+            for _ in range(len(self._commands)):
+                _, _, future = self._commands.popleft()
+                future.set_exception(error)
 
-    def start_physics_engine(self, dt=PHYSICS_DT):
+    def start_recording(self, path=None):
         """
-        Starts the physics engine in an asynchronous loop.
+        Starts recording the per-tick state of all moving entities.
         
-        Attempts to retrieve the current event loop or creates a new one if necessary 
-        (running it in a separate daemon thread). Schedules the physics loop as a task.
+        Args:
+            path (str, optional): Target file. Defaults to a new file in RECORDING_DIR.
+        
+        Returns:
+            str: Path of the recording.
+        """
+        self.stop_recording()
+        if path is None:
+            path = os.path.join(RECORDING_DIR, f"match_{time.strftime('%Y%m%d-%H%M%S')}_{uuid.uuid4().hex[:8]}.upcrec")
+        self.recorder = MatchRecorder(path, self)
+        print(f"Recording match to {path}")
+        return path
+
+    def stop_recording(self):
+        """
+        Stops the current recording. The file is finished by the writer thread.
+        """
+        if self.recorder is not None:
+            self.recorder.close(wait=False)
+            self.recorder = None
+
+    def obstacles(self):
+        """
+        Returns the static obstacles of the arena.
+        
+        Returns:
+            list: CircleObstacle instances.
+        """
+        return list(self.static_objects)
+
+    def projectiles(self):
+        """
+        Returns the projectiles currently in flight.
+        
+        Returns:
+            list: Projectile instances.
+        """
+        return list(self.live_projectiles)
+
+    def physics_stats(self):
+        """
+        Returns the tick duration and lateness statistics of the running physics loop.
+        
+        Returns:
+            dict or None: See FixedTimestepScheduler.stats(), plus the projectile pool
+            metrics under "projectile_pool", the event log metrics under "event_log" (and
+            "bullets_in_flight" with the bullet engine); None if the loop never ran.
+        """
+        if self.scheduler is None:
+            return None
+        stats = self.scheduler.stats()
+        stats["projectile_pool"] = self.projectile_pool.stats()
+        stats["event_log"] = event_log.stats()
+        if self.bullet_engine is not None:
+            stats["bullets_in_flight"] = self.bullet_engine.count
+        return stats
+
+    def start_physics_engine(self, dt=PHYSICS_DT):
+        """
+        Starts the physics engine in a dedicated daemon thread.
         
         Args:
             dt (float, optional): Delta time between physics updates. Defaults to PHYSICS_DT.
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No running event loop; create a new one and run it in a daemon thread.
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            threading.Thread(target=loop.run_forever, daemon=True).start()
+        if self.is_running:
+            return
+        self.physics_error = None
         self.is_running = True
-        self._physics_task = loop.create_task(self._run_physics_loop(dt))
+        self._physics_thread = threading.Thread(
+            target=self._run_physics_loop, args=(dt,), name="physics", daemon=True
+        )
+        self._physics_thread.start()
 
     def stop_physics_engine(self):
         """
-        Stops the physics engine loop and cancels the associated asyncio task.
+        Stops the physics engine loop and waits for the physics thread to finish.
         """
         if self.is_running:
             self.is_running = False
-            if self._physics_task:
-                self._physics_task.cancel()
-                self._physics_task = None
+            if self._physics_thread and self._physics_thread is not threading.current_thread():
+                self._physics_thread.join(timeout=1.0)
+            self._physics_thread = None
+            # Commands that will never be drained must not leave callers waiting.
+            self._drain_commands()
 
     def restart_game(self):
         """
         Resets the game to its initial state.
         
-        Removes non-player objects and resets global game state variables.
-        For each connected player, it removes the old instance and re-adds a new one using the existing player ID.
+        Ends the match (final scores, statistics), removes all projectiles and resets
+        global game state variables. Players and obstacles are reset in place: the
+        players keep their bodies, shapes, IDs and colors and are moved to new spawn
+        positions with full health.
         """
         print("Restarting game...")
+        self.stop_recording()
 
         remaining = {pid: p.health for pid, p in self.players.items()}
         self.score_sys.on_game_end(remaining)
+        # Keep the final scores: the players are registered again with 0 points below.
+        self.last_match_scores = dict(self.score_sys.scores)
+        self.matches_played += 1
 
         # Show statistics plot before resetting players/objects
-        self.plot_game_statistics()
-        plot_csv_statistics()
+        if self.write_stats:
+            self.plot_game_statistics()
+        if self.write_stats and self.input_log is not None and INPUT_LOG_PATH:
+            os.makedirs(os.path.dirname(INPUT_LOG_PATH) or ".", exist_ok=True)
+            self.input_log.save(INPUT_LOG_PATH)
+            print(f"Input log saved as {INPUT_LOG_PATH}")
 
         # Reset global game state variables.
         self.game_started = False
@@ -486,36 +910,34 @@ class GameWorld:
         self.countdown_seconds_remaining = 0.0
         self.shot_count = 0
         self.player_collisions = 0
-        self.next_color_index = 0
-
-        # Remove all non-player objects (e.g. projectiles, power-ups).
-        objects_to_remove = list(self.objects)
-        for obj in objects_to_remove:
-            if hasattr(obj, 'remove_from_world'):
-                obj.remove_from_world()
-            elif hasattr(obj, 'body') and obj.body in self.space.bodies:
-                self.space.remove(obj.body)
-                if hasattr(obj, 'shape') and obj.shape in self.space.shapes:
-                    self.space.remove(obj.shape)
-        self.objects.clear()
-
-        # Speichere bestehende Spieler (um ihre Eigenschaften ggf. später zu erhalten).
-        old_players = list(self.players.items())
-        self.players.clear()  # Leere die Spielerliste, damit add_player einen neuen Eintrag erstellen kann.
-        for player_id, old_player in old_players:
-            # Entferne alte Player-Ressourcen.
-            old_player.remove_from_world()
-            # Erzeuge einen neuen Spieler mit der alten ID und neuer Spawnposition.
-            new_player_id = self.add_player(given_player_id=player_id)
-            if new_player_id is None:
-                print(f"Failed to respawn player {player_id}.")
+        self.next_color_index = len(self.players)  # Players keep their colors
+        self.input_buffer.clear()
+        if self.bullet_engine is not None:
+            self.bullet_engine.clear()
+
+        # Remove all projectiles and other non-static objects in one sweep. The
+        # obstacles do not change between matches and stay in place.
+        removed = list(self.live_projectiles) + list(self.dynamic_objects)
+        self.space.remove(*[item for obj in removed if obj.in_space for item in (obj.body, obj.shape)])
+        for obj in removed:
+            obj.in_space = False
+            if isinstance(obj, Projectile):
+                obj.active = False
+                self.projectile_pool.release(obj)
+            del self.objects[obj]
+        self.live_projectiles.clear()
+        self.dynamic_objects.clear()
+
+        # Reset the players in place: same bodies and shapes, new positions.
+        positions = self.spawn_planner.allocate(len(self.players))
+        for index, (player_id, player) in enumerate(list(self.players.items())):
+            if index < len(positions):
+                player.reset(positions[index])
+                self.score_sys.register_agent(player_id)
             else:
-                # Optional: Alte Eigenschaften (wie Farbe) beibehalten.
-                self.players[player_id].color = old_player.color
-                print(f"Player {player_id} restarted.")
-
-        # Re-initialisiere statische Weltobjekte (z. B. Hindernisse).
-        self.initialize_world_objects()
+                print(f"Failed to respawn player {player_id}.")
+                player.remove_from_world()
+        print(f"{len(self.players)} players restarted.")
 
         print("Game has been reset to initial state.")
 
@@ -533,6 +955,13 @@ class GameWorld:
         if not player:
             return {"nearby_objects": [], "message": f"Player {player_id} not found."}
 
+        # Served from the vectorized scan of the last snapshot if available.
+        snapshot = self.snapshot
+        if snapshot is not None:
+            result = snapshot.scan(player_id)
+            if result is not None:
+                return result
+
         player_pos = player.body.position
         player_angle_rad = player.body.angle
         player_vel = player.body.velocity
@@ -550,9 +979,23 @@ class GameWorld:
         # Wenn aus settings.py importiert, verwende z.B. POSITION_NOISE_MAX_OFFSET direkt.
 
 
+        # Only entities from grid cells within reach are checked. The grids are replaced
+        # (not modified) when they are rebuilt, so they are safe to read here.
+        reach = radius + player.radius
+        # The distance field tells in O(1) whether any obstacle or border can be in range.
+        max_error = self.distance_field.max_error
+        candidates = []
+        if self.distance_field.obstacle_distance(player_pos) - max_error <= reach:
+            candidates += self.static_index.query(player_pos, reach)
+        candidates += self.current_dynamic_index().query(player_pos, reach)
+        # Bullets are read from the snapshot copies; the engine's arrays change during a tick.
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.bullets is not None:
+            candidates += nearby_bullets(snapshot.bullets, snapshot.bullet_radius, player_pos, reach)
+
         # Process non-player objects (obstacles, projectiles).
-        for obj in self.objects:
-            if obj is player or not hasattr(obj, 'body') or not hasattr(obj, 'radius'): # Sicherstellen, dass obj.radius existiert
+        for obj in candidates:
+            if obj is player or isinstance(obj, Triangle) or not hasattr(obj, 'body') or not hasattr(obj, 'radius'): # Sicherstellen, dass obj.radius existiert
                 continue
 
             obj_pos = obj.body.position
@@ -567,19 +1010,19 @@ class GameWorld:
                 relative_vel_rotated = delta_vel.rotated(-player_angle_rad)
 
                 # --- Rauschen hinzufügen ---
-                noisy_relative_pos_x = relative_pos_rotated.x + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
-                noisy_relative_pos_y = relative_pos_rotated.y + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                noisy_relative_pos_x = relative_pos_rotated.x + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                noisy_relative_pos_y = relative_pos_rotated.y + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
 
-                noisy_relative_vel_x = relative_vel_rotated.x + random.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
-                noisy_relative_vel_y = relative_vel_rotated.y + random.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
+                noisy_relative_vel_x = relative_vel_rotated.x + self.sensor_rng.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
+                noisy_relative_vel_y = relative_vel_rotated.y + self.sensor_rng.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
 
-                noise_factor_distance = 1 + random.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
+                noise_factor_distance = 1 + self.sensor_rng.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
                 noisy_distance = max(0, distance * noise_factor_distance) # Sicherstellen, dass Distanz nicht negativ wird
 
                 obj_type = "unknown"
                 if isinstance(obj, CircleObstacle):
                     obj_type = "obstacle"
-                elif isinstance(obj, Projectile):
+                elif isinstance(obj, (Projectile, BulletView)):
                     obj_type = "projectile"
 
                 if obj_type != "unknown":
@@ -592,8 +1035,8 @@ class GameWorld:
                     })
 
         # Process other players.
-        for other_pid, other_player_obj in self.players.items(): # Variable umbenannt, um Konflikt zu vermeiden
-            if other_pid == player_id:
+        for other_player_obj in candidates: # Variable umbenannt, um Konflikt zu vermeiden
+            if other_player_obj is player or not isinstance(other_player_obj, Triangle):
                 continue
 
             other_player_pos = other_player_obj.body.position
@@ -610,13 +1053,13 @@ class GameWorld:
                 relative_vel_rotated = delta_vel.rotated(-player_angle_rad)
 
                 # --- Rauschen hinzufügen ---
-                noisy_relative_pos_x = relative_pos_rotated.x + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
-                noisy_relative_pos_y = relative_pos_rotated.y + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                noisy_relative_pos_x = relative_pos_rotated.x + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                noisy_relative_pos_y = relative_pos_rotated.y + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
 
-                noisy_relative_vel_x = relative_vel_rotated.x + random.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
-                noisy_relative_vel_y = relative_vel_rotated.y + random.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
+                noisy_relative_vel_x = relative_vel_rotated.x + self.sensor_rng.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
+                noisy_relative_vel_y = relative_vel_rotated.y + self.sensor_rng.uniform(-_VELOCITY_NOISE_MAX_OFFSET, _VELOCITY_NOISE_MAX_OFFSET)
 
-                noise_factor_distance = 1 + random.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
+                noise_factor_distance = 1 + self.sensor_rng.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
                 noisy_distance = max(0, distance * noise_factor_distance)
 
                 nearby_objects_relative.append({
@@ -628,29 +1071,29 @@ class GameWorld:
                 })
 
         # Process borders
-        for shape in self.space.shapes:
-            if isinstance(shape, pymunk.Segment) and shape.collision_type == 3:
-                query_info = shape.point_query(player_pos)
-                distance = query_info.distance # Kürzeste Distanz zur Border-Linie
+        borders = self.borders if self.distance_field.border_distance(player_pos) - max_error <= radius else []
+        for shape in borders:
+            query_info = shape.point_query(player_pos)
+            distance = query_info.distance # Kürzeste Distanz zur Border-Linie
 
-                if distance <= radius:
-                    closest_point = query_info.point
-                    delta_pos = closest_point - player_pos
-                    relative_pos_rotated = delta_pos.rotated(-player_angle_rad)
+            if distance <= radius:
+                closest_point = query_info.point
+                delta_pos = closest_point - player_pos
+                relative_pos_rotated = delta_pos.rotated(-player_angle_rad)
 
-                    # --- Rauschen hinzufügen ---
-                    noisy_relative_pos_x = relative_pos_rotated.x + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
-                    noisy_relative_pos_y = relative_pos_rotated.y + random.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                # --- Rauschen hinzufügen ---
+                noisy_relative_pos_x = relative_pos_rotated.x + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
+                noisy_relative_pos_y = relative_pos_rotated.y + self.sensor_rng.uniform(-_POSITION_NOISE_MAX_OFFSET, _POSITION_NOISE_MAX_OFFSET)
 
-                    noise_factor_distance = 1 + random.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
-                    noisy_distance = max(0, distance * noise_factor_distance)
+                noise_factor_distance = 1 + self.sensor_rng.uniform(-_DISTANCE_NOISE_MAX_PERCENTAGE, _DISTANCE_NOISE_MAX_PERCENTAGE)
+                noisy_distance = max(0, distance * noise_factor_distance)
 
 
-                    nearby_objects_relative.append({
-                        "type": "border",
-                        "relative_position": [noisy_relative_pos_x, noisy_relative_pos_y],
-                        "distance": noisy_distance
-                    })
+                nearby_objects_relative.append({
+                    "type": "border",
+                    "relative_position": [noisy_relative_pos_x, noisy_relative_pos_y],
+                    "distance": noisy_distance
+                })
 
         return {
             "nearby_objects": nearby_objects_relative
@@ -666,6 +1109,11 @@ class GameWorld:
         Returns:
             dict: The player's state including position, velocity, angle, and health.
         """
+        snapshot = self.snapshot
+        if snapshot is not None:
+            state = snapshot.player_state(player_id)
+            if state is not None:
+                return state
         player = self.players.get(player_id)
         if player:
             return {
@@ -676,11 +1124,27 @@ class GameWorld:
             }
             
     def game_state(self, player_id):
+        """
+        Retrieves the overall game state as seen by a player.
+        
+        Served from the last snapshot; players that joined after it are read live.
+        
+        Args:
+            player_id (str): The identifier of the player.
+        
+        Returns:
+            dict: Game phase, countdown, the player's ready flag and the elapsed game time.
+        """
+        snapshot = self.snapshot
+        if snapshot is not None:
+            state = snapshot.game_state(player_id)
+            if state is not None:
+                return state
         player = self.players.get(player_id)
         if player:
             # Berechne die vergangene Zeit seit Spielstart
             if self.game_started and hasattr(self, "start_time"):
-                elapsed = time.time() - self.start_time
+                elapsed = self.clock() - self.start_time
             else:
                 elapsed = 0.0
             return {
@@ -694,7 +1158,56 @@ class GameWorld:
 
                 # "Last Man Standing": player.last
                 # "Vote for Restart":  player.vote_for_restart
-    
+
+    def observation(self, player_id):
+        """
+        Returns everything a player observes, taken from a single snapshot.
+        
+        Scan, own state and game state all belong to the returned tick, so the tick
+        can serve as a version tag (players that joined after the last snapshot are
+        read live).
+        
+        Args:
+            player_id (str): The identifier of the player.
+        
+        Returns:
+            dict or None: {"tick", "scan", "state", "game_state"}, or None if the player does not exist.
+        """
+        snapshot = self.snapshot
+        if snapshot is None or player_id not in snapshot.players:
+            state = self.player_state(player_id)
+            if state is None:
+                return None
+            return {"tick": self.tick, "scan": self.scan_environment(player_id),
+                    "state": state, "game_state": self.game_state(player_id)}
+        scan = snapshot.scan(player_id) if snapshot.game_started else None
+        if scan is None:
+            scan = self.scan_environment(player_id)
+        return {"tick": snapshot.tick, "scan": scan,
+                "state": snapshot.player_state(player_id), "game_state": snapshot.game_state(player_id)}
+
+    def state_digest(self):
+        """
+        Computes a fingerprint of the simulation state.
+        
+        Two deterministic worlds that received the same inputs have the same digest.
+        
+        Returns:
+            str: SHA-256 hex digest of tick, scores and all player/projectile states.
+        """
+        h = hashlib.sha256()
+        h.update(repr((self.tick, sorted(self.score_sys.scores.items()))).encode())
+        for player_id in sorted(self.players):
+            body = self.players[player_id].body
+            h.update(repr((player_id, tuple(body.position), tuple(body.velocity), body.angle,
+                           self.players[player_id].health)).encode())
+        for obj in self.live_projectiles:
+            h.update(repr((tuple(obj.body.position), tuple(obj.body.velocity))).encode())
+        if self.bullet_engine is not None:
+            n = self.bullet_engine.count
+            h.update(self.bullet_engine.positions[:n].tobytes() + self.bullet_engine.velocities[:n].tobytes())
+        return h.hexdigest()
+
     def plot_game_statistics(self):
         try:
             """
@@ -715,15 +1228,14 @@ class GameWorld:
                 scores.append(self.score_sys.get_score(pid))
                 lifetime = getattr(player, "lifetime", 0)
                 if isinstance(lifetime, (int, float)):
-                    if lifetime > MAX_GAME_DURATION:
-                        lifetime = time.time() - lifetime
-                        lifetime = round(lifetime, 1)
-                        lifetimes.append(lifetime)
-                    else:
-                        lifetimes.append(round(lifetime, 1))
+                    if player.health > 0:
+                        # Still alive: lifetime holds the start timestamp, not a duration.
+                        lifetime = self.clock() - lifetime
+                    lifetimes.append(round(lifetime, 1))
                 else:
                     lifetimes.append(0)
 
+            import matplotlib.pyplot as plt  # Imported lazily to keep server start light
             fig, axs = plt.subplots(1, 3, figsize=(16, 6))
             bar_width = 0.7
 
@@ -829,227 +1341,12 @@ class GameWorld:
         """
         Runs the Pygame visualizer which is used for debugging and visualization.
         
-        This function initializes Pygame, creates the window, processes events, updates 
-        all sprites, draws static elements (like obstacles), displays health bars, and updates the screen.
-        The loop runs until the window is closed.
+        The visualizer lives in src/render/visualizer.py and is imported lazily, so the
+        game world itself never needs pygame (e.g. on headless servers).
         """
-        pygame.init()
-        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Game Visualizer")
-        clock = pygame.time.Clock()
-        all_game_sprites = pygame.sprite.Group()
-        running = True
-        font = pygame.font.SysFont(None, 36) # Slightly larger font for countdown
-        score_font = pygame.font.SysFont(None, 24) # Smaller font for scores
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-            screen.fill((0, 0, 0)) # Always fill background black
-
-            all_game_sprites.empty()
-
-            # Always add players to the sprite group
-            for player in self.players.values():
-                if player.health > 0:
-                    all_game_sprites.add(player)
-
-            # Add obstacles and other objects (projectiles, power-ups)
-            for obj in self.objects:
-                if isinstance(obj, pygame.sprite.Sprite):
-                    all_game_sprites.add(obj)
-            
-            dt_visual = clock.tick(FPS) / 1000.0
-            all_game_sprites.update(dt_visual) # Sprite updates (position, alpha, etc.)
-            all_game_sprites.draw(screen) # Draw all sprites
-
-            # Display health bars
-            bar_width = 30; bar_height = 5; bar_offset_y = 5
-            health_color = (0, 255, 0); lost_health_color = (255, 0, 0); border_color = (255, 255, 255)
-            for player in self.players.values():
-                if player.health > 0:    
-                    bar_x = player.rect.centerx - bar_width // 2
-                    bar_y = player.rect.bottom + bar_offset_y
-                    health_percentage = max(0, player.health / PLAYER_START_HEALTH)
-                    background_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-                    pygame.draw.rect(screen, lost_health_color, background_rect)
-                    current_bar_width = int(bar_width * health_percentage)
-                    if current_bar_width > 0:
-                        health_rect = pygame.Rect(bar_x, bar_y, current_bar_width, bar_height)
-                        pygame.draw.rect(screen, health_color, health_rect)
-                    pygame.draw.rect(screen, border_color, background_rect, 1)
-
-          
-            # Text display based on game state
-            display_text = ""
-            text_color = (255, 255, 0) # Default Yellow
-
-            if self.waiting_for_players:
-                display_text = "Waiting for players..."
-            elif self.game_started and self.countdown_active: 
-                display_text = ""
-                text_color = (0, 0, 0)
-            elif self.countdown_active:
-                display_text = f"Game starting in {math.ceil(self.countdown_seconds_remaining)}..."
-                text_color = (0, 255, 255) # Cyan for countdown
-            
-            if display_text: # Only render and blit if there's text to display
-                text_surface = font.render(display_text, True, text_color)
-                text_rect = text_surface.get_rect(center=(self.width // 2, 30))
-                screen.blit(text_surface, text_rect)
-
-
-            # --- SCORING DISPLAY ---
-            # Display scores in a semi-transparent box at the bottom
-
-            score_strings = []
-            for pid, player in self.players.items():
-                color = player.color if hasattr(player, "color") else (255,255,255)
-                agent_name = getattr(player, "agent_name", pid[:6])
-                score = self.score_sys.get_score(pid) 
-                score_strings.append((f"{agent_name}: {score}", color))
-
-            # Layout: max 4 scores per row, then wrap
-            scores_per_row = 4
-            rows = [score_strings[i:i+scores_per_row] for i in range(0, len(score_strings), scores_per_row)]
-
-            padding_x = 30
-            padding_y = 12
-            spacing = 40
-            font_height = score_font.get_height()
-            row_heights = []
-            row_widths = []
-
-            # Prepare text surfaces and calculate width for each row
-            row_surfaces = []
-            for row in rows:
-                text_surfaces = []
-                total_width = -spacing
-                for score_str, color in row:
-                    surf = score_font.render(score_str, True, color)
-                    text_surfaces.append((surf, color))
-                    total_width += surf.get_width() + spacing
-                row_surfaces.append(text_surfaces)
-                row_widths.append(total_width)
-                row_heights.append(font_height)
-
-            box_width = max(max(row_widths) + 2 * padding_x, 250) if row_widths else 250
-            box_height = len(rows) * (font_height + padding_y) + padding_y
-            box_x = (screen.get_width() - box_width) // 2
-            box_y = screen.get_height() - box_height - 18
-
-            # Draw semi-transparent background box with rounded corners
-            box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
-            box_surface.fill((0, 0, 0, 0))  # Fully transparent base
-
-            # Draw a glowing border (outer glow)
-            for glow in range(8, 0, -2):
-                pygame.draw.rect(
-                    box_surface,
-                    (255, 215, 0, 30),  # Gold, low alpha for glow
-                    pygame.Rect(glow, glow, box_width - 2*glow, box_height - 2*glow),
-                    border_radius=18
-                )
-
-            # Draw main box
-            pygame.draw.rect(
-                box_surface,
-                (40, 40, 60, 220),  # Slightly bluish dark, semi-transparent
-                box_surface.get_rect(),
-                border_radius=18
-            )
-
-            # Draw border
-            pygame.draw.rect(
-                box_surface,
-                (255, 215, 0),  # Gold border
-                box_surface.get_rect(),
-                width=4,
-                border_radius=18
-            )
-
-            # Blit score texts centered inside the box, row by row
-            y = padding_y
-            for text_surfaces in row_surfaces:
-                # Center this row horizontally in the box
-                row_width = sum(surf.get_width() for surf, _ in text_surfaces) + spacing * (len(text_surfaces)-1)
-                x = (box_width - row_width) // 2
-                for surf, color in text_surfaces:
-                    box_surface.blit(surf, (x, y))
-                    x += surf.get_width() + spacing
-                y += font_height + padding_y
-
-            # Blit the box onto the main screen
-            screen.blit(box_surface, (box_x, box_y))
-
-            # # --- Scoring display above the players ---
-            # # Uncomment if you want to show scores above player avatars
-            # for player in self.players.values():
-            #     # score_sys ist in GameWorld angelegt
-            #     score = self.score_sys.get_score(player.player_id)
-            #     score_text = score_font.render(f"Score: {score}", True, (255, 255, 255))
-            #     # Position: über dem Spieler-Avatar, z.B. 20 px darüber
-            #     score_rect = score_text.get_rect(center=(player.rect.centerx, player.rect.top - 10))
-            #     screen.blit(score_text, score_rect)
-
-            # --- Game timer display with shrinking bar at the top ---
-
-            if self.game_started and hasattr(self, "start_time"):
-                elapsed = time.time() - self.start_time
-                remaining = max(0, int(MAX_GAME_DURATION - elapsed))
-                minutes = remaining // 60
-                seconds = remaining % 60
-                timer_text = f"Time left: {minutes:02d}:{seconds:02d}"
-
-                # Timer bar dimensions (thinner bar, smaller font)
-                bar_margin_x = 60
-                bar_margin_y = 10
-                bar_height = 12  # thinner bar
-                bar_width_full = self.width - 2 * bar_margin_x
-                bar_x = bar_margin_x
-                bar_y = bar_margin_y
-
-                # Calculate bar fill (shrinks as time passes)
-                percent_left = max(0, min(1.0, remaining / MAX_GAME_DURATION))
-                bar_width_current = int(bar_width_full * percent_left)
-
-                # Draw background bar (empty)
-                pygame.draw.rect(
-                    screen,
-                    (60, 60, 60, 180),  # dark gray
-                    (bar_x, bar_y, bar_width_full, bar_height),
-                    border_radius=8
-                )
-                # Draw filled bar (remaining time)
-                pygame.draw.rect(
-                    screen,
-                    (0, 200, 0),  # green
-                    (bar_x, bar_y, bar_width_current, bar_height),
-                    border_radius=8
-                )
-                # Draw border
-                pygame.draw.rect(
-                    screen,
-                    (255, 215, 0),  # gold
-                    (bar_x, bar_y, bar_width_full, bar_height),
-                    width=2,
-                    border_radius=8
-                )
-
-                # Draw timer text centered in the bar (smaller font)
-                timer_font = pygame.font.SysFont(None, 20)
-                timer_surface = timer_font.render(timer_text, True, (255, 255, 255))
-                timer_rect = timer_surface.get_rect(center=(self.width // 2, bar_y + bar_height // 2))
-                screen.blit(timer_surface, timer_rect)
-
-    
-
-            pygame.display.flip()
-
-        pygame.quit()
+        from ..render.visualizer import run_visualizer
+        run_visualizer(self)
 
 
 # Create global instance after initialization:
-game_world_instance = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT)
\ No newline at end of file
+game_world_instance = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, seed=SIMULATION_SEED)
\ No newline at end of file
@@ -0,0 +1,84 @@
+from collections import deque
+from ..settings import MAX_THRUST_STEPS_PER_TICK, MAX_ROTATION_STEPS_PER_TICK
+
+class InputBuffer:
+    """
+    Collects the movement commands of all players between two physics ticks.
+    
+    Commands may arrive from any thread; they are appended to a deque (atomic, no
+    lock needed). At the tick boundary the physics thread merges them into a single
+    net thrust and rotation per player, clamps them to the per-tick caps, and applies
+    each player's result once. Repeated commands therefore cost one append each
+    instead of one velocity update each, and take effect at a well-defined tick.
+    """
+    def __init__(self, max_thrust_steps=MAX_THRUST_STEPS_PER_TICK, max_rotation_steps=MAX_ROTATION_STEPS_PER_TICK):
+        """
+        Initializes an empty buffer.
+        
+        Args:
+            max_thrust_steps (int): Cap for the net thrust steps per player and tick.
+            max_rotation_steps (int): Cap for the net rotation steps per player and tick.
+        """
+        self.max_thrust_steps = max_thrust_steps
+        self.max_rotation_steps = max_rotation_steps
+        self._pending = deque()  # (player_id, thrust_steps, rotation_steps)
+
+    def add(self, player_id, thrust=0, rotation=0):
+        """
+        Records a movement command.
+        
+        Args:
+            player_id (str): The player issuing the command.
+            thrust (int): +1 for forward thrust, -1 for backward thrust.
+            rotation (int): +1 for a right rotation, -1 for a left rotation.
+        """
+        self._pending.append((player_id, thrust, rotation))
+
+    def pending_steps(self, player_id):
+        """
+        Returns the net movement a player has requested since the last collect().
+        
+        Args:
+            player_id (str): The player.
+        
+        Returns:
+            tuple: (thrust_steps, rotation_steps), not clamped.
+        """
+        thrust_steps = rotation_steps = 0
+        for pending_id, thrust, rotation in list(self._pending):  # Copy: other threads may append
+            if pending_id == player_id:
+                thrust_steps += thrust
+                rotation_steps += rotation
+        return thrust_steps, rotation_steps
+
+    def collect(self):
+        """
+        Merges all commands received since the last call.
+        
+        Returns:
+            dict: {player_id: (thrust_steps, rotation_steps)} with both values clamped
+                  to the per-tick caps. Players without a net movement are omitted.
+        """
+        merged = {}
+        for _ in range(len(self._pending)):
+            player_id, thrust, rotation = self._pending.popleft()
+            total = merged.get(player_id)
+            if total is None:
+                merged[player_id] = [thrust, rotation]
+            else:
+                total[0] += thrust
+                total[1] += rotation
+
+        result = {}
+        for player_id, (thrust, rotation) in merged.items():
+            thrust = max(-self.max_thrust_steps, min(self.max_thrust_steps, thrust))
+            rotation = max(-self.max_rotation_steps, min(self.max_rotation_steps, rotation))
+            if thrust or rotation:
+                result[player_id] = (thrust, rotation)
+        return result
+
+    def clear(self):
+        """
+        Discards all pending commands (e.g. on restart).
+        """
+        self._pending.clear()
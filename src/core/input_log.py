@@ -0,0 +1,120 @@
+"""
+Input log for deterministic matches.
+
+A GameWorld created with a seed uses its own random generators and a tick-based
+clock, so the simulation only depends on the inputs it receives. Those inputs are
+recorded here together with the tick at which they were applied. Replaying the log
+in a fresh world with the same seed re-simulates the match headless at full speed
+and ends in the same state (compare GameWorld.state_digest()).
+
+Usage (from the project root):
+    python -m src.core.input_log game_stats/inputs_latest.jsonl
+"""
+import json
+import sys
+from ..settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
+
+# World methods that may be recorded and replayed ("move" is handled separately).
+REPLAYABLE_ACTIONS = {"add_player", "add_players", "remove_player", "player_ready", "shoot", "restart_game"}
+
+class InputLog:
+    """
+    Ordered record of the inputs applied to a deterministic GameWorld.
+    """
+    def __init__(self, seed, dt=PHYSICS_DT):
+        """
+        Initializes an empty log.
+        
+        Args:
+            seed (int): Seed of the recorded world.
+            dt (float): Physics time step used by the recorded world.
+        """
+        self.seed = seed
+        self.dt = dt
+        self.end_tick = 0   # Number of ticks simulated so far
+        self.entries = []   # [tick, action, args]
+
+    def record(self, tick, action, args):
+        """
+        Appends an input.
+        
+        Args:
+            tick (int): Tick during which the input was applied.
+            action (str): Name of the world method, or "move" for merged movement.
+            args (tuple): Arguments of the call.
+        """
+        self.entries.append([tick, action, list(args)])
+
+    def save(self, path):
+        """
+        Writes the log as JSON lines (a header line, then one line per input).
+        
+        Args:
+            path (str): Target file.
+        """
+        with open(path, "w") as f:
+            f.write(json.dumps({"seed": self.seed, "dt": self.dt, "end_tick": self.end_tick}) + "\n")
+            for entry in self.entries:
+                f.write(json.dumps(entry) + "\n")
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reads a log written by save().
+        
+        Args:
+            path (str): Source file.
+        
+        Returns:
+            InputLog: The loaded log.
+        """
+        with open(path) as f:
+            header = json.loads(f.readline())
+            log = cls(header["seed"], header["dt"])
+            log.end_tick = header["end_tick"]
+            log.entries = [json.loads(line) for line in f if line.strip()]
+        return log
+
+def replay(log, end_tick=None):
+    """
+    Re-simulates a recorded match in a fresh headless world as fast as possible.
+    
+    Args:
+        log (InputLog): The recorded inputs.
+        end_tick (int, optional): Number of ticks to simulate. Defaults to log.end_tick.
+    
+    Returns:
+        GameWorld: The world after the last simulated tick.
+    """
+    from .game_world import GameWorld
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, write_stats=False, seed=log.seed)
+    end_tick = log.end_tick if end_tick is None else end_tick
+
+    index = 0
+    entries = log.entries
+    for tick in range(end_tick):
+        while index < len(entries) and entries[index][0] == tick:
+            _, action, args = entries[index]
+            if action == "move":
+                player_id, thrust, rotation = args
+                world.input_buffer.add(player_id, thrust, rotation)
+            elif action in REPLAYABLE_ACTIONS:
+                getattr(world, action)(*args)
+            index += 1
+        world.update(log.dt)
+    return world
+
+def main(argv=None):
+    """
+    Command line entry point: replays a log file and prints the final state digest.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m src.core.input_log <input_log.jsonl>")
+        return
+    log = InputLog.load(argv[0])
+    world = replay(log)
+    print(f"Replayed {log.end_tick} ticks, {len(log.entries)} inputs. State digest: {world.state_digest()}")
+
+if __name__ == "__main__":
+    main()
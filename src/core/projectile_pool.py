@@ -0,0 +1,86 @@
+from .game_objects import Projectile
+
+
+class ProjectilePool:
+    """
+    Recycles projectiles, so shooting does not allocate a new Pymunk body and shape per shot.
+
+    The pool is filled up to its capacity when it is created. Projectiles that leave
+    the world (expired or hit something) are handed back and reused by the next shot.
+    If the pool is empty, a new projectile is allocated (a miss); projectiles handed
+    back to a full pool are dropped.
+    """
+    def __init__(self, game_world, capacity):
+        """
+        Initializes the pool and preallocates its projectiles.
+
+        Args:
+            game_world (GameWorld): The world the projectiles are spawned into.
+            capacity (int): Maximum number of idle projectiles kept for reuse.
+        """
+        self.game_world = game_world
+        self.capacity = capacity
+        self._free = [self._allocate() for _ in range(capacity)]
+        self.hits = 0        # Shots served from the pool
+        self.misses = 0      # Shots that needed a new projectile
+        self.discarded = 0   # Projectiles dropped because the pool was full
+
+    def _allocate(self):
+        """
+        Creates a projectile that belongs to the world but is not in play yet.
+        """
+        projectile = Projectile((0, 0), 0, owner=None, color=None)
+        projectile.game_world = self.game_world
+        return projectile
+
+    def acquire(self, position, angle_rad, owner, color):
+        """
+        Spawns a projectile, reusing an idle one if available.
+
+        Args:
+            position (tuple): Starting (x, y) position.
+            angle_rad (float): Firing angle in radians.
+            owner (Triangle): The player who fired the projectile.
+            color (tuple): Color of the projectile.
+
+        Returns:
+            Projectile: The projectile, added to the physics space and the world.
+        """
+        if self._free:
+            projectile = self._free.pop()
+            self.hits += 1
+        else:
+            projectile = self._allocate()
+            self.misses += 1
+        projectile.spawn(position, angle_rad, owner, color)
+        return projectile
+
+    def release(self, projectile):
+        """
+        Takes back a projectile that was removed from the world.
+
+        Args:
+            projectile (Projectile): The removed projectile.
+        """
+        projectile.owner = None  # Do not keep the player alive
+        if len(self._free) < self.capacity:
+            self._free.append(projectile)
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        """
+        Returns the pool metrics.
+
+        Returns:
+            dict: Capacity, idle projectiles, hits, misses, hit rate and discarded projectiles.
+        """
+        requests = self.hits + self.misses
+        return {
+            "capacity": self.capacity,
+            "free": len(self._free),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 4) if requests else None,
+            "discarded": self.discarded,
+        }
@@ -0,0 +1,112 @@
+import time
+from collections import Counter, OrderedDict
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter per player and endpoint class.
+
+    Each (player, endpoint class) pair has a bucket that refills at `rate` tokens per
+    second up to `burst` tokens; a request takes one token or is rejected with the
+    exact time until the next token. With a burst of 1 this is the classic cooldown.
+
+    Buckets are kept in access order. A bucket that has not been used for as long as
+    the slowest class needs to refill completely is indistinguishable from a new one,
+    so it is evicted; memory is bounded by the players active in that window, no
+    matter how many players ever connected. Every operation is O(1) (amortized).
+    """
+    def __init__(self, limits, clock=time.monotonic):
+        """
+        Initializes the limiter.
+
+        Args:
+            limits (dict): Endpoint class -> (rate in tokens per second, burst).
+            clock (callable): Monotonic time source in seconds.
+        """
+        self.limits = limits
+        self.clock = clock
+        self.idle_after = max(burst / rate for rate, burst in limits.values())
+        self._buckets = OrderedDict()   # (player_id, endpoint) -> [tokens, last refill time]
+        self.allowed = Counter()        # Endpoint class -> accepted requests
+        self.rejected = Counter()       # Endpoint class -> rejected requests
+
+    def acquire(self, player_id, endpoint):
+        """
+        Takes a token for a request, if one is available.
+
+        Args:
+            player_id (str): The requesting player.
+            endpoint (str): Endpoint class (a key of `limits`).
+
+        Returns:
+            float: 0.0 if the request is allowed, otherwise the seconds until it would be.
+        """
+        rate, burst = self.limits[endpoint]
+        now = self.clock()
+        self._evict(now)
+        key = (player_id, endpoint)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(burst), now]
+        else:
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            self.allowed[endpoint] += 1
+            return 0.0
+        self.rejected[endpoint] += 1
+        return (1 - bucket[0]) / rate
+
+    def refund(self, player_id, endpoint, count=1):
+        """
+        Returns tokens taken for requests that were not carried out.
+
+        Args:
+            player_id (str): The requesting player.
+            endpoint (str): Endpoint class (a key of `limits`).
+            count (int): Number of tokens to return.
+        """
+        bucket = self._buckets.get((player_id, endpoint))
+        if bucket is None or count <= 0:
+            return
+        burst = self.limits[endpoint][1]
+        bucket[0] = min(burst, bucket[0] + count)
+        self.allowed[endpoint] -= count
+
+    def _evict(self, now):
+        """
+        Drops the buckets that have been idle long enough to be full again.
+        """
+        buckets = self._buckets
+        while buckets:
+            key, (_, last) = next(iter(buckets.items()))
+            if now - last < self.idle_after:
+                break
+            del buckets[key]
+
+    def forget(self, player_id):
+        """
+        Drops all buckets of a player (e.g. on disconnect).
+
+        Args:
+            player_id (str): The player.
+        """
+        for endpoint in self.limits:
+            self._buckets.pop((player_id, endpoint), None)
+
+    def stats(self):
+        """
+        Returns the limiter metrics.
+
+        Returns:
+            dict: Tracked buckets and the allowed/rejected requests per endpoint class.
+        """
+        self._evict(self.clock())
+        return {
+            "buckets": len(self._buckets),
+            "limits": {endpoint: {"rate": rate, "burst": burst} for endpoint, (rate, burst) in self.limits.items()},
+            "allowed": dict(self.allowed),
+            "rejected": dict(self.rejected),
+        }
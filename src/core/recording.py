@@ -0,0 +1,313 @@
+"""
+Compact binary match recordings.
+
+A MatchRecorder stores the state of every moving entity (players and projectiles)
+for every tick. On the physics thread it only copies a few floats per entity into
+a queue; packing and writing happen in a background thread. A RecordingReader
+memory-maps a finished file and seeks to any tick in O(1).
+
+File layout (all little-endian):
+    header   magic "UPCREC1\\0", version u16, chunk_ticks u16, record_size u16,
+             reserved u16, start_tick u32, dt f32, meta_len u32, meta (JSON: arena
+             size, obstacles, players)
+    chunks   first_tick u32, tick_count u16, reserved u16,
+             (tick_count + 1) u32 offsets of each tick's records (relative to the chunk),
+             entity records
+    footer   chunk offsets u64 * chunk_count, chunk_count u32, tick_count u32,
+             magic "UPCIDX1\\0"
+
+Entity record (14 bytes): entity id u16, kind u8 (collision type: 1 player,
+4 projectile), x and y i16 (1/4 px), angle i16 (pi / 32767 rad), vx and vy i16
+(1/16 px/s), health i8.
+
+Usage (from the project root):
+    python -m src.core.recording recordings/<file>.upcrec [tick]
+"""
+import json
+import math
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import weakref
+from ..settings import RECORDING_CHUNK_TICKS, RECORDING_QUEUE_TICKS
+
+MAGIC = b"UPCREC1\0"
+INDEX_MAGIC = b"UPCIDX1\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHHHHIfI")
+CHUNK_HEADER = struct.Struct("<IHH")
+RECORD = struct.Struct("<HBhhhhhb")
+FOOTER = struct.Struct("<II8s")
+
+KIND_PLAYER = 1       # Same numbers as the collision types in game_objects.py
+KIND_PROJECTILE = 4
+
+POSITION_SCALE = 4.0
+ANGLE_SCALE = 32767 / math.pi
+VELOCITY_SCALE = 16.0
+
+def _clamp_i16(value):
+    return max(-32768, min(32767, int(round(value))))
+
+def _wrap_angle(angle):
+    return (angle + math.pi) % (2 * math.pi) - math.pi
+
+
+class MatchRecorder:
+    """
+    Records per-tick entity states of a GameWorld into a chunked binary file.
+    """
+    def __init__(self, path, world, chunk_ticks=RECORDING_CHUNK_TICKS, queue_ticks=RECORDING_QUEUE_TICKS):
+        """
+        Opens the file, writes the header and starts the writer thread.
+        
+        Args:
+            path (str): Target file.
+            world (GameWorld): The recorded world (used for the header metadata).
+            chunk_ticks (int): Ticks per chunk.
+            queue_ticks (int): Captured ticks that may wait for the writer. If the writer
+                falls further behind, new ticks are dropped instead of blocking the tick.
+        """
+        self.path = path
+        self.chunk_ticks = chunk_ticks
+        self.dropped_ticks = 0
+        self._ids = weakref.WeakKeyDictionary()  # Entity -> record ID
+        self._projectile_ids = weakref.WeakKeyDictionary()  # Pooled projectile -> (generation, record ID)
+        self._bullet_ids = {}                    # Bullet engine ID -> record ID (bullets in flight only)
+        self._next_id = 0
+        self._queue = queue.Queue(maxsize=queue_ticks)
+        self._start_tick = None
+        self._last_tick = None
+        self._header_meta = self._build_meta(world)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        self._thread = threading.Thread(target=self._write_loop, name="recorder", daemon=True)
+        self._started = False
+        self._dt = 0.0
+
+    def _entity_id(self, entity):
+        record_id = self._ids.get(entity)
+        if record_id is None:
+            record_id = self._next_id & 0xFFFF
+            self._next_id += 1
+            self._ids[entity] = record_id
+        return record_id
+
+    def _projectile_id(self, projectile):
+        # A pooled projectile is a new entity every time it is spawned again.
+        entry = self._projectile_ids.get(projectile)
+        if entry is None or entry[0] != projectile.generation:
+            entry = (projectile.generation, self._next_id & 0xFFFF)
+            self._next_id += 1
+            self._projectile_ids[projectile] = entry
+        return entry[1]
+
+    def _build_meta(self, world):
+        players = {}
+        for player_id, player in world.players.items():
+            players[str(self._entity_id(player))] = {
+                "player_id": player_id,
+                "agent_name": getattr(player, "agent_name", None),
+                "color": list(player.color),
+            }
+        obstacles = [obj.to_dict() for obj in world.obstacles()]
+        return {"width": world.width, "height": world.height, "players": players, "obstacles": obstacles}
+
+    def capture(self, world, dt):
+        """
+        Copies the state of all moving entities. Called by the physics thread after each tick.
+        
+        Only raw values are collected here; quantizing, packing and file I/O happen in
+        the writer thread.
+        
+        Args:
+            world (GameWorld): The recorded world.
+            dt (float): Duration of the tick.
+        """
+        if self._last_tick is not None and world.tick != self._last_tick + 1:
+            return  # The file stores consecutive ticks only
+        # Vec2d values are immutable, so they can be handed to the writer as they are.
+        states = []
+        for player in world.players.values():
+            if player.health > 0:
+                body = player.body
+                states.append((self._entity_id(player), KIND_PLAYER, body.position, body.angle,
+                               body.velocity, player.health))
+        for obj in world.projectiles():
+            body = obj.body
+            states.append((self._projectile_id(obj), KIND_PROJECTILE, body.position, body.angle, body.velocity, 0))
+        if world.bullet_engine is not None:
+            ids, positions, velocities, angles, _ = world.bullet_engine.states()
+            bullet_ids = {}  # Rebuilt every tick, so removed bullets are dropped
+            for bullet_id, position, angle, velocity in zip(ids.tolist(), positions.tolist(), angles.tolist(), velocities.tolist()):
+                record_id = self._bullet_ids.get(bullet_id)
+                if record_id is None:
+                    record_id = self._next_id & 0xFFFF
+                    self._next_id += 1
+                bullet_ids[bullet_id] = record_id
+                states.append((record_id, KIND_PROJECTILE, position, angle, velocity, 0))
+            self._bullet_ids = bullet_ids
+        if not self._started:
+            self._start_tick = world.tick
+            self._dt = dt
+            self._started = True
+            self._thread.start()
+        try:
+            self._queue.put_nowait(states)
+            self._last_tick = world.tick
+        except queue.Full:
+            # Never block the physics thread. A gap would break tick seeking, so stop here.
+            self.dropped_ticks += 1
+            self._last_tick = -2
+
+    def close(self, wait=True):
+        """
+        Flushes the remaining ticks, writes the chunk index and closes the file.
+        
+        Args:
+            wait (bool): If False, return immediately and let the writer thread finish
+                the file in the background.
+        """
+        if self._started:
+            self._queue.put(None)
+            if wait:
+                self._thread.join()
+        else:
+            self._write_header(0, 0.0)
+            self._file.write(FOOTER.pack(0, 0, INDEX_MAGIC))
+            self._file.close()
+
+    def _write_header(self, start_tick, dt):
+        meta = json.dumps(self._header_meta).encode("utf-8")
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.chunk_ticks, RECORD.size, 0, start_tick, dt, len(meta)))
+        self._file.write(meta)
+
+    def _write_loop(self):
+        self._write_header(self._start_tick, self._dt)
+        chunk_offsets = []
+        total_ticks = 0
+        pending = []  # Ticks of the current chunk
+        while True:
+            states = self._queue.get()
+            if states is not None:
+                pending.append(states)
+            if pending and (states is None or len(pending) == self.chunk_ticks):
+                chunk_offsets.append(self._file.tell())
+                self._file.write(self._pack_chunk(self._start_tick + total_ticks, pending))
+                total_ticks += len(pending)
+                pending = []
+            if states is None:
+                break
+        for offset in chunk_offsets:
+            self._file.write(struct.pack("<Q", offset))
+        self._file.write(FOOTER.pack(len(chunk_offsets), total_ticks, INDEX_MAGIC))
+        self._file.close()
+
+    def _pack_chunk(self, first_tick, ticks):
+        table_size = 4 * (len(ticks) + 1)
+        records_start = CHUNK_HEADER.size + table_size
+        record_count = sum(len(states) for states in ticks)
+        buffer = bytearray(records_start + record_count * RECORD.size)
+        CHUNK_HEADER.pack_into(buffer, 0, first_tick, len(ticks), 0)
+        offset = records_start
+        for index, states in enumerate(ticks):
+            struct.pack_into("<I", buffer, CHUNK_HEADER.size + 4 * index, offset)
+            for record_id, kind, (x, y), angle, (vx, vy), health in states:
+                RECORD.pack_into(buffer, offset, record_id, kind,
+                                 _clamp_i16(x * POSITION_SCALE), _clamp_i16(y * POSITION_SCALE),
+                                 _clamp_i16(_wrap_angle(angle) * ANGLE_SCALE),
+                                 _clamp_i16(vx * VELOCITY_SCALE), _clamp_i16(vy * VELOCITY_SCALE),
+                                 max(-128, min(127, int(health))))
+                offset += RECORD.size
+        struct.pack_into("<I", buffer, CHUNK_HEADER.size + 4 * len(ticks), offset)
+        return bytes(buffer)
+
+
+class RecordingReader:
+    """
+    Memory-mapped access to a finished recording.
+    """
+    def __init__(self, path):
+        """
+        Maps the file and reads its header and chunk index.
+        
+        Args:
+            path (str): Recording file.
+        
+        Raises:
+            ValueError: If the file is not a complete recording.
+        """
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.chunk_ticks, record_size, _, self.start_tick, self.dt, meta_len = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"{path} is not a UPC_PyGame recording (version {VERSION}).")
+        self.meta = json.loads(self._mm[HEADER.size:HEADER.size + meta_len].decode("utf-8"))
+
+        chunk_count, self.tick_count, index_magic = FOOTER.unpack_from(self._mm, len(self._mm) - FOOTER.size)
+        if index_magic != INDEX_MAGIC:
+            raise ValueError(f"{path} has no chunk index (recording not closed).")
+        index_start = len(self._mm) - FOOTER.size - 8 * chunk_count
+        self._chunk_offsets = struct.unpack_from(f"<{chunk_count}Q", self._mm, index_start)
+
+    def __len__(self):
+        return self.tick_count
+
+    def read_tick(self, tick):
+        """
+        Returns the entity states of one tick.
+        
+        Args:
+            tick (int): Absolute tick number (start_tick <= tick < start_tick + len(self)).
+        
+        Returns:
+            list: (entity_id, kind, x, y, angle, vx, vy, health) tuples, de-quantized.
+        
+        Raises:
+            IndexError: If the tick is not in the recording.
+        """
+        local = tick - self.start_tick
+        if not 0 <= local < self.tick_count:
+            raise IndexError(f"Tick {tick} not in recording ({self.start_tick}..{self.start_tick + self.tick_count - 1}).")
+        chunk = self._chunk_offsets[local // self.chunk_ticks]
+        table = chunk + CHUNK_HEADER.size + 4 * (local % self.chunk_ticks)
+        begin, end = struct.unpack_from("<II", self._mm, table)
+        return [
+            (record_id, kind, x / POSITION_SCALE, y / POSITION_SCALE, angle / ANGLE_SCALE,
+             vx / VELOCITY_SCALE, vy / VELOCITY_SCALE, health)
+            for record_id, kind, x, y, angle, vx, vy, health
+            in RECORD.iter_unpack(self._mm[chunk + begin:chunk + end])
+        ]
+
+    def close(self):
+        """
+        Unmaps and closes the file.
+        """
+        self._mm.close()
+        self._file.close()
+
+
+def main(argv=None):
+    """
+    Command line entry point: prints a summary of a recording and optionally one tick.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print("Usage: python -m src.core.recording <recording.upcrec> [tick]")
+        return
+    reader = RecordingReader(argv[0])
+    print(f"{len(reader)} ticks from tick {reader.start_tick}, {len(reader.meta['players'])} players, "
+          f"{os.path.getsize(argv[0])} bytes")
+    if len(argv) > 1:
+        for state in reader.read_tick(int(argv[1])):
+            print(state)
+    reader.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+import numpy as np
+from ..settings import SCANNING_RADIUS
+
+# Sensor noise (same values as the per-player scan in GameWorld.scan_environment)
+POSITION_NOISE_MAX_OFFSET = 0.8
+VELOCITY_NOISE_MAX_OFFSET = 0.4
+DISTANCE_NOISE_MAX_PERCENTAGE = 0.04
+
+
+class ScanViews:
+    """
+    The scan results of all players for one tick.
+    
+    Holds the arrays computed by ScanStage and turns them into the per-player scan
+    dictionaries on first access; later reads in the same tick reuse the dictionary.
+    """
+    def __init__(self, tick, player_rows, kinds, colors, pairs, values, border_values):
+        self.tick = tick
+        self._player_rows = player_rows    # {player_id: row index}
+        self._kinds = kinds                # Scan type name per column ("obstacle", "projectile", "other_player")
+        self._colors = colors              # Color per column (None for obstacles)
+        self._pairs = pairs                # (rows, columns) of all in-range pairs, sorted by row
+        self._values = values              # (n_pairs, 5): rel. x, rel. y, rel. vx, rel. vy, distance
+        self._border_values = border_values  # (n_players, 4 borders, 4): rel. x, rel. y, distance, in range
+        self._cache = {}
+
+    def for_player(self, player_id):
+        """
+        Returns the scan result of one player in the format of GameWorld.scan_environment.
+        
+        Args:
+            player_id (str): The scanning player.
+        
+        Returns:
+            dict or None: {"nearby_objects": [...]}, or None if the player was not scanned this tick.
+        """
+        result = self._cache.get(player_id)
+        if result is not None:
+            return result
+        row = self._player_rows.get(player_id)
+        if row is None:
+            return None
+
+        rows, columns = self._pairs
+        start, end = np.searchsorted(rows, [row, row + 1])
+        objects, players = [], []
+        for column, (rx, ry, rvx, rvy, distance) in zip(columns[start:end].tolist(), self._values[start:end].tolist()):
+            kind = self._kinds[column]
+            entry = {
+                "type": kind,
+                "relative_position": [rx, ry],
+                "relative_velocity": [rvx, rvy],
+                "distance": distance,
+                "color": self._colors[column],
+            }
+            (players if kind == "other_player" else objects).append(entry)
+
+        borders = [
+            {"type": "border", "relative_position": [rx, ry], "distance": distance}
+            for rx, ry, distance, in_range in self._border_values[row].tolist() if in_range
+        ]
+        result = {"nearby_objects": objects + players + borders}
+        self._cache[player_id] = result
+        return result
+
+
+class ScanStage:
+    """
+    Computes the scans of all players in one vectorized pass per tick.
+    
+    Pairwise distances, ego-frame positions and velocities and the sensor noise
+    are computed with NumPy for every (player, entity) pair at once, instead of
+    one Python loop per scan request. The input is a WorldSnapshot, whose body
+    states are already arrays, so a scan never touches live Pymunk bodies.
+    """
+    def __init__(self, seed=None, radius=SCANNING_RADIUS):
+        """
+        Initializes the stage.
+        
+        Args:
+            seed (int, optional): Seed for the sensor noise.
+            radius (float): Scanning radius (surface to surface).
+        """
+        self.rng = np.random.default_rng(seed)
+        self.radius = radius
+
+    def compute(self, snapshot):
+        """
+        Computes the scan results of all players for one tick.
+        
+        Args:
+            snapshot (WorldSnapshot): The tick to scan (called by its first scan request).
+        
+        Returns:
+            ScanViews: The results of this tick.
+        """
+        player_ids = list(snapshot.players)
+        players = list(snapshot.players.values())
+        obstacles = snapshot.static_layout.states
+        projectiles, projectile_values = snapshot.projectile_states()
+        bullets = snapshot.bullets
+        n_obstacles, n_projectiles = len(obstacles), len(projectiles)
+        n_bullets = len(bullets[0]) if bullets is not None else 0
+        n_players = len(players)
+        n_entities = n_obstacles + n_projectiles + n_bullets + n_players
+
+        # Columns (x, y, vx, vy, radius): obstacles, Pymunk projectiles, bullet engine
+        # bullets, players.
+        state = np.empty((n_entities, 5))
+        state[:n_obstacles] = obstacles
+        end = n_obstacles + n_projectiles
+        state[n_obstacles:end, 0:2] = projectile_values[:, 0:2]
+        state[n_obstacles:end, 2:4] = projectile_values[:, 3:5]
+        state[n_obstacles:end, 4] = [obj.radius for obj, _, _ in projectiles]
+        if n_bullets:
+            _, positions, velocities, _, _ = bullets
+            state[end:end + n_bullets, 0:2] = positions
+            state[end:end + n_bullets, 2:4] = velocities
+            state[end:end + n_bullets, 4] = snapshot.bullet_radius
+        state[n_entities - n_players:] = [(*p.position, *p.velocity, p.radius) for p in players]
+        kinds = (["obstacle"] * n_obstacles + ["projectile"] * (n_projectiles + n_bullets)
+                 + ["other_player"] * n_players)
+        colors = ([None] * n_obstacles + [color for _, _, color in projectiles]
+                  + (list(bullets[4]) if n_bullets else []) + [player.color for player in players])
+        angles = np.array([p.angle for p in players])
+        p_state = state[n_entities - n_players:]  # Players are the last columns
+
+        # Pairwise surface distances (players x entities); a player never sees itself.
+        delta = state[None, :, 0:2] - p_state[:, None, 0:2]
+        distance = np.hypot(delta[..., 0], delta[..., 1]) - state[None, :, 4] - p_state[:, 4:5]
+        in_range = distance <= self.radius
+        in_range[np.arange(n_players), np.arange(n_entities - n_players, n_entities)] = False
+        rows, columns = np.nonzero(in_range)
+
+        # Rotate relative position and velocity into each player's frame.
+        cos_a, sin_a = np.cos(-angles[rows]), np.sin(-angles[rows])
+        d_pos = delta[rows, columns]
+        d_vel = state[columns, 2:4] - p_state[rows, 2:4]
+        n = len(rows)
+        values = np.empty((n, 5))
+        values[:, 0] = d_pos[:, 0] * cos_a - d_pos[:, 1] * sin_a
+        values[:, 1] = d_pos[:, 0] * sin_a + d_pos[:, 1] * cos_a
+        values[:, 2] = d_vel[:, 0] * cos_a - d_vel[:, 1] * sin_a
+        values[:, 3] = d_vel[:, 0] * sin_a + d_vel[:, 1] * cos_a
+        values[:, 0:2] += self.rng.uniform(-POSITION_NOISE_MAX_OFFSET, POSITION_NOISE_MAX_OFFSET, (n, 2))
+        values[:, 2:4] += self.rng.uniform(-VELOCITY_NOISE_MAX_OFFSET, VELOCITY_NOISE_MAX_OFFSET, (n, 2))
+        noise_factor = 1 + self.rng.uniform(-DISTANCE_NOISE_MAX_PERCENTAGE, DISTANCE_NOISE_MAX_PERCENTAGE, n)
+        values[:, 4] = np.maximum(0, distance[rows, columns] * noise_factor)
+
+        border_values = self._borders(snapshot, p_state, angles)
+        player_rows = {pid: row for row, pid in enumerate(player_ids)}
+        return ScanViews(snapshot.tick, player_rows, kinds, colors, (rows, columns), values, border_values)
+
+    def _borders(self, snapshot, p_state, angles):
+        """
+        Computes the closest point of the four border segments for all players.
+        
+        Returns:
+            np.ndarray: (n_players, 4, 4) with rel. x, rel. y, distance and an in-range flag.
+        """
+        n_players = len(p_state)
+        x, y = p_state[:, 0], p_state[:, 1]
+        # Same order as GameWorld.add_borders: bottom, top, left, right. The segments
+        # have a radius of 1, so the surface is 1 px closer than the center line.
+        closest = np.empty((n_players, 4, 2))
+        clip_x = np.clip(x, 0, snapshot.width)
+        clip_y = np.clip(y, 0, snapshot.height)
+        closest[:, 0] = np.stack([clip_x, np.zeros(n_players)], axis=1)
+        closest[:, 1] = np.stack([clip_x, np.full(n_players, snapshot.height)], axis=1)
+        closest[:, 2] = np.stack([np.zeros(n_players), clip_y], axis=1)
+        closest[:, 3] = np.stack([np.full(n_players, snapshot.width), clip_y], axis=1)
+        delta = closest - p_state[:, None, 0:2]
+        center_distance = np.hypot(delta[..., 0], delta[..., 1])
+        distance = center_distance - 1
+        # Move the closest point from the center line onto the surface.
+        scale = np.where(center_distance > 0, distance / np.maximum(center_distance, 1e-9), 0)
+        delta = delta * scale[..., None]
+
+        cos_a, sin_a = np.cos(-angles)[:, None], np.sin(-angles)[:, None]
+        result = np.empty((n_players, 4, 4))
+        result[..., 0] = delta[..., 0] * cos_a - delta[..., 1] * sin_a
+        result[..., 1] = delta[..., 0] * sin_a + delta[..., 1] * cos_a
+        result[..., 0:2] += self.rng.uniform(-POSITION_NOISE_MAX_OFFSET, POSITION_NOISE_MAX_OFFSET, (n_players, 4, 2))
+        noise_factor = 1 + self.rng.uniform(-DISTANCE_NOISE_MAX_PERCENTAGE, DISTANCE_NOISE_MAX_PERCENTAGE, (n_players, 4))
+        result[..., 2] = np.maximum(0, distance * noise_factor)
+        result[..., 3] = distance <= self.radius
+        return result
@@ -0,0 +1,131 @@
+import time
+from collections import deque
+from ..settings import PHYSICS_DT, MAX_CATCHUP_STEPS, TICK_STATS_WINDOW
+
+class FixedTimestepScheduler:
+    """
+    Runs a step function at a fixed rate against a monotonic clock.
+    
+    Elapsed real time is collected in an accumulator and consumed in steps of
+    exactly dt, so the cost of a step does not stretch the tick period. If the
+    simulation falls behind, at most max_substeps steps are run back-to-back;
+    any further backlog is dropped (and counted) instead of spiralling.
+    
+    For every step the scheduler records how long it took and how late it started
+    relative to its deadline, so the achieved tick rate can be checked under load.
+    """
+    def __init__(self, step, dt=PHYSICS_DT, max_substeps=MAX_CATCHUP_STEPS,
+                 history=TICK_STATS_WINDOW, clock=time.perf_counter):
+        """
+        Initializes the scheduler.
+        
+        Args:
+            step (callable): Called as step(dt) once per tick.
+            dt (float): Fixed time step in seconds.
+            max_substeps (int): Maximum number of catch-up steps per wake-up.
+            history (int): Number of recent ticks kept for statistics.
+            clock (callable): Monotonic clock in seconds.
+        """
+        self.step = step
+        self.dt = dt
+        self.max_substeps = max_substeps
+        self.clock = clock
+        self.accumulator = 0.0
+        self._last_time = None
+        self.tick_count = 0         # Steps run so far
+        self.overruns = 0           # Steps that took longer than dt
+        self.dropped_ticks = 0      # Steps skipped because the backlog exceeded max_substeps
+        self.durations = deque(maxlen=history)  # Seconds spent in each recent step
+        self.lateness = deque(maxlen=history)   # Seconds each recent step started after its deadline
+        self.tick_times = deque(maxlen=history) # Clock value at the start of each recent step
+
+    def run_due_steps(self):
+        """
+        Runs all steps that are due and returns the time until the next deadline.
+        
+        Returns:
+            float: Seconds to wait before calling this method again.
+        """
+        now = self.clock()
+        if self._last_time is None:
+            self._last_time = now
+            self.accumulator = self.dt  # Run the first tick right away
+        self.accumulator += now - self._last_time
+        self._last_time = now
+
+        substeps = 0
+        while self.accumulator >= self.dt and substeps < self.max_substeps:
+            started = self.clock()
+            # The deadline of this step passed (accumulator - dt) seconds before 'now'.
+            self.lateness.append(self.accumulator - self.dt + (started - now))
+            self.tick_times.append(started)
+            self.step(self.dt)
+            duration = self.clock() - started
+            self.durations.append(duration)
+            if duration > self.dt:
+                self.overruns += 1
+            self.accumulator -= self.dt
+            self.tick_count += 1
+            substeps += 1
+
+        if self.accumulator >= self.dt:
+            # Too far behind: drop whole ticks, keep the fractional remainder.
+            skipped = int(self.accumulator // self.dt)
+            self.dropped_ticks += skipped
+            self.accumulator -= skipped * self.dt
+
+        elapsed_since_wakeup = self.clock() - now
+        return max(0.0, self.dt - self.accumulator - elapsed_since_wakeup)
+
+    def run(self, is_running):
+        """
+        Runs the scheduler in the calling thread until is_running() returns False.
+        
+        Args:
+            is_running (callable): Returns False to stop the loop.
+        """
+        while is_running():
+            delay = self.run_due_steps()
+            if delay > 0:
+                time.sleep(delay)
+
+    def stats(self):
+        """
+        Summarizes the recent tick durations and lateness.
+        
+        Returns:
+            dict: Tick counters, duration/lateness statistics in milliseconds and the
+                  tick rate achieved over the statistics window.
+        """
+        durations = sorted(self.durations)
+        lateness = sorted(self.lateness)
+
+        def percentile(values, fraction):
+            if not values:
+                return 0.0
+            return values[min(len(values) - 1, int(fraction * len(values)))] * 1000
+
+        achieved_hz = 0.0
+        if len(self.tick_times) > 1:
+            span = self.tick_times[-1] - self.tick_times[0]
+            if span > 0:
+                achieved_hz = (len(self.tick_times) - 1) / span
+
+        return {
+            "target_hz": round(1 / self.dt, 2),
+            "achieved_hz": round(achieved_hz, 2),
+            "ticks": self.tick_count,
+            "overruns": self.overruns,
+            "dropped_ticks": self.dropped_ticks,
+            "duration_ms": {
+                "mean": round(sum(durations) / len(durations) * 1000, 3) if durations else 0.0,
+                "p50": round(percentile(durations, 0.5), 3),
+                "p99": round(percentile(durations, 0.99), 3),
+                "max": round(durations[-1] * 1000, 3) if durations else 0.0,
+            },
+            "lateness_ms": {
+                "mean": round(sum(lateness) / len(lateness) * 1000, 3) if lateness else 0.0,
+                "p99": round(percentile(lateness, 0.99), 3),
+                "max": round(lateness[-1] * 1000, 3) if lateness else 0.0,
+            },
+        }
@@ -0,0 +1,234 @@
+import math
+import threading
+from collections import namedtuple
+from types import MappingProxyType
+import numpy as np
+import pymunk.batch
+
+# Immutable records of the entities in a snapshot. Positions and velocities are (x, y) tuples.
+PlayerSnapshot = namedtuple("PlayerSnapshot", [
+    "player_id", "agent_name", "position", "velocity", "angle", "angular_velocity",
+    "health", "radius", "color", "ready", "spawn_protected",
+])
+EntitySnapshot = namedtuple("EntitySnapshot", [
+    "key", "kind", "position", "velocity", "radius", "color",
+])
+
+# Body fields read per tick; the float columns are x, y, angle, vx, vy.
+BODY_FIELDS = (pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION
+               | pymunk.batch.BodyFields.ANGLE | pymunk.batch.BodyFields.VELOCITY)
+
+
+def read_bodies(space, buffer):
+    """
+    Reads the state of every body in a space with a single pymunk.batch call.
+
+    Args:
+        space (pymunk.Space): The space to read.
+        buffer (pymunk.batch.Buffer): Reused between calls.
+
+    Returns:
+        tuple: (ids, values): Body IDs (see pymunk.Body.id) and an (n, 5) array of
+        x, y, angle, vx, vy. Both are copies, so they stay valid after the next step.
+    """
+    buffer.clear()
+    pymunk.batch.get_space_bodies(space, BODY_FIELDS, buffer)
+    ids = np.frombuffer(buffer.int_buf(), dtype=np.uintp).copy()
+    values = np.frombuffer(buffer.float_buf(), dtype=np.float64).reshape(-1, 5).copy()
+    return ids, values
+
+
+class StaticLayout:
+    """
+    The obstacles of an arena in the form snapshots and scans need them.
+
+    Obstacles never move, so this is built when the layout changes (see
+    GameWorld.rebuild_static_index) and shared by all snapshots.
+    """
+    def __init__(self, obstacles):
+        """
+        Args:
+            obstacles (list): CircleObstacle instances.
+        """
+        # (n, 5): x, y, vx, vy, radius, the layout ScanStage uses.
+        self.states = np.array(
+            [(obj.body.position.x, obj.body.position.y, 0.0, 0.0, obj.radius) for obj in obstacles],
+            dtype=np.float64,
+        ).reshape(-1, 5)
+        self.entities = tuple(
+            EntitySnapshot(obj, "obstacle", tuple(obj.body.position), (0.0, 0.0), obj.radius, obj.color)
+            for obj in obstacles
+        )
+
+
+class WorldSnapshot:
+    """
+    Read-only copy of the world state at the end of one tick.
+
+    The physics thread builds a new snapshot at the end of every update and swaps it
+    in as a whole, so readers (API endpoints, visualizer) never touch live Pymunk
+    bodies. The per-player responses are built on first read and cached, so repeated
+    reads within a tick are a dictionary lookup. Returned dictionaries are shared
+    between readers and must not be modified.
+
+    Projectile states are copied as arrays (one pymunk.batch read per tick); the
+    vectorized scans of all players and the entity records are only built from them
+    when a reader first asks for them. Obstacle records are shared by all snapshots.
+    """
+    def __init__(self, world):
+        """
+        Captures the current state of a world (called from the physics thread).
+
+        Args:
+            world (GameWorld): The world to copy.
+        """
+        self.tick = world.tick
+        self.sim_time = world.sim_time
+        self.width = world.width
+        self.height = world.height
+        self.game_started = world.game_started
+        self.waiting_for_players = world.waiting_for_players
+        self.countdown_active = world.countdown_active
+        self.countdown_seconds_remaining = world.countdown_seconds_remaining
+        if world.game_started and hasattr(world, "start_time"):
+            self.elapsed_game_time = world.clock() - world.start_time
+        else:
+            self.elapsed_game_time = 0.0
+        self.scores = MappingProxyType(dict(world.score_sys.scores))
+
+        now = world.clock()
+        players = {}
+        for player_id, player in list(world.players.items()):
+            body = player.body
+            players[player_id] = PlayerSnapshot(
+                player_id, getattr(player, "agent_name", player_id[:6]),
+                tuple(body.position), tuple(body.velocity), body.angle, body.angular_velocity,
+                player.health, player.radius, player.color, player.ready,
+                player.is_spawn_protected(now),
+            )
+        self.players = MappingProxyType(players)
+        # Bullet engine bullets stay as arrays: (ids, positions, velocities, angles, colors).
+        self.bullets = world.bullet_engine.states() if world.bullet_engine is not None else None
+        self.bullet_radius = world.bullet_engine.radius if world.bullet_engine is not None else 0
+        self.static_layout = world.static_layout
+        # Pymunk projectiles as (projectile, generation, color); pooled projectiles are
+        # reused, so their spawn data is copied now. Body states are matched lazily.
+        self._projectiles = [(obj, obj.generation, obj.color) for obj in world.live_projectiles]
+        self._bodies = world.read_bodies() if self._projectiles else None
+        self._projectile_values = None
+        self._entities = None
+        # Scans are only computed during a match, on the first request of the tick.
+        self._scan_stage = world.scan_stage if world.game_started else None
+        self._scan_views = None
+        self._scan_lock = threading.Lock()
+        self._player_states = {}
+        self._game_states = {}
+
+    def projectile_states(self):
+        """
+        Returns the Pymunk projectiles of this tick with their body states.
+
+        Returns:
+            tuple: (projectiles, values): (projectile, generation, color) per projectile
+            and an (n, 5) array of x, y, angle, vx, vy in the same order.
+        """
+        if self._projectile_values is None:
+            if self._bodies is None:
+                self._projectile_values = np.empty((0, 5))
+            else:
+                ids, values = self._bodies
+                # Body IDs never change, so reading them from the live bodies is safe.
+                keys = np.fromiter((obj.body.id for obj, _, _ in self._projectiles),
+                                   dtype=ids.dtype, count=len(self._projectiles))
+                order = np.argsort(ids)
+                self._projectile_values = values[order[np.searchsorted(ids, keys, sorter=order)]]
+        return self._projectiles, self._projectile_values
+
+    @property
+    def entities(self):
+        """
+        Returns the obstacles and Pymunk projectiles of this tick (built on first access).
+
+        Returns:
+            tuple: EntitySnapshot records, obstacles first.
+        """
+        if self._entities is None:
+            projectiles, values = self.projectile_states()
+            self._entities = self.static_layout.entities + tuple(
+                # Pooled projectiles are reused, so the spawn generation is part of their identity.
+                EntitySnapshot((obj, generation), "projectile", (x, y), (vx, vy), obj.radius, color)
+                for (obj, generation, color), (x, y, _, vx, vy) in zip(projectiles, values.tolist())
+            )
+        return self._entities
+
+    def scan(self, player_id):
+        """
+        Returns the vectorized scan of a player for this tick.
+
+        The scans of all players are computed together by the first call of the tick.
+
+        Args:
+            player_id (str): The scanning player.
+
+        Returns:
+            dict or None: The scan result, or None if no vectorized scan is available.
+        """
+        if self._scan_stage is None:
+            return None
+        views = self._scan_views
+        if views is None:
+            with self._scan_lock:
+                if self._scan_views is None:
+                    self._scan_views = self._scan_stage.compute(self)
+                views = self._scan_views
+        return views.for_player(player_id)
+
+    def player_state(self, player_id):
+        """
+        Returns the state of a player in the format of GameWorld.player_state.
+
+        Args:
+            player_id (str): The identifier of the player.
+
+        Returns:
+            dict or None: The player's state, or None if the player is not in this snapshot.
+        """
+        state = self._player_states.get(player_id)
+        if state is None:
+            player = self.players.get(player_id)
+            if player is None:
+                return None
+            state = {
+                "velocity": list(player.velocity),
+                "angle": player.angle,
+                "health": player.health,
+                "angular_velocity": player.angular_velocity,
+            }
+            self._player_states[player_id] = state
+        return state
+
+    def game_state(self, player_id):
+        """
+        Returns the game state seen by a player in the format of GameWorld.game_state.
+
+        Args:
+            player_id (str): The identifier of the player.
+
+        Returns:
+            dict or None: The game state, or None if the player is not in this snapshot.
+        """
+        state = self._game_states.get(player_id)
+        if state is None:
+            player = self.players.get(player_id)
+            if player is None:
+                return None
+            state = {
+                "game_started": self.game_started,
+                "waiting_for_players": self.waiting_for_players,
+                "countdown_active": self.countdown_active,
+                "countdown_seconds_remaining": math.ceil(self.countdown_seconds_remaining) if self.countdown_active else 0,
+                "ready": player.ready,
+                "elapsed_game_time": round(self.elapsed_game_time, 1),
+            }
+            self._game_states[player_id] = state
+        return state
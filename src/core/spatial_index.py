@@ -0,0 +1,72 @@
+import math
+
+class UniformGrid:
+    """
+    A uniform grid of square cells for finding entities near a point.
+    
+    Each entity is stored in the cell containing its center. A query visits only
+    the cells that can hold entities within the requested reach, widened by the
+    largest entity radius in the grid, so its cost depends on the number of
+    nearby entities instead of all entities in the world.
+    
+    Dynamic entities are indexed by building a new grid (at most once per tick, on
+    its first query) and swapping it in as a whole. Readers in other threads
+    therefore always query a complete grid that is no longer modified.
+    """
+    def __init__(self, cell_size):
+        """
+        Initializes an empty grid.
+        
+        Args:
+            cell_size (float): Edge length of a cell in pixels.
+        """
+        self.cell_size = cell_size
+        self.cells = {}       # {(cell_x, cell_y): [entity, ...]}
+        self.max_radius = 0   # Largest radius of any inserted entity
+
+    def insert(self, entity, position, radius):
+        """
+        Adds an entity.
+        
+        Args:
+            entity: The entity to store.
+            position (Vec2d or tuple): Center of the entity.
+            radius (float): Radius of the entity.
+        """
+        key = (int(position[0] // self.cell_size), int(position[1] // self.cell_size))
+        cell = self.cells.get(key)
+        if cell is None:
+            self.cells[key] = [entity]
+        else:
+            cell.append(entity)
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def query(self, position, reach):
+        """
+        Returns candidate entities whose surface may lie within reach of a point.
+        
+        Callers still check the exact distance; the grid only removes entities that
+        are certainly too far away.
+        
+        Args:
+            position (Vec2d or tuple): Center of the query.
+            reach (float): Maximum distance between the point and an entity's surface.
+        
+        Returns:
+            list: Candidate entities.
+        """
+        reach += self.max_radius
+        size = self.cell_size
+        min_x = int(math.floor((position[0] - reach) / size))
+        max_x = int(math.floor((position[0] + reach) / size))
+        min_y = int(math.floor((position[1] - reach) / size))
+        max_y = int(math.floor((position[1] + reach) / size))
+        found = []
+        cells = self.cells
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                cell = cells.get((cell_x, cell_y))
+                if cell:
+                    found.extend(cell)
+        return found
@@ -0,0 +1,128 @@
+import math
+import random
+from .spatial_index import UniformGrid
+
+
+class SpawnPlanner:
+    """
+    Hands out collision-free spawn positions from precomputed candidate points.
+
+    The candidates are Poisson-disc samples (Bridson's algorithm) over the free
+    space of the static distance field: every candidate clears all obstacles and
+    borders, and any two candidates are at least `spacing` apart, so players placed
+    on different candidates never overlap each other. The samples are recomputed
+    only when the arena layout changes.
+    """
+    def __init__(self, distance_field, clearance, seed=None):
+        """
+        Initializes the planner. Call rebuild() once the distance field is built.
+
+        Args:
+            distance_field (StaticDistanceField): Static geometry of the arena.
+            clearance (float): Radius of the circle that must be free around a spawned player.
+            seed (int, optional): Seed for sampling and for choosing candidates.
+        """
+        self.distance_field = distance_field
+        self.clearance = clearance
+        self.spacing = 2 * clearance
+        self.rng = random.Random(seed)
+        self.candidates = []
+
+    def rebuild(self):
+        """
+        Samples the candidate points for the current distance field. Call when the layout changes.
+        """
+        field = self.distance_field
+        cell = self.spacing / math.sqrt(2)  # At most one sample per background cell
+        columns, rows = math.ceil(field.width / cell), math.ceil(field.height / cell)
+        grid = {}
+        samples = []
+        active = []
+
+        def fits(point):
+            if not field.is_free(point, self.clearance):
+                return False
+            cx, cy = int(point[0] / cell), int(point[1] / cell)
+            for x in range(max(cx - 2, 0), min(cx + 3, columns)):
+                for y in range(max(cy - 2, 0), min(cy + 3, rows)):
+                    other = grid.get((x, y))
+                    if other is not None and math.dist(point, other) < self.spacing:
+                        return False
+            return True
+
+        def add(point):
+            grid[(int(point[0] / cell), int(point[1] / cell))] = point
+            samples.append(point)
+            active.append(point)
+
+        # Seed points on a coarse lattice, so separated free regions all get samples.
+        step = self.spacing * 2
+        for x in range(int(field.width // step) + 1):
+            for y in range(int(field.height // step) + 1):
+                point = ((x + 0.5) * step, (y + 0.5) * step)
+                if fits(point):
+                    add(point)
+        while active:
+            index = self.rng.randrange(len(active))
+            origin = active[index]
+            for _ in range(30):
+                angle = self.rng.uniform(0, 2 * math.pi)
+                distance = self.rng.uniform(self.spacing, 2 * self.spacing)
+                point = (origin[0] + math.cos(angle) * distance, origin[1] + math.sin(angle) * distance)
+                if fits(point):
+                    add(point)
+                    break
+            else:
+                active[index] = active[-1]
+                active.pop()
+
+        self.rng.shuffle(samples)
+        self.candidates = samples
+
+    def is_free(self, position, occupied):
+        """
+        Checks whether a player can spawn at a point.
+
+        Args:
+            position (tuple or Vec2d): The point.
+            occupied (list): Positions of the players already in the arena.
+
+        Returns:
+            bool: True if the point clears the static geometry and all occupied positions.
+        """
+        if not self.distance_field.is_free(position, self.clearance):
+            return False
+        return all(math.dist(position, other) >= self.spacing for other in occupied)
+
+    def allocate(self, count, occupied=()):
+        """
+        Returns spawn positions for several players at once.
+
+        Candidates are visited in a shuffled order from a random start, skipping the
+        ones blocked by an occupied position. Each occupied position can only block
+        the few candidates around it, so the cost per player is constant.
+
+        Args:
+            count (int): Number of positions needed.
+            occupied (list): Positions of the players already in the arena.
+
+        Returns:
+            list: Up to `count` (x, y) tuples; fewer if the arena is full.
+        """
+        candidates = self.candidates
+        if not candidates or count <= 0:
+            return []
+        blocked = UniformGrid(self.spacing)
+        for position in occupied:
+            blocked.insert(tuple(position), position, 0)
+
+        positions = []
+        start = self.rng.randrange(len(candidates))
+        for offset in range(len(candidates)):
+            candidate = candidates[(start + offset) % len(candidates)]
+            if any(math.dist(candidate, other) < self.spacing for other in blocked.query(candidate, self.spacing)):
+                continue
+            positions.append(candidate)
+            if len(positions) == count:
+                break
+        return positions
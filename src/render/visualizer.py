@@ -0,0 +1,377 @@
+import math
+import time
+import pygame
+from ..settings import *
+
+
+class TriangleSprite(pygame.sprite.Sprite):
+    """
+    Visual representation of a player (Triangle).
+    
+    The base image is drawn once; position, rotation and transparency are read
+    from the player's snapshot record on every frame.
+    """
+    def __init__(self, player):
+        """
+        Initializes the sprite for a player.
+        
+        Args:
+            player (PlayerSnapshot): The player record to draw.
+        """
+        super().__init__()
+        self.entity = player
+        self._create_base_image()
+        self.image = self.original_image.copy()
+        self.rect = self.image.get_rect(center=(int(player.position[0]), int(player.position[1])))
+
+    def _create_base_image(self):
+        """
+        Creates the original (non-rotated) image for the triangle sprite.
+        
+        The image is created on a transparent surface taking into account rotation.
+        Also draws a small white circle at the tip as an indicator.
+        """
+        radius = self.entity.radius
+        size = int(radius * 2 * 1.5)  # Safety factor for rotations
+        self.original_image = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.original_image.fill((0, 0, 0, 0))  # Transparent background
+
+        # Calculate triangle points relative to the center of the surface.
+        center_x, center_y = size // 2, size // 2
+        points = [
+            (center_x + radius * math.cos(math.radians(deg)),
+             center_y - radius * math.sin(math.radians(deg)))
+            for deg in [0, 120, 240]
+        ]
+        pygame.draw.polygon(self.original_image, self.entity.color, points)
+
+        # Draw an indicator at the tip (at 0°)
+        tip_x = center_x + radius * math.cos(math.radians(0))
+        tip_y = center_y - radius * math.sin(math.radians(0))
+        indicator_color = (255, 255, 255)  # White indicator
+        indicator_radius = 3
+        pygame.draw.circle(self.original_image, indicator_color, (int(tip_x), int(tip_y)), indicator_radius)
+
+    def update(self, dt):
+        """
+        Updates the sprite's position, rotation, and visual effects from the player state.
+        
+        Args:
+            dt (float): Delta time since the last frame.
+        """
+        player = self.entity
+        pos = player.position
+        angle = math.degrees(player.angle)
+        rotated_image = pygame.transform.rotate(self.original_image, -angle)
+        self.rect = rotated_image.get_rect(center=(int(pos[0]), int(pos[1])))
+        self.image = rotated_image
+
+        # Change transparency if still under spawn protection
+        if not player.ready:
+            self.image.set_alpha(80)
+        elif player.spawn_protected:
+            # Make alpha pulsate between 64 and 192
+            alpha = 128 + 64 * math.sin(time.time() * 5)  # Pulsate with a frequency of 5 Hz
+            self.image.set_alpha(int(alpha))
+        else:
+            self.image.set_alpha(255)  # Fully opaque
+
+
+class CircleSprite(pygame.sprite.Sprite):
+    """
+    Visual representation of circular entities (obstacles and projectiles).
+    """
+    def __init__(self, entity):
+        """
+        Initializes the sprite for a circular entity.
+        
+        Args:
+            entity (EntitySnapshot): The record of the obstacle or projectile to draw.
+        """
+        super().__init__()
+        self.entity = entity
+        radius = entity.radius
+        self.image = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(self.image, entity.color, (radius, radius), radius)
+        self.rect = self.image.get_rect(center=(int(entity.position[0]), int(entity.position[1])))
+
+    def update(self, dt):
+        """
+        Moves the sprite to the entity's current position.
+        
+        Args:
+            dt (float): Delta time since the last frame.
+        """
+        pos = self.entity.position
+        self.rect.center = (int(pos[0]), int(pos[1]))
+
+
+def _sprite_for(sprites, key, record, sprite_class):
+    """
+    Returns the cached sprite for an entity, creating it on first use.
+    
+    Args:
+        sprites (dict): Cache mapping entity keys to sprites.
+        key: Identity of the entity (player ID or EntitySnapshot.key).
+        record (PlayerSnapshot or EntitySnapshot): State of the entity in the current snapshot.
+        sprite_class (type): TriangleSprite or CircleSprite.
+    
+    Returns:
+        pygame.sprite.Sprite: The sprite drawing this entity.
+    """
+    sprite = sprites.get(key)
+    if sprite is None:
+        sprite = sprite_class(record)
+        sprites[key] = sprite
+    else:
+        sprite.entity = record
+    return sprite
+
+
+def run_visualizer(game_world):
+    """
+    Runs the Pygame visualizer which is used for debugging and visualization.
+    
+    This function initializes Pygame, creates the window, processes events, updates 
+    all sprites, draws static elements (like obstacles), displays health bars, and updates the screen.
+    The loop runs until the window is closed.
+    
+    Args:
+        game_world (GameWorld): The world to draw. Only its latest snapshot is read.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Game Visualizer")
+    clock = pygame.time.Clock()
+    all_game_sprites = pygame.sprite.Group()
+    sprites = {}  # Maps game entities to their sprites, so surfaces are built once per entity
+    running = True
+    font = pygame.font.SysFont(None, 36) # Slightly larger font for countdown
+    score_font = pygame.font.SysFont(None, 24) # Smaller font for scores
+
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+        screen.fill((0, 0, 0)) # Always fill background black
+
+        snapshot = game_world.snapshot
+        if snapshot is None: # No tick simulated yet
+            clock.tick(FPS)
+            pygame.display.flip()
+            continue
+
+        all_game_sprites.empty()
+        visible_entities = set()
+
+        # Always add players to the sprite group
+        for player_id, player in snapshot.players.items():
+            if player.health > 0:
+                all_game_sprites.add(_sprite_for(sprites, player_id, player, TriangleSprite))
+                visible_entities.add(player_id)
+
+        # Add obstacles and other objects (projectiles, power-ups)
+        for obj in snapshot.entities:
+            all_game_sprites.add(_sprite_for(sprites, obj.key, obj, CircleSprite))
+            visible_entities.add(obj.key)
+
+        # Forget sprites of entities that left the world.
+        for entity in [e for e in sprites if e not in visible_entities]:
+            del sprites[entity]
+
+        dt_visual = clock.tick(FPS) / 1000.0
+        all_game_sprites.update(dt_visual) # Sprite updates (position, alpha, etc.)
+        all_game_sprites.draw(screen) # Draw all sprites
+
+        # Bullet engine bullets are drawn directly, without sprites.
+        if snapshot.bullets is not None:
+            _, positions, _, _, colors = snapshot.bullets
+            for (x, y), color in zip(positions.tolist(), colors):
+                pygame.draw.circle(screen, color, (int(x), int(y)), snapshot.bullet_radius)
+
+        # Display health bars
+        bar_width = 30; bar_height = 5; bar_offset_y = 5
+        health_color = (0, 255, 0); lost_health_color = (255, 0, 0); border_color = (255, 255, 255)
+        for player_id, player in snapshot.players.items():
+            if player.health > 0 and player_id in sprites:
+                player_rect = sprites[player_id].rect
+                bar_x = player_rect.centerx - bar_width // 2
+                bar_y = player_rect.bottom + bar_offset_y
+                health_percentage = max(0, player.health / PLAYER_START_HEALTH)
+                background_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+                pygame.draw.rect(screen, lost_health_color, background_rect)
+                current_bar_width = int(bar_width * health_percentage)
+                if current_bar_width > 0:
+                    health_rect = pygame.Rect(bar_x, bar_y, current_bar_width, bar_height)
+                    pygame.draw.rect(screen, health_color, health_rect)
+                pygame.draw.rect(screen, border_color, background_rect, 1)
+
+      
+        # Text display based on game state
+        display_text = ""
+        text_color = (255, 255, 0) # Default Yellow
+
+        if snapshot.waiting_for_players:
+            display_text = "Waiting for players..."
+        elif snapshot.game_started and snapshot.countdown_active: 
+            display_text = ""
+            text_color = (0, 0, 0)
+        elif snapshot.countdown_active:
+            display_text = f"Game starting in {math.ceil(snapshot.countdown_seconds_remaining)}..."
+            text_color = (0, 255, 255) # Cyan for countdown
+        
+        if display_text: # Only render and blit if there's text to display
+            text_surface = font.render(display_text, True, text_color)
+            text_rect = text_surface.get_rect(center=(snapshot.width // 2, 30))
+            screen.blit(text_surface, text_rect)
+
+
+        # --- SCORING DISPLAY ---
+        # Display scores in a semi-transparent box at the bottom
+
+        score_strings = []
+        for pid, player in snapshot.players.items():
+            color = player.color
+            agent_name = player.agent_name
+            score = snapshot.scores.get(pid, 0)
+            score_strings.append((f"{agent_name}: {score}", color))
+
+        # Layout: max 4 scores per row, then wrap
+        scores_per_row = 4
+        rows = [score_strings[i:i+scores_per_row] for i in range(0, len(score_strings), scores_per_row)]
+
+        padding_x = 30
+        padding_y = 12
+        spacing = 40
+        font_height = score_font.get_height()
+        row_heights = []
+        row_widths = []
+
+        # Prepare text surfaces and calculate width for each row
+        row_surfaces = []
+        for row in rows:
+            text_surfaces = []
+            total_width = -spacing
+            for score_str, color in row:
+                surf = score_font.render(score_str, True, color)
+                text_surfaces.append((surf, color))
+                total_width += surf.get_width() + spacing
+            row_surfaces.append(text_surfaces)
+            row_widths.append(total_width)
+            row_heights.append(font_height)
+
+        box_width = max(max(row_widths) + 2 * padding_x, 250) if row_widths else 250
+        box_height = len(rows) * (font_height + padding_y) + padding_y
+        box_x = (screen.get_width() - box_width) // 2
+        box_y = screen.get_height() - box_height - 18
+
+        # Draw semi-transparent background box with rounded corners
+        box_surface = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        box_surface.fill((0, 0, 0, 0))  # Fully transparent base
+
+        # Draw a glowing border (outer glow)
+        for glow in range(8, 0, -2):
+            pygame.draw.rect(
+                box_surface,
+                (255, 215, 0, 30),  # Gold, low alpha for glow
+                pygame.Rect(glow, glow, box_width - 2*glow, box_height - 2*glow),
+                border_radius=18
+            )
+
+        # Draw main box
+        pygame.draw.rect(
+            box_surface,
+            (40, 40, 60, 220),  # Slightly bluish dark, semi-transparent
+            box_surface.get_rect(),
+            border_radius=18
+        )
+
+        # Draw border
+        pygame.draw.rect(
+            box_surface,
+            (255, 215, 0),  # Gold border
+            box_surface.get_rect(),
+            width=4,
+            border_radius=18
+        )
+
+        # Blit score texts centered inside the box, row by row
+        y = padding_y
+        for text_surfaces in row_surfaces:
+            # Center this row horizontally in the box
+            row_width = sum(surf.get_width() for surf, _ in text_surfaces) + spacing * (len(text_surfaces)-1)
+            x = (box_width - row_width) // 2
+            for surf, color in text_surfaces:
+                box_surface.blit(surf, (x, y))
+                x += surf.get_width() + spacing
+            y += font_height + padding_y
+
+        # Blit the box onto the main screen
+        screen.blit(box_surface, (box_x, box_y))
+
+        # # --- Scoring display above the players ---
+        # # Uncomment if you want to show scores above player avatars
+        # for player in game_world.players.values():
+        #     # score_sys ist in GameWorld angelegt
+        #     score = game_world.score_sys.get_score(player.player_id)
+        #     score_text = score_font.render(f"Score: {score}", True, (255, 255, 255))
+        #     # Position: über dem Spieler-Avatar, z.B. 20 px darüber
+        #     score_rect = score_text.get_rect(center=(player.rect.centerx, player.rect.top - 10))
+        #     screen.blit(score_text, score_rect)
+
+        # --- Game timer display with shrinking bar at the top ---
+
+        if snapshot.game_started:
+            elapsed = snapshot.elapsed_game_time
+            remaining = max(0, int(MAX_GAME_DURATION - elapsed))
+            minutes = remaining // 60
+            seconds = remaining % 60
+            timer_text = f"Time left: {minutes:02d}:{seconds:02d}"
+
+            # Timer bar dimensions (thinner bar, smaller font)
+            bar_margin_x = 60
+            bar_margin_y = 10
+            bar_height = 12  # thinner bar
+            bar_width_full = snapshot.width - 2 * bar_margin_x
+            bar_x = bar_margin_x
+            bar_y = bar_margin_y
+
+            # Calculate bar fill (shrinks as time passes)
+            percent_left = max(0, min(1.0, remaining / MAX_GAME_DURATION))
+            bar_width_current = int(bar_width_full * percent_left)
+
+            # Draw background bar (empty)
+            pygame.draw.rect(
+                screen,
+                (60, 60, 60, 180),  # dark gray
+                (bar_x, bar_y, bar_width_full, bar_height),
+                border_radius=8
+            )
+            # Draw filled bar (remaining time)
+            pygame.draw.rect(
+                screen,
+                (0, 200, 0),  # green
+                (bar_x, bar_y, bar_width_current, bar_height),
+                border_radius=8
+            )
+            # Draw border
+            pygame.draw.rect(
+                screen,
+                (255, 215, 0),  # gold
+                (bar_x, bar_y, bar_width_full, bar_height),
+                width=2,
+                border_radius=8
+            )
+
+            # Draw timer text centered in the bar (smaller font)
+            timer_font = pygame.font.SysFont(None, 20)
+            timer_surface = timer_font.render(timer_text, True, (255, 255, 255))
+            timer_rect = timer_surface.get_rect(center=(snapshot.width // 2, bar_y + bar_height // 2))
+            screen.blit(timer_surface, timer_rect)
+
+
+
+        pygame.display.flip()
+
+    pygame.quit()
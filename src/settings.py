@@ -2,29 +2,57 @@
 API_HOST = "127.0.0.1"              # Host address for the FastAPI server
 API_PORT = 8000                     # Port number for the FastAPI server
 API_URL = f"http://{API_HOST}:{API_PORT}"  # Base URL for API requests (used by agents)
+MAX_ARENAS = 64                     # Maximum number of arenas (independent matches) hosted by one server process
+SHARD_WORKERS = 0                   # Worker processes started by src/api/sharding.py (0 = one per CPU core)
+SHARD_BASE_PORT = 8100              # Worker i listens on SHARD_BASE_PORT + i (the front-end uses API_PORT)
+WS_PUSH_RATE = 10                   # Observations per second pushed on /ws/player/{player_id} (clients may ask for up to FPS)
+MAX_BATCH_ACTIONS = 20              # Max actions (counting repeats) per POST /player/{player_id}/actions
+# Per-player rate limits: endpoint class -> (requests per second, burst). A burst of 1
+# allows one request per 1/rate seconds, i.e. a cooldown of 0.5 s for scans and 0.1 s for shots.
+RATE_LIMITS = {
+    "scan_environment": (2.0, 1),   # GET /player/{player_id}/scan
+    "state": (2.0, 1),              # GET /player/{player_id}/state
+    "game_state": (2.0, 1),         # GET /player/{player_id}/game-state
+    "shoot": (10.0, 1),             # Shots via /shoot, /actions and the WebSocket
+}
+LONG_POLL_MAX_TIMEOUT = 5.0         # Longest wait (seconds) for GET /tick/wait (below the sharding proxy timeout)
 
 # --- Visualizer / Screen Configuration ---
 SCREEN_WIDTH = 800                # Width of the Pygame window in pixels
 SCREEN_HEIGHT = 600               # Height of the Pygame window in pixels
 FPS = 60                          # Target frames per second for the visualizer and physics updates
+HEADLESS = False                  # If True, main.py runs only the API server (no Pygame window, pygame not imported)
 
 # --- Physics Engine Configuration ---
 PHYSICS_DT = 1 / FPS              # Time step for each physics simulation update (delta time)
+SIMULATION_SEED = None            # If set (int), the default arena runs deterministically (seeded RNG, tick clock, input log)
+INPUT_LOG_PATH = "game_stats/inputs_latest.jsonl"  # Where a deterministic world writes its input log after every match
+MAX_CATCHUP_STEPS = 5             # Max physics updates run back-to-back to catch up after a late tick
+TICK_STATS_WINDOW = 600           # Number of recent ticks kept for duration/lateness statistics (10 s at 60 Hz)
+COMMAND_TIMEOUT = 5.0             # Seconds an API request waits for the physics thread to run its command
 
 # --- Player Movement Parameters ---
 PLAYER_THRUST = 5                 # Force applied when the player accelerates forward
 PLAYER_ROTATION = 0.08            # Angular velocity applied when the player rotates (in radians per update)
 PLAYER_MAX_SPEED = 100            # Maximum linear velocity the player can reach
+MAX_THRUST_STEPS_PER_TICK = 3     # Max net thrust commands (forward minus backward) applied to a player per physics tick
+MAX_ROTATION_STEPS_PER_TICK = 3   # Max net rotation commands (right minus left) applied to a player per physics tick
 
 # --- Player Attributes ---
 PLAYER_START_HEALTH = 5           # Initial health points for each player
 SCANNING_RADIUS = 150             # Radius within which a player can detect other objects (in pixels)
+VECTORIZED_SCAN = True            # If True, the first scan of a tick computes all scans with NumPy (src/core/scan_stage.py)
+SPATIAL_CELL_SIZE = 64            # Cell size (in pixels) of the spatial grids used to find nearby objects for scans
+DISTANCE_FIELD_CELL_SIZE = 4      # Cell size (in pixels) of the precomputed distance field of obstacles and borders
 
 # --- Projectile Configuration ---
 PROJECTILE_SPEED = 200            # Initial speed of a fired projectile
 PROJECTILE_RADIUS = 4             # Radius of the projectile's physics shape and visual representation
 PROJECTILE_LIFETIME_SECONDS = 3.0 # Duration in seconds before a projectile is automatically removed
 PROJECTILE_DAMAGE = 1             # Amount of health points deducted when a projectile hits a player
+PROJECTILE_POOL_SIZE = 256        # Projectiles preallocated per arena and recycled after expiry or hits
+BULLET_ENGINE = False             # If True, projectiles are NumPy arrays (src/core/bullet_engine.py) instead of Pymunk bodies
+BULLET_ENGINE_CAPACITY = 4096     # Initial size of the bullet engine's arrays (they grow when full)
 ALLOW_FRIENDLY_FIRE = False       # If True, projectiles can damage the player who fired them
 
 # --- Obstacle Configuration ---
@@ -42,6 +70,23 @@ SCORE_CONFIG = {
     "life_penalty": 1            # Points deducted for each remaining life point at game end
 }
 
+# --- Match Recording Configuration ---
+RECORD_MATCHES = False           # If True, every match is recorded as a binary file (see src/core/recording.py)
+RECORDING_DIR = "recordings"     # Directory for match recordings
+RECORDING_CHUNK_TICKS = 256      # Ticks per chunk in a recording file
+RECORDING_QUEUE_TICKS = 600      # Captured ticks that may wait for the writer thread before ticks are dropped
+
+# --- Event Log Configuration ---
+EVENT_LOG_LEVELS = {             # Minimum level per event category ("debug", "info", "warning" or "off")
+    "default": "info",           # Categories not listed below
+    "collision": "info",         # Player/obstacle and projectile/obstacle collisions (bounces are "debug")
+    "combat": "info",            # Projectile hits and damage taken
+    "shot": "info",              # Shots fired (each shot is "debug") and rejected shots
+}
+EVENT_LOG_BUFFER_SIZE = 10000    # Events buffered for the writer thread; the oldest are dropped when it is full
+EVENT_LOG_PATH = None            # File the event log is appended to (None = stdout)
+EVENT_LOG_FLUSH_INTERVAL = 0.1   # Seconds between two writes of the event log
+
 # --- Game State Configuration ---
 MAX_GAME_DURATION = 30           # Maximum duration of the game in seconds
 PLOT_OUTPUT = False              # If True, game statistics plots are saved upon game end
@@ -0,0 +1,27 @@
+from src.core.clock import SimulationClock
+from src.core.game_world import GameWorld
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT, MAX_THRUST_STEPS_PER_TICK
+
+
+def started_world():
+    clock = SimulationClock()
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, clock=clock, write_stats=False, seed=5)
+    player_id = world.add_player(agent_name="batch")
+    world.player_ready(player_id)
+    while not world.game_started:
+        clock.advance(PHYSICS_DT)
+        world.update(PHYSICS_DT)
+    return world, player_id
+
+
+def test_movement_beyond_the_tick_cap_is_not_reported_as_applied():
+    world, player_id = started_world()
+    world.positive_player_thrust(player_id)  # Already pending for this tick
+    applied = world.apply_actions(player_id, [
+        ("thrust_forward", 5),
+        ("thrust_backward", 2),
+        ("rotate_left", 4),
+        ("thrust_forward", 3),
+    ])
+    assert applied == [MAX_THRUST_STEPS_PER_TICK - 1, 2, 3, 2]
+    assert world.input_buffer.collect() == {player_id: (3, -3)}
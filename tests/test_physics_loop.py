@@ -0,0 +1,20 @@
+import time
+
+import pytest
+
+from src.core.game_world import GameWorld
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT
+
+
+def test_commands_fail_after_the_physics_loop_crashes():
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, write_stats=False, seed=3)
+    world._advance = lambda dt: 1 / 0
+    world.start_physics_engine()
+    deadline = time.monotonic() + 2.0
+    while world.is_running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not world.is_running
+    assert isinstance(world.physics_error, ZeroDivisionError)
+    with pytest.raises(RuntimeError):
+        world.submit(world.add_player, None, "late").result(timeout=1.0)
@@ -0,0 +1,32 @@
+from src.core.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_refund_returns_unused_tokens():
+    clock = FakeClock()
+    limiter = RateLimiter({"shoot": (10.0, 2)}, clock=clock)
+    assert limiter.acquire("p", "shoot") == 0.0
+    assert limiter.acquire("p", "shoot") == 0.0
+    assert limiter.acquire("p", "shoot") > 0
+    limiter.refund("p", "shoot", 1)
+    assert limiter.stats()["allowed"] == {"shoot": 1}
+    assert limiter.acquire("p", "shoot") == 0.0
+    assert limiter.acquire("p", "shoot") > 0
+
+
+def test_refund_does_not_exceed_burst():
+    clock = FakeClock()
+    limiter = RateLimiter({"shoot": (10.0, 2)}, clock=clock)
+    assert limiter.acquire("p", "shoot") == 0.0
+    clock.now = 1.0
+    limiter.refund("p", "shoot", 1)
+    assert limiter.acquire("p", "shoot") == 0.0
+    assert limiter.acquire("p", "shoot") == 0.0
+    assert limiter.acquire("p", "shoot") > 0
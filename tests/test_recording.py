@@ -0,0 +1,65 @@
+from src.core.bullet_engine import BulletEngine
+from src.core.clock import SimulationClock
+from src.core.game_world import GameWorld
+from src.core.recording import RecordingReader, KIND_PROJECTILE
+from src.settings import SCREEN_WIDTH, SCREEN_HEIGHT, PHYSICS_DT
+
+
+def record_match_with_shots(path, ticks=300, shot_every=20, bullet_engine=False):
+    """
+    Starts a seeded match, records it while both players keep shooting and returns the
+    number of recorded ticks.
+    """
+    clock = SimulationClock()
+    world = GameWorld(SCREEN_WIDTH, SCREEN_HEIGHT, clock=clock, write_stats=False, seed=7)
+    if bullet_engine:
+        world.bullet_engine = BulletEngine(world.width, world.height)
+        world.bullet_engine.set_obstacles(world.obstacles())
+    player_ids = world.add_players(["a", "b"])
+    for player_id in player_ids:
+        world.player_ready(player_id)
+    while not world.game_started:
+        clock.advance(PHYSICS_DT)
+        world.update(PHYSICS_DT)
+    for player in world.players.values():
+        player.spawn_protection_until = -1
+
+    world.start_recording(path)
+    for tick in range(ticks):
+        if tick % shot_every == 0:
+            for player_id in player_ids:
+                world.shoot(player_id)
+        clock.advance(PHYSICS_DT)
+        world.update(PHYSICS_DT)
+    recorder = world.recorder
+    world.recorder = None
+    recorder.close()
+    return ticks
+
+
+def recorded_projectile_ids(path, ticks):
+    """
+    Checks that every tick was written and returns the IDs of all recorded projectiles.
+    """
+    reader = RecordingReader(path)
+    try:
+        assert len(reader) == ticks
+        projectile_ids = set()
+        for tick in range(reader.start_tick, reader.start_tick + len(reader)):
+            projectile_ids.update(record[0] for record in reader.read_tick(tick) if record[1] == KIND_PROJECTILE)
+        return projectile_ids
+    finally:
+        reader.close()
+
+
+def test_recording_with_pooled_projectiles(tmp_path):
+    path = str(tmp_path / "match.upcrec")
+    ticks = record_match_with_shots(path)
+    # 15 volleys of 2 shots: reused pool projectiles get a new ID per shot.
+    assert len(recorded_projectile_ids(path, ticks)) == 30
+
+
+def test_recording_with_bullet_engine(tmp_path):
+    path = str(tmp_path / "match.upcrec")
+    ticks = record_match_with_shots(path, bullet_engine=True)
+    assert len(recorded_projectile_ids(path, ticks)) == 30
@@ -0,0 +1,29 @@
+import asyncio
+
+from src.api.tick_notifier import TickNotifier
+
+
+class FakeWorld:
+    def __init__(self):
+        self.tick = 0
+        self.snapshot = None
+        self.tick_listeners = []
+
+
+def test_timed_out_waiters_do_not_accumulate():
+    async def run():
+        world = FakeWorld()
+        notifier = TickNotifier(world, asyncio.get_running_loop())
+        for _ in range(100):
+            assert await notifier.wait_past(1000, 0.001) is None
+        assert len(notifier._waiters) <= 1
+
+        waiter = asyncio.ensure_future(notifier.wait_past(0, 1.0))
+        await asyncio.sleep(0)
+        world.tick = 1
+        for listener in world.tick_listeners:
+            listener(world.tick)
+        assert await waiter == 1
+        assert notifier._waiters == []
+
+    asyncio.run(run())